@@ -0,0 +1,242 @@
+"""
+Bulk backfill of a league's history into the local store.
+
+Enumerates the archives of a league, then scrapes results, standings and per-match statistics in parallel across
+several browsers. Progress is checkpointed after every task, so an interrupted run resumes where it stopped.
+
+Usage:
+    python -m app.backfill --league "Italy-Serie A" --seasons all --workers 4
+"""
+import argparse
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Optional
+import orjson
+from app.services.models.league_schemas import Archive
+from app.services.scraper.archive_scraper import ArchiveScraper, CONFIG_SCORE
+from app.services.scraper.leagues_scraper import LeagueScraper
+from app.services.scraper.match_scraper import MatchScraper, is_final
+from app.services.store import LocalStore, RESULTS, STANDINGS, safe_filename, write_atomic
+from config import DATA_DIR
+from logger.logger_config import configure_logging
+
+TASK_RESULTS = "results"
+TASK_STANDINGS = "standings"
+TASK_MATCH = "match"
+
+
+class Checkpoint:
+    """
+    Set of completed backfill tasks, persisted as JSON after every change.
+    """
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.lock = threading.Lock()
+        self.done = set()
+        self.failed = {}
+        if os.path.exists(path):
+            with open(path, "rb") as file:
+                payload = orjson.loads(file.read())
+            self.done = set(payload.get("done", []))
+            self.failed = payload.get("failed", {})
+
+    def is_done(self, key: str) -> bool:
+        return key in self.done
+
+    def mark_done(self, key: str) -> None:
+        with self.lock:
+            self.done.add(key)
+            self.failed.pop(key, None)
+            self._save()
+
+    def mark_failed(self, key: str, error: str) -> None:
+        with self.lock:
+            self.failed[key] = error
+            self._save()
+
+    def _save(self) -> None:
+        write_atomic(self.path, orjson.dumps({"done": sorted(self.done), "failed": self.failed}))
+
+
+class Backfill:
+    """
+    Scrapes the selected archives of a league into a `LocalStore`, one browser per worker thread.
+    """
+    def __init__(self, league_id: str, store: LocalStore, checkpoint: Checkpoint, workers: int = 2,
+                 with_stats: bool = True, progress: Optional[Callable[[int, int], None]] = None) -> None:
+        self.league_id = league_id
+        self.store = store
+        self.checkpoint = checkpoint
+        self.workers = workers
+        self.with_stats = with_stats
+        # Called with the number of tasks finished and submitted so far, after each task
+        self.progress = progress
+        self.local = threading.local()
+        self.scrapers = []
+        self.scrapers_lock = threading.Lock()
+
+    def _scraper(self, name: str, factory):
+        # Every worker thread owns its browsers, which are reused across all its tasks
+        scraper = getattr(self.local, name, None)
+        if scraper is None:
+            scraper = factory()
+            setattr(self.local, name, scraper)
+            with self.scrapers_lock:
+                self.scrapers.append(scraper)
+        return scraper
+
+    def enumerate_archives(self, seasons: Optional[list[str]]) -> list[Archive]:
+        """
+        Lists the archives of the league, keeping only the requested seasons.
+
+        Args:
+            seasons (Optional[list[str]]): The seasons to keep (e.g., ['2022_2023']), or None for all of them.
+
+        Returns:
+            list[Archive]: The archives to backfill.
+        """
+        league_scraper = LeagueScraper()
+        try:
+            archives = league_scraper.scrape_league_archives(self.league_id)
+        finally:
+            league_scraper.close()
+
+        if seasons is not None:
+            archives = [archive for archive in archives if archive.season in seasons]
+        logging.info(f"Backfilling {len(archives)} archives of league {self.league_id}")
+        return archives
+
+    def scrape_archive(self, league_archive: Archive) -> list[str]:
+        """
+        Scrapes and stores the results and standings of an archive.
+
+        Args:
+            league_archive (Archive): The archive as listed on the league page.
+
+        Returns:
+            list[str]: The IDs of the archive's matches.
+        """
+        results_key = f"{TASK_RESULTS}:{league_archive.id}"
+        standings_key = f"{TASK_STANDINGS}:{league_archive.id}"
+        if self.checkpoint.is_done(results_key) and self.checkpoint.is_done(standings_key):
+            # Nothing left to scrape: the stored results list the matches, without loading the archive page
+            return self._stored_match_ids(league_archive.id)
+
+        archive_scraper = self._scraper("archive_scraper", ArchiveScraper)
+        archive = archive_scraper.read_archive(self.league_id, league_archive.season, league_archive.url)
+
+        if self.checkpoint.is_done(results_key):
+            matches = None
+        else:
+            matches, _ = archive_scraper.scrape_matches(archive.results, archive, 0, 0, {CONFIG_SCORE: True})
+            self.store.save_archive_section(archive.id, RESULTS, matches)
+            self.checkpoint.mark_done(results_key)
+            logging.info(f"Stored {len(matches)} results of archive {archive.id}")
+
+        if not self.checkpoint.is_done(standings_key):
+            if archive.standings:
+                standings = archive_scraper.scrape_standings(archive)
+                self.store.save_archive_section(archive.id, STANDINGS, standings)
+                logging.info(f"Stored standings of archive {archive.id}")
+            # An archive without standings has none to scrape on later runs either
+            self.checkpoint.mark_done(standings_key)
+
+        if matches is None:
+            return self._stored_match_ids(archive.id)
+        return [match.id for match in matches if getattr(match, "id", None)]
+
+    def _stored_match_ids(self, archive_id: str) -> list[str]:
+        loaded = self.store.load_archive_section(archive_id, RESULTS)
+        return [match.id for match in loaded[0] if match.id] if loaded else []
+
+    def scrape_match(self, match_id: str) -> None:
+        """
+        Scrapes and stores the details of a match.
+
+        Args:
+            match_id (str): The unique identifier of the match.
+        """
+        match_scraper = self._scraper("match_scraper", MatchScraper)
+        match = match_scraper.scrape_match(match_id)
+        if not is_final(match):
+            # Only final details are immutable; the match is retried on the next run
+            logging.info(f"Match {match_id} is not final yet ({match.status or 'no status'}), not stored")
+            return
+        self.store.save_match(match)
+        self.checkpoint.mark_done(f"{TASK_MATCH}:{match_id}")
+
+    def run(self, archives: list[Archive]) -> None:
+        """
+        Runs the backfill: archives first, then the matches they list, as soon as each archive is done.
+
+        Args:
+            archives (list[Archive]): The archives to backfill.
+        """
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            pending = {}
+            for archive in archives:
+                pending[executor.submit(self.scrape_archive, archive)] = f"archive:{archive.id}"
+            submitted, finished_count = len(pending), 0
+
+            while pending:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    key = pending.pop(future)
+                    finished_count += 1
+                    try:
+                        result = future.result()
+                    except Exception as ex:
+                        logging.error(f"Backfill task {key} failed: {ex}")
+                        self.checkpoint.mark_failed(key, str(ex))
+                        result = None
+
+                    if result is not None and key.startswith("archive:") and self.with_stats:
+                        for match_id in result:
+                            match_key = f"{TASK_MATCH}:{match_id}"
+                            if not self.checkpoint.is_done(match_key) and not self.store.has_match(match_id):
+                                pending[executor.submit(self.scrape_match, match_id)] = match_key
+                                submitted += 1
+                    if self.progress is not None:
+                        self.progress(finished_count, submitted)
+
+        for scraper in self.scrapers:
+            try:
+                scraper.close()
+            except Exception as ex:
+                logging.debug(f"Unable to close browser: {ex}")
+
+        logging.info(f"Backfill finished: {len(self.checkpoint.done)} tasks done, "
+                     f"{len(self.checkpoint.failed)} failed")
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--league", required=True, help="League ID, as used by /leagues/{leagueId}")
+    parser.add_argument("--seasons", default="all",
+                        help="'all' or a comma-separated list of seasons (e.g. 2022_2023,2023_2024)")
+    parser.add_argument("--workers", type=int, default=2, help="Number of browsers scraping in parallel")
+    parser.add_argument("--data-dir", default=DATA_DIR, help="Root directory of the local store")
+    parser.add_argument("--no-stats", action="store_true", help="Skip per-match statistics")
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint of a previous run")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = parse_args(argv)
+    configure_logging()
+
+    store = LocalStore(args.data_dir)
+    checkpoint_path = os.path.join(args.data_dir, "backfill", f"{safe_filename(args.league)}.json")
+    if args.restart and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    checkpoint = Checkpoint(checkpoint_path)
+
+    seasons = None if args.seasons == "all" else [season.strip().replace("/", "_") for season in args.seasons.split(",")]
+    backfill = Backfill(args.league, store, checkpoint, workers=args.workers, with_stats=not args.no_stats)
+    backfill.run(backfill.enumerate_archives(seasons))
+
+
+if __name__ == "__main__":
+    main()
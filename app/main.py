@@ -6,9 +6,19 @@ from slowapi.util import get_remote_address
 from slowapi.middleware import SlowAPIMiddleware
 from slowapi.errors import RateLimitExceeded
 from starlette.responses import RedirectResponse
-from app.routers import country, league, archive, match
+from app.middleware.admission import AdmissionMiddleware
+from app.middleware.cluster import ClusterMiddleware
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.correlation import CorrelationIdMiddleware
+from app.middleware.deadline import DeadlineMiddleware
+from app.middleware.negotiation import ContentNegotiationMiddleware, NegotiatedResponse
+from app.middleware.session import NavigationSessionMiddleware
+from app.services.cluster import HashRing, parse_nodes
+from app.routers import country, league, archive, match, live, fixture, team, job, metrics
 from logger.logger_config import configure_logging
 import os
+from config import COMPRESSION_MINIMUM_SIZE, COMPRESSION_GZIP_LEVEL, COMPRESSION_BROTLI_QUALITY, CLUSTER_NODES, \
+    CLUSTER_SELF, CLUSTER_MODE
 
 load_dotenv()
 
@@ -23,10 +33,24 @@ limiter = Limiter(
     enabled=RATE_LIMITING_ENABLE,
 )
 
-app = FastAPI(title="Football LiveScore Scraper API")
+app = FastAPI(title="Football LiveScore Scraper API", default_response_class=NegotiatedResponse)
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+app.add_middleware(AdmissionMiddleware)
+app.add_middleware(NavigationSessionMiddleware)
+app.add_middleware(DeadlineMiddleware)
 app.add_middleware(SlowAPIMiddleware)
+app.add_middleware(ContentNegotiationMiddleware)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=COMPRESSION_MINIMUM_SIZE,
+    gzip_level=COMPRESSION_GZIP_LEVEL,
+    brotli_quality=COMPRESSION_BROTLI_QUALITY,
+)
+if CLUSTER_NODES:
+    app.add_middleware(ClusterMiddleware, ring=HashRing(parse_nodes(CLUSTER_NODES)), self_node=CLUSTER_SELF,
+                       mode=CLUSTER_MODE)
+app.add_middleware(CorrelationIdMiddleware)
 
 @app.get("/", include_in_schema=False)
 def root():
@@ -37,6 +61,11 @@ app.include_router(country.router, prefix=f"/{country.ROUTER_NAME}", tags=["coun
 app.include_router(league.router, prefix=f"/{league.ROUTER_NAME}", tags=["leagues"])
 app.include_router(archive.router, prefix=f"/{archive.ROUTER_NAME}", tags=["archives"])
 app.include_router(match.router, prefix=f"/{match.ROUTER_NAME}", tags=["matches"])
+app.include_router(live.router, prefix=f"/{live.ROUTER_NAME}", tags=["live"])
+app.include_router(fixture.router, prefix=f"/{fixture.ROUTER_NAME}", tags=["fixtures"])
+app.include_router(team.router, prefix=f"/{team.ROUTER_NAME}", tags=["teams"])
+app.include_router(job.router, prefix=f"/{job.ROUTER_NAME}", tags=["jobs"])
+app.include_router(metrics.router, prefix=f"/{metrics.ROUTER_NAME}", tags=["metrics"])
 
 if __name__ == "__main__":
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
@@ -0,0 +1,26 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+from app.services.admission import current_tickets, release_all
+
+
+class AdmissionMiddleware:
+    """
+    Keeps the admission slots taken by a request until its response is fully sent.
+
+    Streamed exports keep scraping while their body is sent, long after the route has returned, so their browser
+    sessions must still count against admission until the last byte.
+    """
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        tickets = []
+        token = current_tickets.set(tickets)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_tickets.reset(token)
+            release_all(tickets)
@@ -0,0 +1,183 @@
+import logging
+import re
+from typing import Optional
+import httpx
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.services.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.services.cluster import HashRing
+from app.services.metrics import metrics
+from logger.logger_config import request_id
+
+MODE_FORWARD = "forward"
+MODE_REDIRECT = "redirect"
+OWNER_HEADER = "X-Cluster-Owner"
+FORWARDED_HEADER = "X-Cluster-Forwarded"
+REQUEST_ID_HEADER = "X-Request-ID"
+# Routes whose caches and browser state are keyed by an archive, league or match ID (match batches and archive
+# bundles span shards)
+SHARDED_PATH = re.compile(r"^/(?:archives/(?!bundle\.[^/]+/?$)|leagues/|matches/(?!batch/?$))([^/]+)")
+# Headers that only apply to a single connection and are not passed on
+HOP_BY_HOP_HEADERS = {"connection", "keep-alive", "transfer-encoding", "te", "trailer", "upgrade", "host",
+                      "proxy-authorization", "proxy-authenticate"}
+CONNECT_TIMEOUT = 5.0
+
+
+def entity_key(path: str) -> Optional[str]:
+    """
+    Extracts the entity ID a request is sharded by: the path segment right after the collection, so every route of
+    an archive (e.g., '/archives/{id}/results.csv') goes to the same node.
+
+    Args:
+        path (str): The decoded path of the request.
+
+    Returns:
+        Optional[str]: The ID, or None for routes served by every node (countries, live, jobs, metrics...).
+    """
+    match = SHARDED_PATH.match(path)
+    return match.group(1) if match else None
+
+
+class ClusterMiddleware:
+    """
+    Routes requests on archives, leagues and matches to the node owning their ID on a consistent-hash ring, so each
+    node's stores, memos and warm browser sessions cover a distinct shard of the entities.
+
+    In 'forward' mode, a request received by another node is proxied to the owner and its response streamed back. An
+    owner that cannot be reached counts against a circuit breaker of its own, and the request goes to the next node
+    of the ring, possibly this one. In 'redirect' mode, the client is sent to the owner with a 307 instead. Responses
+    carry the owner in the `X-Cluster-Owner` header, so smart clients can call it directly.
+    """
+    def __init__(self, app: ASGIApp, ring: HashRing, self_node: str, mode: str = MODE_FORWARD) -> None:
+        self.app = app
+        self.ring = ring
+        self.self_node = self_node.rstrip("/")
+        self.mode = mode
+        self.breakers = {}
+        self.client = None
+
+    def breaker(self, node: str) -> CircuitBreaker:
+        breaker = self.breakers.get(node)
+        if breaker is None:
+            breaker = self.breakers[node] = CircuitBreaker(f"cluster:{node}")
+        return breaker
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        key = entity_key(scope["path"]) if scope["type"] == "http" else None
+        # Forwarded requests are always served locally, even if this node's view of the ring differs
+        if key is None or Headers(scope=scope).get(FORWARDED_HEADER):
+            await self.app(scope, receive, send)
+            return
+
+        owner = self.ring.owner(key)
+        if self.mode == MODE_REDIRECT:
+            if owner is None or owner == self.self_node:
+                await self.app(scope, receive, self.with_owner(send, self.self_node))
+                return
+            metrics.increment("cluster.redirected")
+            await Response(status_code=307, headers={"Location": self.url(owner, scope), OWNER_HEADER: owner})(
+                scope, receive, send)
+            return
+
+        body = await read_body(receive)
+        for node in self.ring.owners(key):
+            if node == self.self_node:
+                break
+            breaker = self.breaker(node)
+            try:
+                breaker.before_call()
+            except CircuitOpenError:
+                continue
+            try:
+                response = await self.forward(node, scope, body)
+            except httpx.TransportError as ex:
+                breaker.record_failure()
+                metrics.increment("cluster.forward_failures")
+                logging.warning(f"Unable to forward {scope['path']} to {node}: {ex}")
+                continue
+            breaker.record_success()
+            metrics.increment("cluster.forwarded")
+            await self.relay(node, response, send)
+            return
+
+        if owner != self.self_node:
+            metrics.increment("cluster.served_for_others")
+        await self.app(scope, replay_body(body, receive), self.with_owner(send, self.self_node))
+
+    def with_owner(self, send: Send, owner: str) -> Send:
+        async def send_with_owner(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(raw=message["headers"])[OWNER_HEADER] = owner
+            await send(message)
+        return send_with_owner
+
+    def url(self, node: str, scope: Scope) -> str:
+        query = scope.get("query_string", b"").decode("latin-1")
+        return f"{node}{scope.get('raw_path', scope['path'].encode()).decode('latin-1')}{'?' + query if query else ''}"
+
+    async def forward(self, node: str, scope: Scope, body: bytes) -> httpx.Response:
+        """
+        Sends a request to its owner.
+
+        Args:
+            node (str): The base URL of the owner.
+            scope (Scope): The ASGI scope of the request.
+            body (bytes): The body of the request.
+
+        Returns:
+            httpx.Response: The response, whose body is still to be read.
+
+        Raises:
+            httpx.TransportError: If the owner cannot be reached.
+        """
+        if self.client is None:
+            self.client = httpx.AsyncClient(timeout=httpx.Timeout(None, connect=CONNECT_TIMEOUT))
+        headers = [(name, value) for name, value in Headers(scope=scope).items() if name not in HOP_BY_HOP_HEADERS]
+        headers.append((FORWARDED_HEADER, self.self_node))
+        if request_id.get():
+            headers = [(name, value) for name, value in headers if name != REQUEST_ID_HEADER.lower()]
+            headers.append((REQUEST_ID_HEADER, request_id.get()))
+
+        request = self.client.build_request(scope["method"], self.url(node, scope), headers=headers, content=body)
+        return await self.client.send(request, stream=True)
+
+    async def relay(self, node: str, response: httpx.Response, send: Send) -> None:
+        # The body is streamed back as received, still compressed if the owner compressed it
+        try:
+            response_headers = [(name.encode("latin-1"), value.encode("latin-1"))
+                                for name, value in response.headers.multi_items()
+                                if name.lower() not in HOP_BY_HOP_HEADERS]
+            response_headers.append((OWNER_HEADER.encode("latin-1"), node.encode("latin-1")))
+            await send({"type": "http.response.start", "status": response.status_code, "headers": response_headers})
+            async for chunk in response.aiter_raw():
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        finally:
+            await response.aclose()
+
+
+async def read_body(receive: Receive) -> bytes:
+    # The body is buffered, so the request can still be served locally if the owner is unreachable
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+def replay_body(body: bytes, receive: Receive) -> Receive:
+    sent = False
+
+    async def replay() -> Message:
+        # Once the buffered body is replayed, the client's disconnection is still reported
+        nonlocal sent
+        if sent:
+            return await receive()
+        sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+    return replay
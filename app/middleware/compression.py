@@ -0,0 +1,176 @@
+import zlib
+from typing import Optional, Union
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+COMPRESSIBLE_MEDIA_TYPES = (
+    "application/json",
+    "application/msgpack",
+    "application/vnd.apache.arrow",
+    "text/",
+)
+
+
+class GzipEncoder:
+    """
+    Incremental gzip encoder.
+    """
+    name = "gzip"
+
+    def __init__(self, level: int) -> None:
+        self.compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self.compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self.compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self.compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliEncoder:
+    """
+    Incremental brotli encoder.
+    """
+    name = "br"
+
+    def __init__(self, quality: int) -> None:
+        self.compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self.compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self.compressor.flush()
+
+    def finish(self) -> bytes:
+        return self.compressor.finish()
+
+
+def select_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Picks the preferred supported encoding from an Accept-Encoding header.
+
+    Args:
+        accept_encoding (str): The raw Accept-Encoding header value.
+
+    Returns:
+        Optional[str]: 'br', 'gzip' or None when neither is acceptable.
+    """
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip()] = quality
+
+    # Brotli wins ties: it is both smaller and faster to decode than gzip at the levels used here
+    candidates = [(accepted.get(coding, accepted.get("*", 0.0)), preference, coding)
+                  for preference, coding in enumerate(("gzip", "br"))]
+    quality, _, coding = max(candidates)
+    return coding if quality > 0 else None
+
+
+class CompressionMiddleware:
+    """
+    Compresses responses with brotli or gzip when they exceed a minimum size.
+
+    Streaming responses are compressed chunk by chunk, so exports never have to be buffered whole.
+    """
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = select_encoding(Headers(scope=scope).get("Accept-Encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        if encoding == "br":
+            encoder = BrotliEncoder(self.brotli_quality)
+        else:
+            encoder = GzipEncoder(self.gzip_level)
+        responder = CompressionResponder(self.app, encoder, self.minimum_size)
+        await responder(scope, receive, send)
+
+
+class CompressionResponder:
+    """
+    Wraps a single response, deciding on the first body message whether to compress it.
+    """
+    def __init__(self, app: ASGIApp, encoder: Union[GzipEncoder, BrotliEncoder], minimum_size: int) -> None:
+        self.app = app
+        self.encoder = encoder
+        self.minimum_size = minimum_size
+        self.send = None
+        self.initial_message: Message = {}
+        self.started = False
+        self.compressing = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            # Hold the headers back until the first body chunk tells us whether to compress
+            self.initial_message = message
+            return
+
+        if message_type != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self.started:
+            self.started = True
+            headers = MutableHeaders(raw=self.initial_message["headers"])
+            media_type = headers.get("content-type", "")
+            eligible = ("content-encoding" not in headers
+                        and media_type.startswith(COMPRESSIBLE_MEDIA_TYPES)
+                        and (more_body or len(body) >= self.minimum_size))
+            if not eligible:
+                await self.send(self.initial_message)
+                await self.send(message)
+                return
+
+            self.compressing = True
+            headers["Content-Encoding"] = self.encoder.name
+            headers.add_vary_header("Accept-Encoding")
+            if more_body:
+                del headers["Content-Length"]
+                message["body"] = self.encoder.compress(body) + self.encoder.flush()
+            else:
+                message["body"] = self.encoder.compress(body) + self.encoder.finish()
+                headers["Content-Length"] = str(len(message["body"]))
+            await self.send(self.initial_message)
+            await self.send(message)
+            return
+
+        if not self.compressing:
+            await self.send(message)
+            return
+
+        if more_body:
+            message["body"] = self.encoder.compress(body) + self.encoder.flush()
+        else:
+            message["body"] = self.encoder.compress(body) + self.encoder.finish()
+        await self.send(message)
@@ -0,0 +1,40 @@
+import re
+import uuid
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from logger.logger_config import request_id
+
+REQUEST_ID_HEADER = "X-Request-ID"
+# Client-supplied IDs are kept only if short and made of safe characters, so they cannot forge log lines
+VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+
+
+class CorrelationIdMiddleware:
+    """
+    Tags every log record emitted while serving a request with the request's ID.
+
+    The ID is taken from the `X-Request-ID` header if the client sent a valid one, generated otherwise, and returned
+    in the `X-Request-ID` response header.
+    """
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        value = Headers(scope=scope).get(REQUEST_ID_HEADER)
+        if value is None or not VALID_REQUEST_ID.match(value):
+            value = uuid.uuid4().hex
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(raw=message["headers"])[REQUEST_ID_HEADER] = value
+            await send(message)
+
+        token = request_id.set(value)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id.reset(token)
@@ -0,0 +1,53 @@
+import logging
+from typing import Optional
+from urllib.parse import parse_qs
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+from app.services.deadline import Deadline, current_deadline
+
+DEADLINE_HEADER = "X-Request-Timeout"
+DEADLINE_QUERY_PARAM = "timeout"
+
+
+def parse_budget(scope: Scope) -> Optional[float]:
+    """
+    Reads the time budget of a request, in seconds, from its `X-Request-Timeout` header or `timeout` query parameter.
+
+    Args:
+        scope (Scope): The ASGI scope of the request.
+
+    Returns:
+        Optional[float]: The budget, or None if the request has no valid one.
+    """
+    value = Headers(scope=scope).get(DEADLINE_HEADER)
+    if value is None:
+        values = parse_qs(scope.get("query_string", b"").decode("latin-1")).get(DEADLINE_QUERY_PARAM)
+        value = values[-1] if values else None
+    if value is None:
+        return None
+    try:
+        budget = float(value)
+    except ValueError:
+        logging.debug(f"Ignoring invalid request timeout {value!r}")
+        return None
+    return budget if budget > 0 else None
+
+
+class DeadlineMiddleware:
+    """
+    Starts the deadline of requests that declare a time budget, so that scraping stops when the budget runs out.
+    """
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        budget = parse_budget(scope) if scope["type"] == "http" else None
+        if budget is None:
+            await self.app(scope, receive, send)
+            return
+
+        token = current_deadline.set(Deadline(budget))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_deadline.reset(token)
@@ -0,0 +1,91 @@
+from contextvars import ContextVar
+from datetime import date, datetime
+from typing import Any
+import msgpack
+import orjson
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack", "application/vnd.msgpack")
+
+preferred_media_type: ContextVar[str] = ContextVar("preferred_media_type", default=JSON_MEDIA_TYPE)
+
+
+def _msgpack_default(value: Any) -> Any:
+    """
+    Encodes the values msgpack does not support natively, mirroring the JSON representation.
+    """
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (tuple, set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not msgpack serializable")
+
+
+def prefers_msgpack(accept: str) -> bool:
+    """
+    Checks whether an Accept header ranks msgpack above JSON.
+
+    Args:
+        accept (str): The raw Accept header value.
+
+    Returns:
+        bool: True if msgpack should be served.
+    """
+    best_msgpack, best_json = 0.0, 0.0
+    for part in accept.lower().split(","):
+        media_type, _, params = part.strip().partition(";")
+        media_type = media_type.strip()
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if media_type in MSGPACK_MEDIA_TYPES:
+            best_msgpack = max(best_msgpack, quality)
+        elif media_type in (JSON_MEDIA_TYPE, "application/*", "*/*"):
+            best_json = max(best_json, quality)
+    return best_msgpack > 0 and best_msgpack >= best_json
+
+
+class NegotiatedResponse(ORJSONResponse):
+    """
+    Default response class: orjson-encoded JSON, or msgpack when the client negotiated it.
+    """
+    def render(self, content: Any) -> bytes:
+        if preferred_media_type.get() in MSGPACK_MEDIA_TYPES:
+            self.media_type = MSGPACK_MEDIA_TYPES[0]
+            return msgpack.packb(content, default=_msgpack_default)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+class ContentNegotiationMiddleware:
+    """
+    Records the media type a client prefers so `NegotiatedResponse` can render it.
+    """
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if prefers_msgpack(Headers(scope=scope).get("Accept", "")):
+            token = preferred_media_type.set(MSGPACK_MEDIA_TYPES[0])
+        else:
+            token = preferred_media_type.set(JSON_MEDIA_TYPE)
+
+        async def send_with_vary(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(raw=message["headers"]).add_vary_header("Accept")
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_vary)
+        finally:
+            preferred_media_type.reset(token)
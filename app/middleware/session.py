@@ -0,0 +1,38 @@
+import logging
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.services.scraper.session import NavigationSession, current_session
+
+
+class NavigationSessionMiddleware:
+    """
+    Opens one navigation session per request, shared by every scraper the request uses.
+
+    The session is closed once the response is fully sent, so streamed responses keep their browser until the end.
+    The number of pages loaded before the response starts is reported in the `X-Page-Loads` header.
+    """
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        session = NavigationSession()
+        token = current_session.set(session)
+
+        async def send_with_page_loads(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(raw=message["headers"])["X-Page-Loads"] = str(session.page_loads)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_page_loads)
+        finally:
+            current_session.reset(token)
+            if session.started:
+                logging.info(f"{scope['method']} {scope['path']} - {session.page_loads} page loads, "
+                             f"{session.memo_hits} memo hits")
+            await run_in_threadpool(session.close)
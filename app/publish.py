@@ -0,0 +1,186 @@
+"""
+Static snapshot publisher for completed seasons.
+
+Renders the results, standings and per-match details of every completed archive in the local store into
+pre-compressed JSON files, laid out like the API paths, so a web server or CDN can serve them without the
+application:
+
+    <output>/archives/<archive_id>/results.json.gz|.br     as GET /archives/{archiveId}/results?page=0&size=0
+    <output>/archives/<archive_id>/standings.json.gz|.br   as GET /archives/{archiveId}/standings
+    <output>/matches/<match_id>.json.gz|.br                as GET /matches/{matchId}
+    <output>/manifest.json                                 every file with its content hash, sizes and update time
+
+Files are only compressed and written again when the SHA-256 of their content differs from the manifest.
+
+Usage:
+    python -m app.publish
+    python -m app.publish --archives "Italy-Serie A-2023_2024" --output /var/www/livescore --workers 4
+"""
+import argparse
+import hashlib
+import logging
+import os
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Iterator, Optional
+import brotli
+import orjson
+from app.services.models.archive_schemas import MatchListResponse, StandingResponse
+from app.services.models.match_schemas import MatchResponse
+from app.services.repository import is_completed_season
+from app.services.scraper.archive_scraper import paginate
+from app.services.standings import ResultColumns, compute_standings
+from app.services.store import LocalStore, RESULTS, safe_filename, write_atomic
+from config import DATA_DIR, PUBLISH_DIR, PUBLISH_GZIP_LEVEL, PUBLISH_BROTLI_QUALITY
+from logger.logger_config import configure_logging
+
+MANIFEST = "manifest.json"
+ENCODINGS = {"gzip": ".gz", "br": ".br"}
+
+
+def is_completed_archive(archive_id: str) -> bool:
+    # Archive IDs end with their season (e.g., 'Italy-Serie A-2023_2024')
+    try:
+        return is_completed_season(archive_id.rsplit("-", 1)[-1])
+    except ValueError:
+        return False
+
+
+def render(response) -> bytes:
+    # Encoded as the API's default response class encodes it
+    return orjson.dumps(response.model_dump(mode="json"), option=orjson.OPT_NON_STR_KEYS)
+
+
+def archive_documents(store: LocalStore, archive_id: str) -> Iterator[tuple[str, bytes]]:
+    """
+    Renders the documents of a stored archive.
+
+    Args:
+        store (LocalStore): The local store.
+        archive_id (str): The unique identifier of the archive.
+
+    Yields:
+        tuple[str, bytes]: The path of each document, relative to the output directory and without the compression
+            suffix, and its JSON content.
+    """
+    loaded = store.load_archive_section(archive_id, RESULTS)
+    if loaded is None:
+        return
+    matches, _ = loaded
+    directory = f"archives/{safe_filename(archive_id)}"
+    _, _, pagination = paginate(len(matches), 0, 0)
+    yield f"{directory}/results.json", render(MatchListResponse(matches=matches, pagination=pagination))
+    if matches:
+        standings = compute_standings(ResultColumns(matches))
+        yield f"{directory}/standings.json", render(StandingResponse(standings=standings))
+
+    for match in matches:
+        match_id = getattr(match, "id", None)
+        detail = store.load_match(match_id) if match_id else None
+        if detail is not None:
+            yield f"matches/{safe_filename(match_id)}.json", render(MatchResponse(match=detail))
+
+
+class Publisher:
+    """
+    Writes documents as pre-compressed static files, skipping those whose content is unchanged.
+    """
+    def __init__(self, output: str, gzip_level: int = PUBLISH_GZIP_LEVEL,
+                 brotli_quality: int = PUBLISH_BROTLI_QUALITY) -> None:
+        self.output = output
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.manifest = {}
+        manifest_path = os.path.join(output, MANIFEST)
+        if os.path.exists(manifest_path):
+            with open(manifest_path, "rb") as file:
+                self.manifest = orjson.loads(file.read()).get("files", {})
+
+    def is_current(self, path: str, content_hash: str) -> bool:
+        entry = self.manifest.get(path)
+        return entry is not None and entry["sha256"] == content_hash and \
+            all(os.path.exists(os.path.join(self.output, path + suffix)) for suffix in ENCODINGS.values())
+
+    def publish(self, path: str, content: bytes) -> bool:
+        """
+        Writes a document in every encoding, unless the same content was already published.
+
+        Args:
+            path (str): The path of the document, relative to the output directory.
+            content (bytes): The JSON content.
+
+        Returns:
+            bool: True if the files were written, False if they were up to date.
+        """
+        content_hash = hashlib.sha256(content).hexdigest()
+        if self.is_current(path, content_hash):
+            return False
+
+        encoded = {
+            "gzip": gzip_compress(content, self.gzip_level),
+            "br": brotli.compress(content, quality=self.brotli_quality),
+        }
+        for encoding, data in encoded.items():
+            write_atomic(os.path.join(self.output, path + ENCODINGS[encoding]), data)
+        self.manifest[path] = {
+            "sha256": content_hash,
+            "size": len(content),
+            "gzip_size": len(encoded["gzip"]),
+            "br_size": len(encoded["br"]),
+            "updated_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        return True
+
+    def save_manifest(self) -> None:
+        payload = {
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "files": dict(sorted(self.manifest.items())),
+        }
+        write_atomic(os.path.join(self.output, MANIFEST), orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+
+
+def gzip_compress(content: bytes, level: int) -> bytes:
+    # Without a timestamp in the header, so unchanged content gives byte-identical files
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress(content) + compressor.flush()
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--archives", default=None,
+                        help="Comma-separated archive IDs to publish (default: every completed archive stored)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Threads compressing files")
+    parser.add_argument("--data-dir", default=DATA_DIR, help="Root directory of the local store")
+    parser.add_argument("--output", default=PUBLISH_DIR, help="Directory receiving the static files")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = parse_args(argv)
+    configure_logging()
+
+    store = LocalStore(args.data_dir)
+    if args.archives:
+        archive_ids = [archive_id.strip() for archive_id in args.archives.split(",") if archive_id.strip()]
+    else:
+        archive_ids = store.list_archives()
+    completed = [archive_id for archive_id in archive_ids if is_completed_archive(archive_id)]
+    skipped = len(archive_ids) - len(completed)
+    logging.info(f"Publishing {len(completed)} completed archives ({skipped} not completed skipped) to {args.output}")
+
+    started = time.perf_counter()
+    publisher = Publisher(args.output)
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        changed = list(executor.map(lambda document: publisher.publish(*document),
+                                    (document for archive_id in completed
+                                     for document in archive_documents(store, archive_id))))
+    publisher.save_manifest()
+
+    logging.info(f"Published {sum(changed)} changed documents, {len(changed) - sum(changed)} unchanged, "
+                 f"in {time.perf_counter() - started:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
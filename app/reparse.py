@@ -0,0 +1,186 @@
+"""
+Offline re-parse of the page archive with the current extractors.
+
+Runs the match, results, fixtures and standings extractors over the pages stored with PAGE_ARCHIVE_ENABLE, spread
+over all CPU cores, without network or browser. Used to rebuild data after a markup change broke an extractor, or
+after a new field was added, instead of scraping everything again. Each page URL is parsed as last fetched, or once
+per fetch with `--all-captures`, and the rebuilt data is written as JSON lines.
+
+Usage:
+    python -m app.reparse --output rebuilt.jsonl
+    python -m app.reparse --kinds match --since 2024-08-01 --workers 8 --output matches.jsonl
+"""
+import argparse
+import logging
+import multiprocessing
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Iterable, Optional
+import orjson
+from app.replay import to_json
+from app.services.models.archive_schemas import Archive
+from app.services.page_archive import PageArchive
+from app.services.recorder import CAPTURE_REPLAY
+from app.services.scraper.archive_scraper import ArchiveScraper, CONFIG_SCORE, SECTION_RESULTS, SECTION_FIXTURES, \
+    SECTION_STANDINGS
+from app.services.scraper.match_scraper import MatchScraper
+from app.services.scraper.session import NavigationSession
+from app.services.utils import get_current_season
+from config import PAGE_ARCHIVE_DIR
+from logger.logger_config import configure_logging
+
+KIND_MATCH = "match"
+KINDS = (KIND_MATCH, SECTION_RESULTS, SECTION_FIXTURES, SECTION_STANDINGS)
+CHUNK_SIZE = 16
+
+# Set in each worker process
+_archive: Optional[PageArchive] = None
+
+
+def page_kind(url: str) -> Optional[str]:
+    """
+    Tells which extractor reads a page.
+
+    Args:
+        url (str): The URL the page was fetched from.
+
+    Returns:
+        Optional[str]: One of `KINDS`, or None for navigation pages (countries, leagues, archives).
+    """
+    if re.search(r"/match/[^/]+/", url):
+        return KIND_MATCH
+    section = re.search(r"/(results|fixtures|standings)/", url)
+    return section.group(1) if section else None
+
+
+def season_of(url: str, captured_at: datetime) -> str:
+    # Archive URLs of past seasons end with the season (e.g., '.../serie-a-2023-2024/results/')
+    years = re.search(r"-(\d{4})-(\d{4})/", url)
+    return f"{years.group(1)}_{years.group(2)}" if years else get_current_season(captured_at)
+
+
+def _init_worker(root: str) -> None:
+    global _archive
+    _archive = PageArchive(root)
+
+
+def reparse_page(entry: dict) -> dict:
+    """
+    Runs the extractor of a page over its archived snapshot, in a worker process.
+
+    Args:
+        entry (dict): The index entry of the fetch, with url, captured_at and hash.
+
+    Returns:
+        dict: The entry with its kind and the extracted data, or the error raised by the extractor.
+    """
+    url, kind = entry["url"], page_kind(entry["url"])
+    result = {"url": url, "kind": kind, "captured_at": entry["captured_at"].isoformat(), "hash": entry["hash"]}
+    session = NavigationSession(mode=CAPTURE_REPLAY, replay_at=entry["captured_at"], source=_archive)
+    try:
+        if kind == KIND_MATCH:
+            match_id = re.search(r"/match/([^/]+)/", url).group(1)
+            data = MatchScraper(session=session).scrape_match(match_id)
+        else:
+            archive = Archive.model_construct(id=url, season=season_of(url, entry["captured_at"]), **{kind: url})
+            scraper = ArchiveScraper(session=session)
+            if kind == SECTION_STANDINGS:
+                data = scraper.scrape_standings(archive)
+            else:
+                data, _ = scraper.scrape_matches(url, archive, 0, 0, {CONFIG_SCORE: kind == SECTION_RESULTS})
+        result["data"] = to_json(data)
+    except Exception as ex:
+        result["error"] = f"{ex.__class__.__name__}: {ex}"
+    finally:
+        session.close()
+    return result
+
+
+def select_pages(archive: PageArchive, kinds: Iterable[str], since: Optional[datetime] = None,
+                 all_captures: bool = False) -> list[dict]:
+    """
+    Lists the fetches to re-parse.
+
+    Args:
+        archive (PageArchive): The page archive.
+        kinds (Iterable[str]): The page kinds to re-parse.
+        since (datetime, optional): Skips pages fetched before this time. Defaults to the first fetch.
+        all_captures (bool, optional): Whether to re-parse every fetch of a URL rather than the last one.
+            Fetches of the same content are parsed once. Defaults to False.
+
+    Returns:
+        list[dict]: The index entries of the fetches, oldest first.
+    """
+    kinds = set(kinds)
+    selected = {}
+    for entry in archive.entries(since=since):
+        if page_kind(entry["url"]) not in kinds:
+            continue
+        key = (entry["url"], entry["hash"]) if all_captures else entry["url"]
+        if all_captures and key in selected:
+            continue
+        selected[key] = entry
+    return sorted(selected.values(), key=lambda entry: entry["captured_at"])
+
+
+def reparse(entries: list[dict], root: str, workers: int) -> Iterable[dict]:
+    """
+    Re-parses archived pages in a pool of worker processes.
+
+    Args:
+        entries (list[dict]): The fetches to re-parse, as returned by `select_pages`.
+        root (str): The directory of the page archive.
+        workers (int): The number of worker processes.
+
+    Yields:
+        dict: The result of every page, in the order of `entries`.
+    """
+    # Workers are spawned rather than forked, as the parent runs logging threads
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker,
+                             initargs=(root,)) as executor:
+        yield from executor.map(reparse_page, entries, chunksize=CHUNK_SIZE)
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--kinds", default=",".join(KINDS), help=f"Comma-separated page kinds among: {', '.join(KINDS)}")
+    parser.add_argument("--since", type=datetime.fromisoformat, default=None,
+                        help="Only re-parse pages fetched from this ISO time")
+    parser.add_argument("--all-captures", action="store_true", help="Re-parse every fetch, not only the last per URL")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes (default: CPU count)")
+    parser.add_argument("--archive-dir", default=PAGE_ARCHIVE_DIR, help="Directory of the page archive")
+    parser.add_argument("--output", required=True, help="JSON lines file receiving the rebuilt data")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = parse_args(argv)
+    configure_logging()
+    kinds = [kind.strip() for kind in args.kinds.split(",") if kind.strip()]
+    unknown = set(kinds) - set(KINDS)
+    if unknown:
+        raise SystemExit(f"Unknown page kinds: {', '.join(sorted(unknown))}")
+
+    entries = select_pages(PageArchive(args.archive_dir), kinds, args.since, args.all_captures)
+    logging.info(f"Re-parsing {len(entries)} archived pages with {args.workers} workers")
+
+    started = time.perf_counter()
+    failed = 0
+    with open(args.output, "wb") as file:
+        for result in reparse(entries, args.archive_dir, args.workers):
+            if "error" in result:
+                failed += 1
+                logging.warning(f"Unable to re-parse {result['url']} fetched at {result['captured_at']}: {result['error']}")
+            file.write(orjson.dumps(result) + b"\n")
+
+    elapsed = time.perf_counter() - started
+    logging.info(f"Re-parsed {len(entries) - failed} pages, {failed} failed, in {elapsed:.1f} s "
+                 f"({len(entries) / elapsed if elapsed else 0:.1f} pages/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Offline replay of scrapes recorded in capture mode.
+
+Runs a scraper against the page snapshots recorded with CAPTURE_MODE="record", without network or browser, and
+reports how long the extraction took. Useful to reproduce a broken scrape, or to profile and compare extraction
+speed across versions on real pages.
+
+Usage:
+    python -m app.replay results Italy-Serie\\ A-2023_2024 --repeat 5
+    python -m app.replay match KCmkPUV8 --at 2024-05-26T21:00:00 --output match.json
+"""
+import argparse
+import logging
+import time
+from datetime import datetime
+from typing import Callable, Optional
+import orjson
+from pydantic import BaseModel
+from app.services.recorder import recordings, CAPTURE_REPLAY
+from app.services.scraper.archive_scraper import ArchiveScraper
+from app.services.scraper.country_scraper import CountryScraper
+from app.services.scraper.leagues_scraper import LeagueScraper
+from app.services.scraper.match_scraper import MatchScraper
+from app.services.scraper.session import NavigationSession
+from config import RECORDINGS_DIR
+from logger.logger_config import configure_logging
+
+OPERATIONS: dict[str, Callable[[NavigationSession, str], object]] = {
+    "countries": lambda session, _: CountryScraper(session=session).scrape_countries(),
+    "leagues": lambda session, country_id: CountryScraper(session=session).scrape_leagues_by_country(country_id),
+    "archives": lambda session, league_id: LeagueScraper(session=session).scrape_league_archives(league_id),
+    "archive": lambda session, archive_id: ArchiveScraper(session=session).scrape_archive(archive_id),
+    "results": lambda session, archive_id: ArchiveScraper(session=session).scrape_results_by_archive(archive_id, 0, 0)[0],
+    "fixtures": lambda session, archive_id: ArchiveScraper(session=session).scrape_fixtures_by_archive(archive_id, 0, 0)[0],
+    "standings": lambda session, archive_id: ArchiveScraper(session=session).scrape_standings_by_archive(archive_id),
+    "match": lambda session, match_id: MatchScraper(session=session).scrape_match(match_id),
+}
+
+
+def to_json(value) -> object:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, list):
+        return [to_json(item) for item in value]
+    return value
+
+
+def replay(operation: str, target: str, at: Optional[datetime] = None, repeat: int = 1) -> tuple[object, list[float]]:
+    """
+    Runs a scraper operation from recordings, each time in a fresh session.
+
+    Args:
+        operation (str): One of `OPERATIONS`.
+        target (str): The identifier the operation takes (country, league, archive or match ID).
+        at (datetime, optional): Replays pages as they were at this time. Defaults to the latest captures.
+        repeat (int, optional): The number of runs. Defaults to 1.
+
+    Returns:
+        tuple[object, list[float]]: The result of the last run and the duration of every run, in seconds.
+    """
+    result, durations = None, []
+    for _ in range(repeat):
+        session = NavigationSession(mode=CAPTURE_REPLAY, replay_at=at)
+        started = time.perf_counter()
+        try:
+            result = OPERATIONS[operation](session, target or "")
+        finally:
+            session.close()
+        durations.append(time.perf_counter() - started)
+    return result, durations
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("operation", choices=sorted(OPERATIONS), help="The scrape to replay")
+    parser.add_argument("target", nargs="?", default="", help="Country, league, archive or match ID")
+    parser.add_argument("--at", type=datetime.fromisoformat, default=None,
+                        help="Replay the pages as they were at this ISO time (default: latest captures)")
+    parser.add_argument("--repeat", type=int, default=1, help="Number of timed runs")
+    parser.add_argument("--recordings-dir", default=RECORDINGS_DIR, help="Directory of the recordings")
+    parser.add_argument("--output", help="Write the result of the last run to this JSON file")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = parse_args(argv)
+    configure_logging()
+    recordings.root = args.recordings_dir
+
+    result, durations = replay(args.operation, args.target, args.at, args.repeat)
+    size = len(result) if isinstance(result, list) else int(result is not None)
+    logging.info(f"Replayed {args.operation} {args.target}: {size} items, "
+                 f"best {min(durations) * 1000:.1f} ms, mean {sum(durations) / len(durations) * 1000:.1f} ms "
+                 f"over {len(durations)} runs")
+
+    if args.output:
+        with open(args.output, "wb") as file:
+            file.write(orjson.dumps(to_json(result), option=orjson.OPT_INDENT_2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,38 @@
 import logging
-from fastapi import APIRouter, HTTPException
+from datetime import date
+from typing import Mapping, Optional
+from fastapi import APIRouter, Depends, HTTPException
 from fastapi import Query
+from fastapi.responses import StreamingResponse
+from app.services.admission import admission
+from app.services import deadline
+from app.services.circuit_breaker import CircuitOpenError
+from app.services.deadline import DeadlineExceeded
+from app.services.exporter import export_matches, MatchStatsFetcher, MEDIA_TYPES
+from app.services.fields import parse_fields, sparse
 from app.services.models.archive_schemas import ArchiveResponse, MatchListResponse, StandingResponse, \
-    ListLiveMatch
+    ListLiveMatch, ExportFormat, Match, LiveMatch, Rank, SeasonPackResponse
+from app.services.models.match_schemas import MatchStats
+from app.services.models.stats_schemas import TeamStatsResponse, TeamStatsTableResponse, Venue
+from app.services.repository import get_result_columns, get_stats_columns, fetch_matches, has_fresh_results, \
+    get_season_pack
 from app.services.scraper.archive_scraper import ArchiveScraper
+from app.services.standings import compute_standings, compare_standings
+from app.services.team_stats import season_table, team_stats, find_team
 
 ROUTER_NAME = 'archives'
+FIELDS_DESCRIPTION = "Comma-separated attributes to return for each item (e.g., 'id,home_score'). Others are not scraped."
 
 router = APIRouter()
 
-@router.get("/{archiveId}", response_model=ArchiveResponse)
+
+def _results_cached(params: Mapping[str, str]) -> bool:
+    # Results-based views need no browser once the results are stored, unless a cross-check is requested
+    cross_check = params.get("cross_check", "false")
+    return cross_check.lower() not in ("true", "1", "yes", "on") and has_fresh_results(params["archiveId"])
+
+
+@router.get("/{archiveId}", response_model=ArchiveResponse, dependencies=[Depends(admission())])
 def get_archive(archiveId: str) -> ArchiveResponse:
     """
     Retrieves the archive data by its ID.
@@ -33,16 +56,63 @@ def get_archive(archiveId: str) -> ArchiveResponse:
         return ArchiveResponse(archive=archive)
     except HTTPException as e:
         raise e
+    except CircuitOpenError as e:
+        logging.warning(f"Failing fast: {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    except DeadlineExceeded as e:
+        logging.warning(f"Deadline exceeded: {e}")
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logging.error(f"Error occurred while processing archive {archiveId}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/{archiveId}/results", response_model=MatchListResponse)
+@router.get("/{archiveId}/pack", response_model=SeasonPackResponse, dependencies=[Depends(admission())])
+def get_pack_by_archive(
+    archiveId: str,
+    parallel: bool = Query(False, description="Scrape results, fixtures and standings concurrently, in separate tabs.")
+) -> SeasonPackResponse:
+    """
+    Retrieves an archive with all its results, fixtures and standings, resolving the archive only once.
+
+    Args:
+        archiveId (str): The unique identifier of the archive to scrape.
+        parallel (bool, optional): Whether to scrape the sections concurrently. Defaults to False.
+
+    Returns:
+        SeasonPackResponse: The archive and its results, fixtures and standings.
+    """
+    try:
+        logging.info(f"GET /{ROUTER_NAME}/{archiveId}/pack - Starting archive pack scraping process.")
+        pack = get_season_pack(archiveId, parallel)
+
+        if pack is None:
+            logging.warning(f"Archive with ID {archiveId} not found.")
+            raise HTTPException(status_code=404, detail=f"Archive with ID {archiveId} not found.")
+
+        archive, sections = pack
+        logging.info(f"GET /{ROUTER_NAME}/{archiveId}/pack call successful - Pack of archive {archiveId} scraped.")
+        return SeasonPackResponse(archive=archive, partial=deadline.is_partial(), **sections)
+    except HTTPException as e:
+        raise e
+    except CircuitOpenError as e:
+        logging.warning(f"Failing fast: {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    except DeadlineExceeded as e:
+        logging.warning(f"Deadline exceeded: {e}")
+        raise HTTPException(status_code=504, detail=str(e))
+    except Exception as e:
+        logging.error(f"Error occurred while processing pack for archive {archiveId}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{archiveId}/results", response_model=MatchListResponse, dependencies=[Depends(admission())])
 def get_results_by_archive(
     archiveId: str,
     page: int = Query(1, ge=0, description="Page number to retrieve, starting from 1. Use 0 to get all results."),
-    size: int = Query(10, ge=0, le=100, description="Number of items per page (max 100). Use 0 to get all results.")
+    size: int = Query(10, ge=0, le=100, description="Number of items per page (max 100). Use 0 to get all results."),
+    include_stats: bool = Query(False, description="Include the statistics of every listed match."),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION)
 ) -> MatchListResponse:
     """
     Retrieves paginated match results for a given archive.
@@ -51,29 +121,137 @@ def get_results_by_archive(
         archiveId (str): The unique identifier of the archive to scrape matches from.
         page (int, optional): The page number to retrieve. Defaults to 1.
         size (int, optional): The number of items per page (maximum 100). Defaults to 10.
+        include_stats (bool, optional): Whether to merge the statistics of each match. Defaults to False.
+        fields (str, optional): Comma-separated attributes to return, all if omitted. Defaults to None.
 
     Returns:
         MatchListResponse: A paginated list of match results.
     """
     try:
         logging.info(f"GET /{ROUTER_NAME}/{archiveId}/results - Starting archive results scraping process.")
+        requested = parse_fields(fields, Match)
+        if requested is not None and include_stats:
+            requested = requested | {"stats"}
         archive_scraper = ArchiveScraper()
-        matches, pagination = archive_scraper.scrape_results_by_archive(archiveId, page, size)
+        matches, pagination = archive_scraper.scrape_results_by_archive(archiveId, page, size, requested)
+
+        if include_stats:
+            details = fetch_matches([match.id for match in matches if getattr(match, "id", None)])
+            for match in matches:
+                detail = details.get(getattr(match, "id", None))
+                if detail is not None:
+                    match.stats = MatchStats.from_match(detail)
 
         logging.info(f"GET /{ROUTER_NAME}/{archiveId}/results call successful - Results of archive {archiveId} scraped.")
-        return MatchListResponse(matches=matches, pagination=pagination)
+        response = MatchListResponse.model_construct(matches=matches, pagination=pagination, partial=deadline.is_partial())
+        return sparse(response, "matches", requested)
     except HTTPException as e:
         raise e
+    except CircuitOpenError as e:
+        logging.warning(f"Failing fast: {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    except DeadlineExceeded as e:
+        logging.warning(f"Deadline exceeded: {e}")
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logging.error(f"Error occurred while processing results for archive {archiveId}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/{archiveId}/fixtures", response_model=MatchListResponse)
+@router.get("/{archiveId}/results.{export_format}", response_class=StreamingResponse, dependencies=[Depends(admission())])
+def export_results_by_archive(
+    archiveId: str,
+    export_format: ExportFormat,
+    include_stats: bool = Query(False, description="Join the statistics of every match as extra columns.")
+) -> StreamingResponse:
+    """
+    Streams all the match results of an archive as a Parquet, Arrow IPC or CSV file.
+
+    Args:
+        archiveId (str): The unique identifier of the archive to scrape matches from.
+        export_format (ExportFormat): The file format: 'parquet', 'arrow' or 'csv'.
+        include_stats (bool, optional): Whether to join per-match statistics. Defaults to False.
+
+    Returns:
+        StreamingResponse: The encoded results, streamed batch by batch.
+    """
+    try:
+        logging.info(f"GET /{ROUTER_NAME}/{archiveId}/results.{export_format.value} - Starting archive results export.")
+        archive_scraper = ArchiveScraper()
+        matches = archive_scraper.iter_results_by_archive(archiveId)
+        stats_fetcher = MatchStatsFetcher() if include_stats else None
+
+        logging.info(f"GET /{ROUTER_NAME}/{archiveId}/results.{export_format.value} call successful - Streaming results of archive {archiveId}.")
+        return StreamingResponse(
+            export_matches(matches, export_format, stats_fetcher),
+            media_type=MEDIA_TYPES[export_format],
+            headers={"Content-Disposition": f'attachment; filename="{archiveId}-results.{export_format.value}"'},
+        )
+    except HTTPException as e:
+        raise e
+    except CircuitOpenError as e:
+        logging.warning(f"Failing fast: {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    except DeadlineExceeded as e:
+        logging.warning(f"Deadline exceeded: {e}")
+        raise HTTPException(status_code=504, detail=str(e))
+    except Exception as e:
+        logging.error(f"Error occurred while exporting results for archive {archiveId}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/bundle.{export_format}", response_class=StreamingResponse, dependencies=[Depends(admission())])
+def export_results_by_archives(
+    archive_ids: list[str],
+    export_format: ExportFormat,
+    include_stats: bool = Query(False, description="Join the statistics of every match as extra columns.")
+) -> StreamingResponse:
+    """
+    Streams the match results of several archives as a single Parquet, Arrow IPC or CSV file.
+
+    Rows carry their archive ID, and archives that cannot be resolved are skipped.
+
+    Args:
+        archive_ids (list[str]): The unique identifiers of the archives to export.
+        export_format (ExportFormat): The file format: 'parquet', 'arrow' or 'csv'.
+        include_stats (bool, optional): Whether to join per-match statistics. Defaults to False.
+
+    Returns:
+        StreamingResponse: The encoded results, streamed batch by batch.
+    """
+    try:
+        logging.info(f"POST /{ROUTER_NAME}/bundle.{export_format.value} - Starting results export for archives: {archive_ids}")
+        if not archive_ids:
+            raise HTTPException(status_code=400, detail="No archive IDs provided.")
+
+        archive_scraper = ArchiveScraper()
+        matches = archive_scraper.iter_results_by_archives(archive_ids)
+        stats_fetcher = MatchStatsFetcher() if include_stats else None
+
+        return StreamingResponse(
+            export_matches(matches, export_format, stats_fetcher),
+            media_type=MEDIA_TYPES[export_format],
+            headers={"Content-Disposition": f'attachment; filename="results.{export_format.value}"'},
+        )
+    except HTTPException as e:
+        raise e
+    except CircuitOpenError as e:
+        logging.warning(f"Failing fast: {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    except DeadlineExceeded as e:
+        logging.warning(f"Deadline exceeded: {e}")
+        raise HTTPException(status_code=504, detail=str(e))
+    except Exception as e:
+        logging.error(f"Error occurred during results bundle export: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{archiveId}/fixtures", response_model=MatchListResponse, dependencies=[Depends(admission())])
 def get_fixtures_by_archive(
     archiveId: str,
     page: int = Query(1, ge=0, description="Page number to retrieve, starting from 1. Use 0 to get all results."),
-    size: int = Query(10, ge=0, le=100, description="Number of items per page (max 100). Use 0 to get all results.")
+    size: int = Query(10, ge=0, le=100, description="Number of items per page (max 100). Use 0 to get all results."),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION)
 ) -> MatchListResponse:
     """
     Retrieves paginated match fixtures for a given archive.
@@ -82,68 +260,193 @@ def get_fixtures_by_archive(
         archiveId (str): The unique identifier of the archive to scrape matches from.
         page (int, optional): The page number to retrieve. Defaults to 1.
         size (int, optional): The number of items per page (maximum 100). Defaults to 10.
+        fields (str, optional): Comma-separated attributes to return, all if omitted. Defaults to None.
 
     Returns:
         MatchListResponse: A paginated list of match results.
     """
     try:
         logging.info(f"GET /{ROUTER_NAME}/{archiveId}/fixtures - Starting archive fixtures scraping process.")
+        requested = parse_fields(fields, Match)
         archive_scraper = ArchiveScraper()
-        matches, pagination = archive_scraper.scrape_fixtures_by_archive(archiveId, page, size)
+        matches, pagination = archive_scraper.scrape_fixtures_by_archive(archiveId, page, size, requested)
 
         logging.info(f"GET /{ROUTER_NAME}/{archiveId}/fixtures call successful - Fixtures of archive {archiveId} scraped.")
-        return MatchListResponse(matches=matches, pagination=pagination)
+        response = MatchListResponse.model_construct(matches=matches, pagination=pagination, partial=deadline.is_partial())
+        return sparse(response, "matches", requested)
     except HTTPException as e:
         raise e
+    except CircuitOpenError as e:
+        logging.warning(f"Failing fast: {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    except DeadlineExceeded as e:
+        logging.warning(f"Deadline exceeded: {e}")
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logging.error(f"Error occurred while processing fixtures for archive {archiveId}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/{archiveId}/live", response_model=ListLiveMatch)
-def get_live_by_archive(archiveId: str) -> ListLiveMatch:
+@router.get("/{archiveId}/live", response_model=ListLiveMatch, dependencies=[Depends(admission())])
+def get_live_by_archive(
+    archiveId: str,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION)
+) -> ListLiveMatch:
     """
     Retrieves paginated match live for a given archive.
 
     Args:
         archiveId (str): The unique identifier of the archive to scrape matches from.
+        fields (str, optional): Comma-separated attributes to return, all if omitted. Defaults to None.
     Returns:
         MatchListResponse: List of live match.
     """
     try:
         logging.info(f"GET /{ROUTER_NAME}/{archiveId}/live - Starting live matches of archive {archiveId} scraping process.")
+        requested = parse_fields(fields, LiveMatch)
         archive_scraper = ArchiveScraper()
-        matches = archive_scraper.scrape_live_by_archive(archiveId)
+        matches = archive_scraper.scrape_live_by_archive(archiveId, requested)
 
         logging.info(f"GET /{ROUTER_NAME}/{archiveId}/live call successful - Live matches of archive {archiveId} scraped.")
-        return ListLiveMatch(matches=matches)
+        return sparse(ListLiveMatch.model_construct(matches=matches), "matches", requested)
     except HTTPException as e:
         raise e
+    except CircuitOpenError as e:
+        logging.warning(f"Failing fast: {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    except DeadlineExceeded as e:
+        logging.warning(f"Deadline exceeded: {e}")
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logging.error(f"Error occurred while processing live matches for archive {archiveId}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/{archiveId}/standings", response_model=StandingResponse)
-def get_fixtures_by_archive(archiveId: str) -> StandingResponse:
+@router.get("/{archiveId}/standings", response_model=StandingResponse, dependencies=[Depends(admission(cached=_results_cached))])
+def get_standings_by_archive(
+    archiveId: str,
+    as_of_round: Optional[int] = Query(None, ge=1, description="Only count matches up to this round (inclusive)."),
+    as_of_date: Optional[date] = Query(None, description="Only count matches played up to this day (inclusive)."),
+    cross_check: bool = Query(False, description="Compare with the standings scraped from the site."),
+    fields: Optional[str] = Query(None, description="Comma-separated attributes to return for each team (e.g., 'team,points').")
+) -> StandingResponse:
     """
-   Retrieves standings for a given archive.
+    Retrieves standings for a given archive, computed from its results.
 
-   Args:
-       archiveId (str): The unique identifier of the archive to scrape standings from.
+    Args:
+        archiveId (str): The unique identifier of the archive to compute standings for.
+        as_of_round (int, optional): Computes the table as it was after this round. Defaults to None.
+        as_of_date (date, optional): Computes the table as it was at the end of this day. Defaults to None.
+        cross_check (bool, optional): Whether to scrape the standings page and report differences. Defaults to False.
+        fields (str, optional): Comma-separated attributes to return, all if omitted. The table is computed from
+            the results, so this only trims the response. Defaults to None.
 
-   Returns:
-       StandingResponse: The standings data for the archive.
-   """
+    Returns:
+        StandingResponse: The standings data for the archive.
+    """
     try:
-        logging.info(f"GET /{ROUTER_NAME}/{archiveId}/standings - Starting archive standings scraping process.")
-        archive_scraper = ArchiveScraper()
-        standings = archive_scraper.scrape_standings_by_archive(archiveId)
+        logging.info(f"GET /{ROUTER_NAME}/{archiveId}/standings - Starting archive standings computation.")
+        requested = parse_fields(fields, Rank)
+        columns = get_result_columns(archiveId)
+        standings = compute_standings(columns, as_of_round, as_of_date)
 
-        logging.info(f"GET /{ROUTER_NAME}/{archiveId}/standings call successful - Standings of archive {archiveId} scraped.")
-        return StandingResponse(standings=standings)
+        discrepancies = None
+        if cross_check:
+            archive_scraper = ArchiveScraper()
+            scraped_standings = archive_scraper.scrape_standings_by_archive(archiveId)
+            discrepancies = compare_standings(standings, scraped_standings)
+            if discrepancies:
+                logging.warning(f"Derived standings of archive {archiveId} differ from the scraped ones: {discrepancies}")
+
+        logging.info(f"GET /{ROUTER_NAME}/{archiveId}/standings call successful - Standings of archive {archiveId} computed.")
+        return sparse(StandingResponse(standings=standings, discrepancies=discrepancies,
+                                       partial=deadline.is_partial()), "standings", requested)
     except HTTPException as e:
         raise e
+    except CircuitOpenError as e:
+        logging.warning(f"Failing fast: {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    except DeadlineExceeded as e:
+        logging.warning(f"Deadline exceeded: {e}")
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logging.error(f"Error occurred while processing standings for archive {archiveId}: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{archiveId}/teams/stats", response_model=TeamStatsTableResponse, dependencies=[Depends(admission(cached=_results_cached))])
+def get_teams_stats_by_archive(
+    archiveId: str,
+    venue: Venue = Query(Venue.ALL, description="Restrict the figures to home or away matches.")
+) -> TeamStatsTableResponse:
+    """
+    Retrieves the season-wide statistics table of every team of an archive.
+
+    Args:
+        archiveId (str): The unique identifier of the archive.
+        venue (Venue, optional): Restricts the figures to home or away matches. Defaults to all matches.
+
+    Returns:
+        TeamStatsTableResponse: The totals and averages of every team, sorted by points.
+    """
+    try:
+        logging.info(f"GET /{ROUTER_NAME}/{archiveId}/teams/stats - Starting season statistics computation.")
+        columns = get_stats_columns(archiveId)
+        teams = season_table(columns, venue)
+
+        logging.info(f"GET /{ROUTER_NAME}/{archiveId}/teams/stats call successful - Statistics of {len(teams)} teams computed.")
+        return TeamStatsTableResponse(teams=teams, matches_with_stats=columns.matches_with_stats,
+                                      total_matches=len(columns.results), partial=deadline.is_partial())
+    except HTTPException as e:
+        raise e
+    except CircuitOpenError as e:
+        logging.warning(f"Failing fast: {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    except DeadlineExceeded as e:
+        logging.warning(f"Deadline exceeded: {e}")
+        raise HTTPException(status_code=504, detail=str(e))
+    except Exception as e:
+        logging.error(f"Error occurred while processing team statistics for archive {archiveId}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{archiveId}/teams/{team}/stats", response_model=TeamStatsResponse, dependencies=[Depends(admission(cached=_results_cached))])
+def get_team_stats_by_archive(
+    archiveId: str,
+    team: str,
+    window: int = Query(5, ge=1, le=38, description="Number of matches in the rolling form window.")
+) -> TeamStatsResponse:
+    """
+    Retrieves the statistics of a team in an archive: totals, averages, home/away splits and rolling form.
+
+    Args:
+        archiveId (str): The unique identifier of the archive.
+        team (str): The name of the team.
+        window (int, optional): Number of matches in the rolling form window. Defaults to 5.
+
+    Returns:
+        TeamStatsResponse: The statistics of the team.
+    """
+    try:
+        logging.info(f"GET /{ROUTER_NAME}/{archiveId}/teams/{team}/stats - Starting team statistics computation.")
+        columns = get_stats_columns(archiveId)
+        team_index = find_team(columns, team)
+
+        if team_index is None:
+            logging.warning(f"Team {team} not found in archive {archiveId}.")
+            raise HTTPException(status_code=404, detail=f"Team {team} not found in archive {archiveId}.")
+
+        logging.info(f"GET /{ROUTER_NAME}/{archiveId}/teams/{team}/stats call successful - Statistics of {team} computed.")
+        return TeamStatsResponse(team_stats=team_stats(columns, archiveId, team_index, window),
+                                 partial=deadline.is_partial())
+    except HTTPException as e:
+        raise e
+    except CircuitOpenError as e:
+        logging.warning(f"Failing fast: {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    except DeadlineExceeded as e:
+        logging.warning(f"Deadline exceeded: {e}")
+        raise HTTPException(status_code=504, detail=str(e))
+    except Exception as e:
+        logging.error(f"Error occurred while processing statistics of team {team} for archive {archiveId}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -1,5 +1,8 @@
 import logging
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
+from app.services.admission import admission
+from app.services.circuit_breaker import CircuitOpenError
+from app.services.deadline import DeadlineExceeded
 from app.services.models.country_schemas import CountryListResponse, Country, LeagueListResponse
 from app.services.scraper.country_scraper import CountryScraper
 
@@ -7,7 +10,7 @@ ROUTER_NAME = 'countries'
 
 router = APIRouter()
 
-@router.get("/", response_model=CountryListResponse)
+@router.get("/", response_model=CountryListResponse, dependencies=[Depends(admission())])
 def get_countries(name: str = Query(None, description="The name of the country to search for")) -> CountryListResponse:
     """
     Retrieves a list of available countries.
@@ -24,12 +27,18 @@ def get_countries(name: str = Query(None, description="The name of the country t
         countries = country_scraper.scrape_countries(name)
         logging.info(f"GET /{ROUTER_NAME} call successful - Scraped {len(countries)} countries.")
         return CountryListResponse(countries=countries)
+    except CircuitOpenError as e:
+        logging.warning(f"Failing fast: {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    except DeadlineExceeded as e:
+        logging.warning(f"Deadline exceeded: {e}")
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logging.error(f"Error occurred while scraping countries: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/{countryId}/leagues", response_model=LeagueListResponse)
+@router.get("/{countryId}/leagues", response_model=LeagueListResponse, dependencies=[Depends(admission())])
 def get_leagues_by_country(countryId: str) -> LeagueListResponse:
     """
     Retrieves all leagues for a specific country.
@@ -46,6 +55,12 @@ def get_leagues_by_country(countryId: str) -> LeagueListResponse:
         leagues = country_scraper.scrape_leagues_by_country(countryId)
         logging.info(f"GET /{ROUTER_NAME}/{countryId}/leagues call successful - Scraped {len(leagues)} leagues for country {countryId}.")
         return LeagueListResponse(leagues=leagues)
+    except CircuitOpenError as e:
+        logging.warning(f"Failing fast: {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    except DeadlineExceeded as e:
+        logging.warning(f"Deadline exceeded: {e}")
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logging.error(e)
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
@@ -0,0 +1,88 @@
+import logging
+from datetime import datetime, timedelta
+from typing import Mapping, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from app.services import deadline
+from app.services.admission import admission
+from app.services.circuit_breaker import CircuitOpenError
+from app.services.deadline import DeadlineExceeded
+from app.services.fixture_calendar import calendar, to_archive_id
+from app.services.models.archive_schemas import FixtureCalendarResponse
+from app.services.repository import has_fresh_fixtures, index_fixtures
+from config import CALENDAR_DEFAULT_HOURS
+
+ROUTER_NAME = 'fixtures'
+
+router = APIRouter()
+
+
+def parse_leagues(leagues: Optional[str]) -> list[str]:
+    """
+    Resolves a comma-separated list of league or archive IDs to archive IDs.
+
+    Args:
+        leagues (str, optional): League IDs (e.g., 'Italy-Serie A') or archive IDs, separated by commas.
+
+    Returns:
+        list[str]: The archive IDs, league IDs being resolved to their running season.
+    """
+    if not leagues:
+        return []
+    return list(dict.fromkeys(to_archive_id(league.strip()) for league in leagues.split(",") if league.strip()))
+
+
+def to_local(moment: datetime) -> datetime:
+    # Fixture dates are naive local times, as displayed by the site
+    return moment.astimezone().replace(tzinfo=None) if moment.tzinfo is not None else moment
+
+
+def _calendar_cached(params: Mapping[str, str]) -> bool:
+    # Without leagues only the indexed fixtures are queried, which never needs a browser
+    return all(has_fresh_fixtures(archive_id) for archive_id in parse_leagues(params.get("leagues", "")))
+
+
+@router.get("/", response_model=FixtureCalendarResponse, dependencies=[Depends(admission(cached=_calendar_cached))])
+def get_fixtures(
+    start: Optional[datetime] = Query(None, alias="from", description="Beginning of the time range. Defaults to now."),
+    end: Optional[datetime] = Query(None, alias="to", description=f"End of the time range. Defaults to {CALENDAR_DEFAULT_HOURS} hours after the beginning."),
+    leagues: Optional[str] = Query(None, description="Comma-separated league IDs (e.g., 'Italy-Serie A') or archive IDs. Defaults to every indexed archive.")
+) -> FixtureCalendarResponse:
+    """
+    Retrieves the fixtures of many leagues scheduled in a time range, from the fixture calendar.
+
+    The fixtures of the requested leagues are scraped only when missing or stale; without leagues, only the
+    archives already indexed are queried.
+
+    Args:
+        start (datetime, optional): The beginning of the range (inclusive). Defaults to now.
+        end (datetime, optional): The end of the range (inclusive). Defaults to `CALENDAR_DEFAULT_HOURS` later.
+        leagues (str, optional): The league or archive IDs, separated by commas. Defaults to every indexed archive.
+
+    Returns:
+        FixtureCalendarResponse: The fixtures in chronological order.
+    """
+    try:
+        logging.info(f"GET /{ROUTER_NAME} - Retrieving fixtures from the calendar.")
+        start = to_local(start) if start is not None else datetime.now()
+        end = to_local(end) if end is not None else start + timedelta(hours=CALENDAR_DEFAULT_HOURS)
+        if end < start:
+            raise HTTPException(status_code=400, detail="'to' must not be earlier than 'from'")
+
+        archive_ids = parse_leagues(leagues)
+        missing = index_fixtures(archive_ids) if archive_ids else []
+        matches = calendar.between(start, end, archive_ids or None)
+
+        logging.info(f"GET /{ROUTER_NAME} call successful - {len(matches)} fixtures between {start} and {end}.")
+        return FixtureCalendarResponse(matches=matches, total_matches=len(matches), missing=missing,
+                                       partial=deadline.is_partial())
+    except HTTPException as e:
+        raise e
+    except CircuitOpenError as e:
+        logging.warning(f"Failing fast: {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    except DeadlineExceeded as e:
+        logging.warning(f"Deadline exceeded: {e}")
+        raise HTTPException(status_code=504, detail=str(e))
+    except Exception as e:
+        logging.error(f"Error occurred while retrieving the fixture calendar: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
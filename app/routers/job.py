@@ -0,0 +1,64 @@
+import logging
+from fastapi import APIRouter, HTTPException
+from app.services.jobs import jobs, missing_params
+from app.services.models.job_schemas import JobRequest, JobResponse
+
+ROUTER_NAME = 'jobs'
+
+router = APIRouter()
+
+
+@router.post("/", response_model=JobResponse, status_code=202)
+def submit_job(job_request: JobRequest) -> JobResponse:
+    """
+    Submits a long-running scrape (results, fixtures, standings, match batch or league backfill) as a background job.
+
+    Args:
+        job_request (JobRequest): The scrape to run, its parameters and an optional webhook.
+
+    Returns:
+        JobResponse: The queued job, whose ID is polled with GET /jobs/{jobId}.
+    """
+    try:
+        logging.info(f"POST /{ROUTER_NAME} - Submitting {job_request.kind.value} job.")
+        missing = missing_params(job_request)
+        if missing:
+            raise HTTPException(status_code=400,
+                                detail=f"Missing {', '.join(missing)} for a {job_request.kind.value} job.")
+
+        job = jobs.submit(job_request)
+        logging.info(f"POST /{ROUTER_NAME} call successful - Job {job.id} queued.")
+        return JobResponse(job=job)
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        logging.error(f"Error occurred while submitting {job_request.kind.value} job: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{jobId}", response_model=JobResponse)
+def get_job(jobId: str) -> JobResponse:
+    """
+    Retrieves the status, progress and, once finished, the result of a job.
+
+    Args:
+        jobId (str): The unique identifier of the job.
+
+    Returns:
+        JobResponse: The job.
+    """
+    try:
+        logging.info(f"GET /{ROUTER_NAME}/{jobId} - Retrieving job.")
+        job = jobs.get(jobId)
+
+        if job is None:
+            logging.warning(f"Job with ID {jobId} not found.")
+            raise HTTPException(status_code=404, detail=f"Job with ID {jobId} not found or expired.")
+
+        logging.info(f"GET /{ROUTER_NAME}/{jobId} call successful - Job {jobId} is {job.status.value}.")
+        return JobResponse(job=job)
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        logging.error(f"Error occurred while retrieving job {jobId}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -1,5 +1,8 @@
 import logging
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
+from app.services.admission import admission
+from app.services.circuit_breaker import CircuitOpenError
+from app.services.deadline import DeadlineExceeded
 from app.services.models.league_schemas import LeagueResponse, ArchiveListResponse
 from app.services.scraper.leagues_scraper import LeagueScraper
 
@@ -7,7 +10,7 @@ ROUTER_NAME = 'leagues'
 
 router = APIRouter()
 
-@router.get("/{leagueId}", response_model=LeagueResponse)
+@router.get("/{leagueId}", response_model=LeagueResponse, dependencies=[Depends(admission())])
 def get_league(leagueId: str) -> LeagueResponse:
     """
     Retrieves detailed information about a specific league.
@@ -31,11 +34,17 @@ def get_league(leagueId: str) -> LeagueResponse:
         return LeagueResponse(league=league)
     except HTTPException as e:
         raise e
+    except CircuitOpenError as e:
+        logging.warning(f"Failing fast: {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    except DeadlineExceeded as e:
+        logging.warning(f"Deadline exceeded: {e}")
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logging.error(f"Error occurred while processing league {leagueId}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/{leagueId}/archives", response_model=ArchiveListResponse)
+@router.get("/{leagueId}/archives", response_model=ArchiveListResponse, dependencies=[Depends(admission())])
 def get_archives_by_league(leagueId: str) -> ArchiveListResponse:
     """
     Retrieves all archives associated with a specific league.
@@ -53,6 +62,12 @@ def get_archives_by_league(leagueId: str) -> ArchiveListResponse:
 
         logging.info(f"GET /{ROUTER_NAME}/{leagueId}/archives call successful - Found {len(archives)} archives.")
         return ArchiveListResponse(archives=archives)
+    except CircuitOpenError as e:
+        logging.warning(f"Failing fast: {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    except DeadlineExceeded as e:
+        logging.warning(f"Deadline exceeded: {e}")
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logging.error(f"Error occurred while processing archives for league {leagueId}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
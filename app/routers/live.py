@@ -0,0 +1,50 @@
+import logging
+from typing import List, Mapping, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from app.services.admission import admission
+from app.services.circuit_breaker import CircuitOpenError
+from app.services.deadline import DeadlineExceeded
+from app.services.live_feed import live_feed, filter_leagues
+from app.services.models.archive_schemas import LiveFeedResponse
+
+ROUTER_NAME = 'live'
+
+router = APIRouter()
+
+
+def _feed_cached(params: Mapping[str, str]) -> bool:
+    return live_feed.is_fresh()
+
+
+@router.get("/", response_model=LiveFeedResponse, dependencies=[Depends(admission(cached=_feed_cached))])
+def get_live_matches(
+    league: Optional[List[str]] = Query(None, description="Only list these leagues (e.g., 'Italy-Serie A'). Repeatable.")
+) -> LiveFeedResponse:
+    """
+    Retrieves the live matches of every league, scraped from a single page and shared by all callers.
+
+    Args:
+        league (List[str], optional): The league IDs to keep. Defaults to all leagues.
+
+    Returns:
+        LiveFeedResponse: The live matches grouped by league.
+    """
+    try:
+        logging.info(f"GET /{ROUTER_NAME} - Retrieving the live feed.")
+        leagues, updated_at = live_feed.get()
+        leagues = filter_leagues(leagues, league)
+
+        total_matches = sum(len(live_league.matches) for live_league in leagues)
+        logging.info(f"GET /{ROUTER_NAME} call successful - {total_matches} live matches in {len(leagues)} leagues.")
+        return LiveFeedResponse(leagues=leagues, total_matches=total_matches, updated_at=updated_at)
+    except HTTPException as e:
+        raise e
+    except CircuitOpenError as e:
+        logging.warning(f"Failing fast: {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    except DeadlineExceeded as e:
+        logging.warning(f"Deadline exceeded: {e}")
+        raise HTTPException(status_code=504, detail=str(e))
+    except Exception as e:
+        logging.error(f"Error occurred while retrieving the live feed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
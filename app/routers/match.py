@@ -1,75 +1,108 @@
 import logging
-from fastapi import APIRouter, HTTPException
-from app.services.models.match_schemas import MatchResponse, MatchListResponse
-from app.services.scraper.match_scraper import MatchScraper
+from typing import Mapping, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from app.services.admission import admission
+from app.services import deadline
+from app.services.circuit_breaker import CircuitOpenError
+from app.services.deadline import DeadlineExceeded
+from app.services.fields import parse_fields, sparse
+from app.services.models.match_schemas import Match, MatchResponse, MatchListResponse
+from app.services.repository import MatchFetcher, fetch_matches
+from app.services.store import store
 
 ROUTER_NAME = 'matches'
+FIELDS_DESCRIPTION = "Comma-separated match attributes to return (e.g., 'home_score,away_score'). Others are not scraped."
 
 router = APIRouter()
 
-@router.get("/{matchId}", response_model=MatchResponse)
-def get_match(matchId: str) -> MatchResponse:
+
+def _match_cached(params: Mapping[str, str]) -> bool:
+    return store.has_match(params["matchId"])
+
+
+@router.get("/{matchId}", response_model=MatchResponse, dependencies=[Depends(admission(cached=_match_cached))])
+def get_match(
+    matchId: str,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION)
+) -> MatchResponse:
     """
     Retrieves the match data by its ID.
 
     Args:
         matchId (str): The unique identifier of the match to scrape.
+        fields (str, optional): Comma-separated attributes to return, all if omitted. Defaults to None.
 
     Returns:
         MatchResponse: The scraped match data.
     """
     try:
         logging.info(f"GET /{ROUTER_NAME}/{matchId} - Starting match {matchId} scraping process.")
-        match_scraper = MatchScraper()
-        match = match_scraper.scrape_match(matchId)
+        requested = parse_fields(fields, Match)
+        match_fetcher = MatchFetcher()
+        match = match_fetcher.get(matchId, requested)
 
         if match is None:
             logging.warning(f"Match with ID {matchId} not found.")
             raise HTTPException(status_code=404, detail=f"Match with ID {matchId} not found.")
 
         logging.info(f"GET /{ROUTER_NAME}/{matchId} call successful - Match {matchId} scraped.")
-        return MatchResponse(match=match)
+        return sparse(MatchResponse.model_construct(match=match), "match", requested)
     except HTTPException as e:
         raise e
+    except CircuitOpenError as e:
+        logging.warning(f"Failing fast: {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    except DeadlineExceeded as e:
+        logging.warning(f"Deadline exceeded: {e}")
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logging.error(f"Error occurred while processing match {matchId}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/batch", response_model=MatchListResponse)
-def get_matches(match_ids: list[str]) -> MatchListResponse:
+@router.post("/batch", response_model=MatchListResponse, dependencies=[Depends(admission())])
+def get_matches(
+    match_ids: list[str],
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION)
+) -> MatchListResponse:
     """
     Retrieves a list of matches based on the provided IDs.
 
     Args:
         match_ids (list[str]): A list of unique match identifiers to scrape.
+        fields (str, optional): Comma-separated attributes to return, all if omitted. Defaults to None.
 
     Returns:
         MatchListResponse: A list of scraped match data.
     """
     try:
         logging.info(f"POST /{ROUTER_NAME}/batch - Starting batch match scraping process for IDs: {match_ids}")
-        match_scraper = MatchScraper()
+        requested = parse_fields(fields, Match)
+        details = fetch_matches(match_ids, fields=requested)
         matches = []
 
         for match_id in match_ids:
-            try:
-                match = match_scraper.scrape_match(match_id)
-                if match:
-                    matches.append(match)
-                else:
-                    logging.warning(f"Match with ID {match_id} not found.")
-            except Exception as e:
-                logging.error(f"Error scraping match ID {match_id}: {e}")
+            match = details.get(match_id)
+            if match:
+                matches.append(match)
+            else:
+                logging.warning(f"Match with ID {match_id} not found.")
 
         if not matches:
             logging.warning("No matches found for provided IDs.")
             raise HTTPException(status_code=404, detail="No matches found for provided IDs.")
 
         logging.info(f"POST /{ROUTER_NAME}/batch call successful - Matches scraped: {len(matches)}")
-        return MatchListResponse(matches=matches)
+        return sparse(MatchListResponse.model_construct(matches=matches, partial=deadline.is_partial()), "matches",
+                      requested)
     except HTTPException as e:
         raise e
+    except CircuitOpenError as e:
+        logging.warning(f"Failing fast: {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    except DeadlineExceeded as e:
+        logging.warning(f"Deadline exceeded: {e}")
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logging.error(f"Error occurred during batch match processing: {e}")
         raise HTTPException(status_code=500, detail=str(e))
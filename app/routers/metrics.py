@@ -0,0 +1,21 @@
+import logging
+from fastapi import APIRouter, HTTPException
+from app.services.metrics import metrics
+
+ROUTER_NAME = 'metrics'
+
+router = APIRouter()
+
+@router.get("/")
+def get_metrics() -> dict:
+    """
+    Retrieves the service metrics: counters, timings and gauges.
+
+    Returns:
+        dict: The current value of every metric.
+    """
+    try:
+        return metrics.snapshot()
+    except Exception as e:
+        logging.error(f"Error occurred while collecting metrics: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,97 @@
+import logging
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query
+from app.services.models.team_schemas import HeadToHeadResponse, MatchStatus, TeamMatchesResponse
+from app.services.team_index import team_index
+
+ROUTER_NAME = 'teams'
+
+router = APIRouter()
+
+
+def _find_team(team: str) -> str:
+    key = team_index.lookup(team)
+    if key is None:
+        raise HTTPException(status_code=404, detail=f"The team {team} is not in any stored archive")
+    return key
+
+
+@router.get("/{team}/matches", response_model=TeamMatchesResponse)
+def get_team_matches(
+    team: str,
+    status: MatchStatus = Query(MatchStatus.ALL, description="'played' for results only, 'upcoming' for fixtures only."),
+    season: Optional[str] = Query(None, description="Only list matches of archives of this season (e.g., '2024_2025').")
+) -> TeamMatchesResponse:
+    """
+    Retrieves the matches of a team across all the competitions in the local store.
+
+    Args:
+        team (str): The name of the team, as displayed in any competition.
+        status (MatchStatus, optional): Which matches to list. Defaults to all.
+        season (str, optional): The season to keep. Defaults to all seasons.
+
+    Returns:
+        TeamMatchesResponse: The matches of the team, in chronological order.
+    """
+    try:
+        logging.info(f"GET /{ROUTER_NAME}/{team}/matches - Retrieving the matches of team {team}.")
+        team_index.refresh_if_stale()
+        key = _find_team(team)
+
+        played = None if status == MatchStatus.ALL else status == MatchStatus.PLAYED
+        matches = team_index.matches_of(key, played=played)
+        if season:
+            matches = [match for match in matches if match.archive.endswith(f"-{season}")]
+
+        logging.info(f"GET /{ROUTER_NAME}/{team}/matches call successful - {len(matches)} matches of team {team}.")
+        return TeamMatchesResponse(team=team_index.team_name(key), aliases=team_index.team_aliases(key),
+                                   matches=matches, total_matches=len(matches))
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        logging.error(f"Error occurred while retrieving the matches of team {team}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{team}/vs/{opponent}", response_model=HeadToHeadResponse)
+def get_head_to_head(
+    team: str,
+    opponent: str,
+    limit: int = Query(10, ge=0, description="Number of most recent matches to consider. Use 0 for all of them.")
+) -> HeadToHeadResponse:
+    """
+    Retrieves the played matches between two teams across all the competitions in the local store.
+
+    Args:
+        team (str): The name of the first team.
+        opponent (str): The name of the second team.
+        limit (int, optional): The number of most recent matches to consider. Defaults to 10.
+
+    Returns:
+        HeadToHeadResponse: The matches, most recent first, and the record of the first team.
+    """
+    try:
+        logging.info(f"GET /{ROUTER_NAME}/{team}/vs/{opponent} - Retrieving head-to-head matches.")
+        team_index.refresh_if_stale()
+        key, opponent_key = _find_team(team), _find_team(opponent)
+
+        matches = team_index.head_to_head(key, opponent_key)
+        if limit:
+            matches = matches[:limit]
+
+        wins = draws = losses = 0
+        for match in matches:
+            scored, conceded = (match.home_score, match.away_score) if team_index.is_home(key, match) \
+                else (match.away_score, match.home_score)
+            wins += scored > conceded
+            draws += scored == conceded
+            losses += scored < conceded
+
+        logging.info(f"GET /{ROUTER_NAME}/{team}/vs/{opponent} call successful - {len(matches)} matches found.")
+        return HeadToHeadResponse(team=team_index.team_name(key), opponent=team_index.team_name(opponent_key),
+                                  matches=matches, wins=wins, draws=draws, losses=losses)
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        logging.error(f"Error occurred while retrieving head-to-head matches of {team} and {opponent}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,237 @@
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, Mapping, Optional
+from fastapi import HTTPException, Request
+from app.services.metrics import metrics
+from config import MAX_BROWSERS, ADMISSION_MAX_WAIT, ADMISSION_DEFAULT_LATENCY
+
+# Weight of the latest request in the per-endpoint latency average
+LATENCY_SMOOTHING = 0.2
+
+
+class Overloaded(Exception):
+    """
+    Raised when a request would wait longer than the admission bound before getting a browser.
+
+    Attributes:
+        estimated_wait (float): The estimated queue wait in seconds.
+        retry_after (int): The number of seconds after which the request is expected to be admitted.
+    """
+    def __init__(self, estimated_wait: float, retry_after: int) -> None:
+        super().__init__(f"Server overloaded, estimated wait {estimated_wait:.0f} seconds")
+        self.estimated_wait = estimated_wait
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """
+    Admits scraper-backed requests only if they are expected to get a browser soon enough.
+
+    Up to `max_browsers` browser sessions run at once; the others queue in the threadpool. A request counts for as
+    many sessions as it uses (e.g., the worker sessions of a statistics fan-out). The wait of a new request is
+    estimated from the expected latency of every request in flight, weighted by its sessions, each endpoint's latency
+    being an exponentially weighted moving average of its recent requests, spread over the available browsers.
+
+    Background jobs are not bounded by a client's patience: instead of being rejected, they wait in `reserve` until a
+    browser is free, and then count against the same budget as requests.
+
+    Attributes:
+        max_browsers (int): The number of requests that can scrape at the same time.
+        max_wait (float): The longest estimated wait, in seconds, for which a request is still admitted.
+    """
+    def __init__(self, max_browsers: int = MAX_BROWSERS, max_wait: float = ADMISSION_MAX_WAIT,
+                 default_latency: float = ADMISSION_DEFAULT_LATENCY, clock=time.monotonic) -> None:
+        self.max_browsers = max_browsers
+        self.max_wait = max_wait
+        self.default_latency = default_latency
+        self.clock = clock
+        self.latencies: Dict[str, float] = {}
+        self.in_flight: Dict[int, tuple[str, float]] = {}
+        self.sessions: Dict[int, int] = {}
+        self.next_ticket = 0
+        self.lock = threading.Lock()
+        self.freed = threading.Condition(self.lock)
+
+    def latency(self, endpoint: str) -> float:
+        return self.latencies.get(endpoint, self.default_latency)
+
+    def estimate_wait(self, now: Optional[float] = None) -> float:
+        """
+        Estimates how long a new request would queue before getting a browser.
+
+        Args:
+            now (float, optional): The current clock value. Defaults to the controller's clock.
+
+        Returns:
+            float: The estimated wait in seconds, 0 if a browser is free.
+        """
+        now = self.clock() if now is None else now
+        with self.lock:
+            if self.occupancy() < self.max_browsers:
+                return 0.0
+            remaining = sum(self.sessions[ticket] * max(self.latency(endpoint) - (now - started), 0.0)
+                            for ticket, (endpoint, started) in self.in_flight.items())
+        return remaining / self.max_browsers
+
+    def occupancy(self) -> int:
+        return sum(self.sessions.values())
+
+    def admit(self, endpoint: str) -> int:
+        """
+        Admits a request or rejects it early.
+
+        Args:
+            endpoint (str): The endpoint of the request (e.g., 'GET /archives/{archiveId}/results').
+
+        Returns:
+            int: A ticket to pass to `release` once the request is done.
+
+        Raises:
+            Overloaded: If the estimated wait exceeds `max_wait`.
+        """
+        now = self.clock()
+        estimated_wait = self.estimate_wait(now)
+        if estimated_wait > self.max_wait:
+            metrics.increment("admission.rejected")
+            raise Overloaded(estimated_wait, max(1, math.ceil(estimated_wait - self.max_wait)))
+
+        with self.lock:
+            ticket = self._register(endpoint, now)
+        metrics.increment("admission.admitted")
+        return ticket
+
+    def reserve(self, endpoint: str) -> int:
+        """
+        Waits until a browser is free, then takes it for a background job.
+
+        Args:
+            endpoint (str): The kind of the job (e.g., 'JOB backfill').
+
+        Returns:
+            int: A ticket to pass to `release` once the job is done.
+        """
+        with self.freed:
+            while self.occupancy() >= self.max_browsers:
+                self.freed.wait()
+            ticket = self._register(endpoint, self.clock())
+        metrics.increment("admission.reserved")
+        return ticket
+
+    def _register(self, endpoint: str, now: float) -> int:
+        ticket = self.next_ticket
+        self.next_ticket += 1
+        self.in_flight[ticket] = (endpoint, now)
+        self.sessions[ticket] = 1
+        return ticket
+
+    def occupy(self, ticket: int, sessions: int) -> None:
+        """
+        Changes the number of browser sessions an admitted request uses, beside its own.
+
+        Args:
+            ticket (int): The ticket returned by `admit`.
+            sessions (int): The sessions opened (positive) or closed (negative).
+        """
+        with self.lock:
+            if ticket in self.sessions:
+                self.sessions[ticket] = max(1, self.sessions[ticket] + sessions)
+                self.freed.notify_all()
+
+    def release(self, ticket: int) -> None:
+        """
+        Ends an admitted request and updates its endpoint's latency average.
+
+        Args:
+            ticket (int): The ticket returned by `admit`.
+        """
+        now = self.clock()
+        with self.lock:
+            endpoint, started = self.in_flight.pop(ticket)
+            self.sessions.pop(ticket, None)
+            elapsed = now - started
+            previous = self.latencies.get(endpoint)
+            self.latencies[endpoint] = elapsed if previous is None else \
+                previous + LATENCY_SMOOTHING * (elapsed - previous)
+            self.freed.notify_all()
+
+
+controller = AdmissionController()
+
+# The tickets of the current request, set by `AdmissionMiddleware` and released once the response is fully sent, or
+# of the current background job
+current_tickets: ContextVar[Optional[list[int]]] = ContextVar("admission_tickets", default=None)
+
+metrics.register_gauge("admission.in_flight", lambda: len(controller.in_flight))
+metrics.register_gauge("admission.sessions", lambda: controller.occupancy())
+metrics.register_gauge("admission.estimated_wait", lambda: round(controller.estimate_wait(), 3))
+
+
+def admission(cached: Optional[Callable[..., bool]] = None):
+    """
+    Builds a route dependency that applies admission control.
+
+    Under `AdmissionMiddleware`, the slot is held until the response is fully sent, so streamed responses that keep
+    scraping count until their last byte. Otherwise it is released when the route returns.
+
+    Args:
+        cached (Callable[[Mapping[str, str]], bool], optional): Called with the request's query and path parameters
+            (path parameters taking precedence), returns True if the request can be served without scraping. Such
+            requests always pass. Defaults to never.
+
+    Returns:
+        Callable: The dependency, to use as `dependencies=[Depends(admission(...))]`.
+    """
+    def dependency(request: Request):
+        if cached is not None and cached({**request.query_params, **request.path_params}):
+            metrics.increment("admission.bypassed")
+            yield
+            return
+
+        route = request.scope.get("route")
+        endpoint = f"{request.method} {route.path if route is not None else request.url.path}"
+        try:
+            ticket = controller.admit(endpoint)
+        except Overloaded as e:
+            logging.warning(f"{endpoint} rejected: {e}")
+            raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+
+        tickets = current_tickets.get()
+        if tickets is not None:
+            tickets.append(ticket)
+            yield
+            return
+        try:
+            yield
+        finally:
+            controller.release(ticket)
+
+    return dependency
+
+
+def release_all(tickets: list[int]) -> None:
+    for ticket in tickets:
+        controller.release(ticket)
+    tickets.clear()
+
+
+@contextmanager
+def extra_sessions(count: int) -> Iterator[None]:
+    """
+    Counts browser sessions opened by the current request beside its own (e.g., worker threads) against admission.
+
+    Args:
+        count (int): The number of sessions opened for the duration of the block.
+    """
+    tickets = current_tickets.get()
+    ticket = tickets[-1] if tickets else None
+    if ticket is not None:
+        controller.occupy(ticket, count)
+    try:
+        yield
+    finally:
+        if ticket is not None:
+            controller.occupy(ticket, -count)
@@ -0,0 +1,148 @@
+import atexit
+import logging
+import threading
+import time
+from typing import Optional
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.common.desired_capabilities import DesiredCapabilities
+from selenium.webdriver.common.selenium_manager import SeleniumManager
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+from app.services.metrics import metrics
+from config import CHROMEDRIVER_PATH, SHARED_CHROMEDRIVER
+
+VENDOR_PREFIX = "goog"
+
+
+class DriverBinaries:
+    """
+    Resolves the chromedriver and Chrome executables once per process.
+
+    Without a `Service` path, Selenium runs Selenium Manager on every new driver, which probes the installed browser
+    and may download a driver. The paths it finds are cached instead and reused for every later driver.
+
+    Attributes:
+        driver_path (str): The chromedriver executable, once resolved.
+        browser_path (str): The Chrome executable found by Selenium Manager, None if `CHROMEDRIVER_PATH` is set.
+    """
+    def __init__(self, driver_path: Optional[str] = CHROMEDRIVER_PATH) -> None:
+        self.driver_path = driver_path
+        self.browser_path = None
+        self.resolved = driver_path is not None
+        self.lock = threading.Lock()
+
+    def resolve(self, options: webdriver.ChromeOptions) -> str:
+        """
+        Returns the chromedriver path, resolving it with Selenium Manager on the first call.
+
+        Args:
+            options (webdriver.ChromeOptions): The options of the driver to create, given the cached browser path.
+
+        Returns:
+            str: The chromedriver executable.
+        """
+        with self.lock:
+            if not self.resolved:
+                started = time.perf_counter()
+                self.driver_path = SeleniumManager().driver_location(options)
+                self.browser_path = options.binary_location or None
+                self.resolved = True
+                metrics.observe("chromedriver.resolve", time.perf_counter() - started)
+                logging.info(f"Resolved chromedriver at {self.driver_path} and Chrome at {self.browser_path}")
+        if self.browser_path and not options.binary_location:
+            options.binary_location = self.browser_path
+        return self.driver_path
+
+
+class SharedServiceChrome(webdriver.Chrome):
+    """
+    A Chrome WebDriver whose session runs on the shared chromedriver server instead of a server of its own.
+
+    Quitting ends the browser session only; the server keeps serving the other sessions.
+    """
+    def __init__(self, service: Service, options: webdriver.ChromeOptions) -> None:
+        # ChromiumDriver.__init__ would start a new server, the remote driver is initialized directly instead
+        self.vendor_prefix = VENDOR_PREFIX
+        self.service = service
+        RemoteWebDriver.__init__(
+            self,
+            command_executor=ChromiumRemoteConnection(
+                remote_server_addr=service.service_url,
+                browser_name=DesiredCapabilities.CHROME["browserName"],
+                vendor_prefix=VENDOR_PREFIX,
+                keep_alive=True,
+                ignore_proxy=options._ignore_local_proxy,
+            ),
+            options=options,
+        )
+        self._is_remote = False
+
+    def quit(self) -> None:
+        try:
+            RemoteWebDriver.quit(self)
+        except Exception as ex:
+            logging.debug(f"Unable to end browser session: {ex}")
+
+
+class ChromeDriverServer:
+    """
+    One long-lived chromedriver server, shared by every browser session of the process.
+
+    The server is started on the first session and restarted if it exited, so a new session only costs the launch
+    of Chrome itself.
+    """
+    def __init__(self, binaries: DriverBinaries) -> None:
+        self.binaries = binaries
+        self.service = None
+        self.lock = threading.Lock()
+
+    def running(self) -> Service:
+        """
+        Returns the running server, starting it if needed.
+
+        Returns:
+            Service: The chromedriver service.
+        """
+        with self.lock:
+            if self.service is None or self.service.process.poll() is not None:
+                if self.service is not None:
+                    logging.warning("The shared chromedriver exited, starting a new one")
+                service = Service(executable_path=self.binaries.driver_path)
+                with metrics.timer("chromedriver.server_start"):
+                    service.start()
+                self.service = service
+            return self.service
+
+    def stop(self) -> None:
+        with self.lock:
+            service, self.service = self.service, None
+        if service is not None:
+            try:
+                service.stop()
+            except Exception as ex:
+                logging.debug(f"Unable to stop chromedriver: {ex}")
+
+
+def new_chrome(options: webdriver.ChromeOptions) -> webdriver.Chrome:
+    """
+    Starts a Chrome session with the cached chromedriver, on the shared server when `SHARED_CHROMEDRIVER` is on.
+
+    Args:
+        options (webdriver.ChromeOptions): The options of the session.
+
+    Returns:
+        webdriver.Chrome: The WebDriver of the new session.
+    """
+    driver_path = binaries.resolve(options)
+    if SHARED_CHROMEDRIVER:
+        service = server.running()
+        with metrics.timer("chromedriver.session_start"):
+            return SharedServiceChrome(service, options)
+    with metrics.timer("chromedriver.session_start"):
+        return webdriver.Chrome(options=options, service=Service(executable_path=driver_path))
+
+
+binaries = DriverBinaries()
+server = ChromeDriverServer(binaries)
+atexit.register(server.stop)
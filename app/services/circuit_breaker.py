@@ -0,0 +1,120 @@
+import logging
+import threading
+import time
+from typing import Dict
+from app.services.metrics import metrics
+from config import CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of scraping a page type whose circuit is open.
+
+    Attributes:
+        page_type (str): The upstream page type that is failing.
+        retry_after (int): The number of seconds before the circuit lets a probe through.
+    """
+    def __init__(self, page_type: str, retry_after: int) -> None:
+        super().__init__(f"Upstream {page_type} pages are unavailable, retry in {retry_after} seconds")
+        self.page_type = page_type
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Fails fast on an upstream page type after consecutive timeouts.
+
+    The circuit opens after `failure_threshold` consecutive failures. Once `reset_timeout` seconds have passed, it
+    becomes half-open and lets a single probe through: a success closes it, a failure opens it again.
+
+    Attributes:
+        name (str): The upstream page type guarded by the circuit.
+        state (str): One of 'closed', 'open' and 'half_open'.
+        failures (int): The number of consecutive failures.
+    """
+    def __init__(self, name: str, failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+                 reset_timeout: float = CIRCUIT_RESET_TIMEOUT, clock=time.monotonic) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+        self.lock = threading.Lock()
+
+    def before_call(self) -> None:
+        """
+        Checks that a call may go upstream.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a probe already in flight.
+        """
+        with self.lock:
+            if self.state == OPEN:
+                elapsed = self.clock() - self.opened_at
+                if elapsed < self.reset_timeout:
+                    raise CircuitOpenError(self.name, max(1, int(self.reset_timeout - elapsed + 0.5)))
+                logging.info(f"Circuit {self.name} half-open, probing upstream")
+                self.state = HALF_OPEN
+                self.probing = False
+            if self.state == HALF_OPEN:
+                if self.probing:
+                    raise CircuitOpenError(self.name, 1)
+                self.probing = True
+
+    def record_success(self) -> None:
+        with self.lock:
+            if self.state != CLOSED:
+                logging.info(f"Circuit {self.name} closed")
+            self.state = CLOSED
+            self.failures = 0
+            self.probing = False
+
+    def release(self) -> None:
+        """
+        Ends a call whose outcome says nothing about upstream health (e.g., a browser crash).
+        """
+        with self.lock:
+            self.probing = False
+
+    def record_failure(self) -> None:
+        with self.lock:
+            self.failures += 1
+            self.probing = False
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    logging.warning(f"Circuit {self.name} open after {self.failures} consecutive failures")
+                    metrics.increment(f"circuit.{self.name}.opened")
+                self.state = OPEN
+                self.opened_at = self.clock()
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(page_type: str) -> CircuitBreaker:
+    """
+    Returns the circuit breaker of an upstream page type, creating it on first use.
+
+    Its state is exposed on /metrics as `circuit.<page_type>.state` (0 closed, 1 half-open, 2 open).
+
+    Args:
+        page_type (str): The upstream page type (e.g., 'results', 'match').
+
+    Returns:
+        CircuitBreaker: The circuit breaker.
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(page_type)
+        if breaker is None:
+            breaker = _breakers[page_type] = CircuitBreaker(page_type)
+            metrics.register_gauge(f"circuit.{page_type}.state", lambda: STATE_VALUES[breaker.state])
+        return breaker
@@ -0,0 +1,80 @@
+import bisect
+import hashlib
+import threading
+from typing import Iterable, Iterator, Optional
+from config import CLUSTER_VIRTUAL_NODES
+
+
+def ring_hash(key: str) -> int:
+    return int.from_bytes(hashlib.md5(key.encode()).digest()[:8], "big")
+
+
+def parse_nodes(value: Optional[str]) -> list[str]:
+    """
+    Reads a comma-separated list of node base URLs (e.g., 'http://node1:8000,http://node2:8000').
+    """
+    return [node.strip().rstrip("/") for node in (value or "").split(",") if node.strip()]
+
+
+class HashRing:
+    """
+    Consistent-hash ring mapping entity IDs to the node that owns them.
+
+    Each node is placed at `virtual_nodes` points of the ring and a key belongs to the first node found clockwise
+    from its hash, so adding or removing a node only moves the keys of the arcs it gains or loses (about 1/N of them)
+    and the load stays even across nodes.
+    """
+    def __init__(self, nodes: Iterable[str] = (), virtual_nodes: int = CLUSTER_VIRTUAL_NODES) -> None:
+        self.virtual_nodes = virtual_nodes
+        self.lock = threading.Lock()
+        self.points = []
+        self.owners_at = []
+        self.nodes = set()
+        for node in nodes:
+            self.add(node)
+
+    def add(self, node: str) -> None:
+        with self.lock:
+            if node in self.nodes:
+                return
+            self.nodes.add(node)
+            # The lists are replaced rather than updated, so lookups in progress keep a consistent ring
+            ring = sorted(list(zip(self.points, self.owners_at)) +
+                          [(ring_hash(f"{node}#{replica}"), node) for replica in range(self.virtual_nodes)])
+            self.points = [point for point, _ in ring]
+            self.owners_at = [owner for _, owner in ring]
+
+    def remove(self, node: str) -> None:
+        with self.lock:
+            if node not in self.nodes:
+                return
+            self.nodes.discard(node)
+            kept = [(point, owner) for point, owner in zip(self.points, self.owners_at) if owner != node]
+            self.points = [point for point, _ in kept]
+            self.owners_at = [owner for _, owner in kept]
+
+    def owners(self, key: str) -> Iterator[str]:
+        """
+        Lists the nodes of the ring in the order they take over a key: its owner first, then the nodes serving it
+        should the previous ones be down.
+
+        Args:
+            key (str): The entity ID (e.g., an archive, league or match ID).
+
+        Yields:
+            str: Every node once.
+        """
+        with self.lock:
+            points, owners_at = self.points, self.owners_at
+        if not points:
+            return
+        start = bisect.bisect(points, ring_hash(key))
+        seen = set()
+        for offset in range(len(points)):
+            node = owners_at[(start + offset) % len(points)]
+            if node not in seen:
+                seen.add(node)
+                yield node
+
+    def owner(self, key: str) -> Optional[str]:
+        return next(self.owners(key), None)
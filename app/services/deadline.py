@@ -0,0 +1,75 @@
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+
+class DeadlineExceeded(Exception):
+    """
+    Raised when the time budget of a request is exhausted before anything could be returned.
+    """
+    def __init__(self) -> None:
+        super().__init__("Request deadline exceeded")
+
+
+class Deadline:
+    """
+    The time budget of a request, shared by every scraper and worker thread serving it.
+
+    Attributes:
+        expires_at (float): The `time.monotonic` value at which the budget runs out.
+        partial (bool): Whether some work was cut short, so the response only holds what was gathered in time.
+    """
+    def __init__(self, seconds: float, clock=time.monotonic) -> None:
+        self.clock = clock
+        self.expires_at = clock() + seconds
+        self.partial = False
+
+    def remaining(self) -> float:
+        return max(self.expires_at - self.clock(), 0.0)
+
+    def expired(self) -> bool:
+        return self.clock() >= self.expires_at
+
+
+current_deadline: ContextVar[Optional[Deadline]] = ContextVar("current_deadline", default=None)
+
+
+def remaining(default: float) -> float:
+    """
+    Caps a duration by the remaining budget of the current request.
+
+    Args:
+        default (float): The duration to use without a deadline (e.g., `TIMEOUT`).
+
+    Returns:
+        float: The smaller of `default` and the remaining budget.
+
+    Raises:
+        DeadlineExceeded: If the budget is already exhausted.
+    """
+    deadline = current_deadline.get()
+    if deadline is None:
+        return default
+    left = deadline.remaining()
+    if left <= 0:
+        raise DeadlineExceeded()
+    return min(default, left)
+
+
+def expired() -> bool:
+    deadline = current_deadline.get()
+    return deadline is not None and deadline.expired()
+
+
+def mark_partial() -> None:
+    """
+    Records that the current request returns incomplete results because its budget ran out.
+    """
+    deadline = current_deadline.get()
+    if deadline is not None:
+        deadline.partial = True
+
+
+def is_partial() -> bool:
+    deadline = current_deadline.get()
+    return deadline is not None and deadline.partial
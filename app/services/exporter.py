@@ -0,0 +1,190 @@
+import io
+import logging
+from typing import Callable, Iterable, Iterator, Optional
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from app.services.models.archive_schemas import ExportFormat, Match
+from app.services.models.match_schemas import Match as MatchDetail
+from app.services.repository import fetch_matches
+from app.services.scraper.match_scraper import STAT_ATTRIBUTES
+from config import EXPORT_BATCH_SIZE
+
+MATCH_COLUMNS = [
+    ("id", pa.string()),
+    ("archive", pa.string()),
+    ("round", pa.int32()),
+    ("match_date", pa.timestamp("s")),
+    ("home", pa.string()),
+    ("away", pa.string()),
+    ("home_score", pa.int32()),
+    ("away_score", pa.int32()),
+    ("url", pa.string()),
+]
+STAT_TYPES = {
+    "expected_goals_xg": pa.float64(),
+}
+MEDIA_TYPES = {
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
+    ExportFormat.ARROW: "application/vnd.apache.arrow.stream",
+    ExportFormat.CSV: "text/csv",
+}
+
+StatsFetcher = Callable[[list[str]], dict[str, MatchDetail]]
+
+
+class MatchStatsFetcher:
+    """
+    Fetches per-match statistics for export rows through the match store, scraping misses concurrently.
+    """
+    def __call__(self, match_ids: list[str]) -> dict[str, MatchDetail]:
+        return fetch_matches(match_ids)
+
+
+def export_schema(include_stats: bool = False) -> pa.Schema:
+    """
+    Builds the Arrow schema of exported match rows.
+
+    Args:
+        include_stats (bool, optional): Whether to add a home and an away column per statistic. Defaults to False.
+
+    Returns:
+        pa.Schema: The export schema.
+    """
+    fields = [pa.field(name, type_) for name, type_ in MATCH_COLUMNS]
+    if include_stats:
+        for attribute in STAT_ATTRIBUTES:
+            type_ = STAT_TYPES.get(attribute, pa.int32())
+            fields.append(pa.field(f"{attribute}_home", type_))
+            fields.append(pa.field(f"{attribute}_away", type_))
+    return pa.schema(fields)
+
+
+def iter_record_batches(matches: Iterable[Match], schema: pa.Schema, stats_fetcher: Optional[StatsFetcher] = None,
+                        batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[pa.RecordBatch]:
+    """
+    Groups scraped match rows into Arrow record batches, filling columns straight from the rows.
+
+    Args:
+        matches (Iterable[Match]): The scraped matches, typically a lazy iterator.
+        schema (pa.Schema): The export schema, from `export_schema`.
+        stats_fetcher (StatsFetcher, optional): Called once per batch to join statistics by match ID.
+        batch_size (int, optional): Number of rows per record batch. Defaults to `EXPORT_BATCH_SIZE`.
+
+    Yields:
+        pa.RecordBatch: The record batches, in row order.
+    """
+    batch = []
+    for match in matches:
+        batch.append(match)
+        if len(batch) >= batch_size:
+            yield _build_record_batch(batch, schema, stats_fetcher)
+            batch = []
+    if batch:
+        yield _build_record_batch(batch, schema, stats_fetcher)
+
+
+def _build_record_batch(matches: list[Match], schema: pa.Schema, stats_fetcher: Optional[StatsFetcher]) -> pa.RecordBatch:
+    columns = {name: [getattr(match, name, None) for match in matches] for name, _ in MATCH_COLUMNS}
+
+    if stats_fetcher is not None:
+        details = stats_fetcher([match.id for match in matches if getattr(match, "id", None)])
+        for attribute in STAT_ATTRIBUTES:
+            home_values, away_values = [], []
+            for match in matches:
+                detail = details.get(getattr(match, "id", None))
+                home, away = getattr(detail, attribute) if detail is not None else (None, None)
+                home_values.append(home)
+                away_values.append(away)
+            columns[f"{attribute}_home"] = home_values
+            columns[f"{attribute}_away"] = away_values
+
+    return pa.RecordBatch.from_pydict(columns, schema=schema)
+
+
+class _StreamSink(io.RawIOBase):
+    """
+    Write-only file object that hands written bytes back to the caller instead of keeping them.
+
+    It reports the cumulative position, so writers that record absolute offsets (the Parquet footer) stay valid.
+    """
+    def __init__(self) -> None:
+        super().__init__()
+        self.chunks = []
+        self.position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self.chunks.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def stream_export(record_batches: Iterable[pa.RecordBatch], schema: pa.Schema,
+                  export_format: ExportFormat) -> Iterator[bytes]:
+    """
+    Encodes record batches in the requested format, yielding bytes as soon as each batch is written.
+
+    Args:
+        record_batches (Iterable[pa.RecordBatch]): The batches to encode.
+        schema (pa.Schema): The schema shared by all the batches.
+        export_format (ExportFormat): The output format.
+
+    Yields:
+        bytes: Consecutive chunks of the encoded file.
+    """
+    sink = _StreamSink()
+    output = pa.PythonFile(sink, mode="w")
+    if export_format == ExportFormat.PARQUET:
+        writer = pq.ParquetWriter(output, schema)
+        write = writer.write_table
+        convert = lambda batch: pa.Table.from_batches([batch], schema=schema)
+    elif export_format == ExportFormat.ARROW:
+        writer = pa.ipc.new_stream(output, schema)
+        write = writer.write_batch
+        convert = lambda batch: batch
+    else:
+        writer = pa_csv.CSVWriter(output, schema)
+        write = writer.write_batch
+        convert = lambda batch: batch
+
+    try:
+        for batch in record_batches:
+            write(convert(batch))
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    finally:
+        writer.close()
+
+    chunk = sink.drain()
+    if chunk:
+        yield chunk
+
+
+def export_matches(matches: Iterable[Match], export_format: ExportFormat,
+                   stats_fetcher: Optional[StatsFetcher] = None) -> Iterator[bytes]:
+    """
+    Streams scraped matches as a Parquet, Arrow IPC or CSV file.
+
+    Args:
+        matches (Iterable[Match]): The scraped matches, typically a lazy iterator.
+        export_format (ExportFormat): The output format.
+        stats_fetcher (StatsFetcher, optional): Joins per-match statistics when given. Defaults to None.
+
+    Returns:
+        Iterator[bytes]: Consecutive chunks of the encoded file.
+    """
+    schema = export_schema(include_stats=stats_fetcher is not None)
+    return stream_export(iter_record_batches(matches, schema, stats_fetcher), schema, export_format)
@@ -0,0 +1,72 @@
+from typing import Iterable, Optional, Type
+from fastapi import HTTPException
+from pydantic import BaseModel
+from app.middleware.negotiation import NegotiatedResponse
+
+FIELD_SEPARATOR = ","
+# Identifiers are always returned, so that sparse items can still be told apart and joined with other responses
+ALWAYS_INCLUDED = ("id",)
+
+
+def parse_fields(fields: Optional[str], model: Type[BaseModel]) -> Optional[frozenset[str]]:
+    """
+    Parses a `fields` query parameter into the set of attributes to extract and return.
+
+    Args:
+        fields (str, optional): Comma-separated attribute names (e.g., 'id,home_score,away_score').
+        model (Type[BaseModel]): The model of the listed items, whose attributes can be requested.
+
+    Returns:
+        Optional[frozenset[str]]: The requested attributes, or None to return them all.
+
+    Raises:
+        HTTPException: 400 if an attribute does not exist in the model.
+    """
+    if fields is None or not fields.strip():
+        return None
+
+    requested = {name.strip() for name in fields.split(FIELD_SEPARATOR) if name.strip()}
+    unknown = requested - set(model.model_fields)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}. Available fields: {', '.join(model.model_fields)}."
+        )
+    return frozenset(requested.union(name for name in ALWAYS_INCLUDED if name in model.model_fields))
+
+
+def wanted(fields: Optional[Iterable[str]], *names: str) -> bool:
+    """
+    Checks whether any of the given attributes has to be extracted.
+
+    Args:
+        fields (Iterable[str], optional): The requested attributes, None meaning all of them.
+        *names (str): The attributes a lookup would fill.
+
+    Returns:
+        bool: True if at least one of the attributes was requested.
+    """
+    return fields is None or any(name in fields for name in names)
+
+
+def sparse(response: BaseModel, items: str, fields: Optional[frozenset[str]]):
+    """
+    Trims the items of a response to the requested attributes.
+
+    Items extracted with a sparse fieldset lack the attributes that were not requested, so they are serialized here
+    rather than validated against the full response model.
+
+    Args:
+        response (BaseModel): The response, built with `model_construct` when `fields` is given.
+        items (str): The attribute of the response holding the item, or list of items, to trim.
+        fields (frozenset[str], optional): The requested attributes, None to return the response unchanged.
+
+    Returns:
+        The response itself, or a `NegotiatedResponse` with the trimmed items.
+    """
+    if fields is None:
+        return response
+
+    include = {name: True for name in type(response).model_fields}
+    include[items] = {"__all__": set(fields)} if isinstance(getattr(response, items), list) else set(fields)
+    return NegotiatedResponse(response.model_dump(mode="json", include=include))
@@ -0,0 +1,128 @@
+import logging
+import re
+import threading
+from datetime import datetime
+from typing import Iterable, Optional
+from sortedcontainers import SortedList
+from app.services.models.archive_schemas import Match
+from app.services.utils import get_current_season
+
+# Archive IDs end with the season (e.g., 'Italy-Serie A-2024_2025'), league IDs do not
+ARCHIVE_ID_SUFFIX = re.compile(r"-\d{4}_\d{4}$")
+# Sorts after every match ID, so that a range ending at a time includes all the matches at that time
+LAST_ID = "\U0010ffff"
+
+
+def to_archive_id(league_or_archive_id: str, now: Optional[datetime] = None) -> str:
+    """
+    Resolves a league ID to the archive of its running season, leaving archive IDs unchanged.
+
+    Args:
+        league_or_archive_id (str): A league ID (e.g., 'Italy-Serie A') or an archive ID.
+        now (datetime, optional): The reference time. Defaults to the current time.
+
+    Returns:
+        str: The archive ID.
+    """
+    if ARCHIVE_ID_SUFFIX.search(league_or_archive_id):
+        return league_or_archive_id
+    return f"{league_or_archive_id}-{get_current_season(now)}"
+
+
+class FixtureCalendar:
+    """
+    A time-sorted index over the fixtures of many archives, answering date-range queries by binary search.
+
+    Entries are `(match_date, match_id)` pairs kept in a sorted list, so a range query costs a logarithmic search
+    plus the matches returned. Each archive's fixtures are replaced incrementally: refreshing an archive only adds
+    and removes the fixtures that changed, and matches that turn into results are dropped as they are stored.
+    """
+    def __init__(self) -> None:
+        self.index = SortedList()
+        self.matches: dict[str, Match] = {}
+        self.archives: dict[str, set[str]] = {}
+        self.versions: dict[str, datetime] = {}
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.matches)
+
+    def _add(self, match: Match) -> None:
+        # Fixtures built with `model_construct` may lack a date, which cannot be ordered in the index
+        if getattr(match, "match_date", None) is None:
+            logging.debug(f"Not indexing fixture {match.id} without a date")
+            return
+        self.matches[match.id] = match
+        self.index.add((match.match_date, match.id))
+        self.archives.setdefault(match.archive, set()).add(match.id)
+
+    def _remove(self, match_id: str) -> None:
+        match = self.matches.pop(match_id, None)
+        if match is None:
+            return
+        self.index.discard((match.match_date, match_id))
+        self.archives.get(match.archive, set()).discard(match_id)
+
+    def update_archive(self, archive_id: str, fixtures: list[Match], scraped_at: datetime) -> None:
+        """
+        Replaces the fixtures of an archive with a newer list.
+
+        Lists scraped no later than the indexed one are ignored, so the same stored list can be offered repeatedly.
+
+        Args:
+            archive_id (str): The unique identifier of the archive.
+            fixtures (list[Match]): All the fixtures of the archive.
+            scraped_at (datetime): When the fixtures were scraped.
+        """
+        with self.lock:
+            version = self.versions.get(archive_id)
+            if version is not None and version >= scraped_at:
+                return
+            fixtures = {match.id: match for match in fixtures if getattr(match, "id", None)}
+            for match_id in self.archives.get(archive_id, set()) - fixtures.keys():
+                self._remove(match_id)
+            for match_id, match in fixtures.items():
+                indexed = self.matches.get(match_id)
+                if indexed is not None and indexed == match:
+                    continue
+                # Rescheduled or renamed: reindexed under its new date
+                self._remove(match_id)
+                self._add(match)
+            self.versions[archive_id] = scraped_at
+
+    def discard(self, match_ids: Iterable[str]) -> None:
+        """
+        Removes matches from the calendar, typically because they were played and stored as results.
+
+        Args:
+            match_ids (Iterable[str]): The unique identifiers of the matches.
+        """
+        with self.lock:
+            for match_id in match_ids:
+                self._remove(match_id)
+
+    def has_archive(self, archive_id: str) -> bool:
+        return archive_id in self.versions
+
+    def between(self, start: datetime, end: datetime, archive_ids: Optional[Iterable[str]] = None) -> list[Match]:
+        """
+        Lists the fixtures scheduled in a time range, in chronological order.
+
+        Args:
+            start (datetime): The beginning of the range (inclusive).
+            end (datetime): The end of the range (inclusive).
+            archive_ids (Iterable[str], optional): Only list fixtures of these archives. Defaults to all archives.
+
+        Returns:
+            list[Match]: The fixtures in the range.
+        """
+        wanted = set(archive_ids) if archive_ids is not None else None
+        with self.lock:
+            entries = list(self.index.irange((start,), (end, LAST_ID)))
+            matches = [self.matches[match_id] for _, match_id in entries]
+        if wanted is None:
+            return matches
+        return [match for match in matches if match.archive in wanted]
+
+
+calendar = FixtureCalendar()
@@ -0,0 +1,221 @@
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+import httpx
+from app.backfill import Backfill, Checkpoint
+from app.services.admission import controller, current_tickets, extra_sessions
+from app.services.metrics import metrics
+from app.services.models.job_schemas import Job, JobKind, JobProgress, JobRequest, JobResponse, JobStatus
+from app.services.models.match_schemas import MatchStats
+from app.services.repository import get_results, get_fixtures, get_result_columns, fetch_matches
+from app.services.scraper.session import NavigationSession, current_session
+from app.services.standings import compute_standings
+from app.services.store import LocalStore, safe_filename
+from config import DATA_DIR, JOB_WORKERS, JOB_RESULT_TTL, JOB_WEBHOOK_RETRIES, TIMEOUT
+from logger.logger_config import request_id
+
+# The parameters each kind of job requires
+REQUIRED_PARAMS = {
+    JobKind.RESULTS: ("archive_id",),
+    JobKind.FIXTURES: ("archive_id",),
+    JobKind.STANDINGS: ("archive_id",),
+    JobKind.BATCH: ("match_ids",),
+    JobKind.BACKFILL: ("league_id",),
+}
+PROGRESS_UNITS = {
+    JobKind.RESULTS: "matches",
+    JobKind.FIXTURES: "matches",
+    JobKind.STANDINGS: "archives",
+    JobKind.BATCH: "matches",
+    JobKind.BACKFILL: "tasks",
+}
+
+
+def missing_params(job_request: JobRequest) -> list[str]:
+    return [name for name in REQUIRED_PARAMS[job_request.kind] if not getattr(job_request, name)]
+
+
+class JobManager:
+    """
+    Runs long scrapes in the background, decoupled from the request that submitted them.
+
+    Jobs run on a pool of `JOB_WORKERS` threads, each in a browser session of its own and without a request
+    deadline, so they keep running after the client disconnects. A job stays queued until the admission controller
+    has a free browser for it, and its browser sessions then count against admission like those of a request. Finished jobs, with their result, are kept for
+    `JOB_RESULT_TTL` seconds and then discarded. Jobs are held in memory and do not survive a restart.
+    """
+    def __init__(self, workers: int = JOB_WORKERS, ttl: float = JOB_RESULT_TTL,
+                 webhook_retries: int = JOB_WEBHOOK_RETRIES) -> None:
+        self.ttl = ttl
+        self.webhook_retries = webhook_retries
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="job")
+        self.jobs = {}
+        self.requests = {}
+        self.lock = threading.Lock()
+
+    def submit(self, job_request: JobRequest) -> Job:
+        """
+        Queues a job.
+
+        Args:
+            job_request (JobRequest): The scrape to run and its parameters.
+
+        Returns:
+            Job: The queued job.
+        """
+        job = Job(
+            id=uuid.uuid4().hex,
+            kind=job_request.kind,
+            progress=JobProgress(unit=PROGRESS_UNITS[job_request.kind]),
+            created_at=datetime.now(),
+        )
+        with self.lock:
+            self._purge()
+            self.jobs[job.id] = job
+            self.requests[job.id] = job_request
+            queued = job.model_copy(deep=True)
+        metrics.increment("jobs.submitted")
+        self.executor.submit(self._run, job.id)
+        return queued
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """
+        Returns a snapshot of a job, or None if it is unknown or expired.
+        """
+        with self.lock:
+            self._purge()
+            job = self.jobs.get(job_id)
+            return job.model_copy(deep=True) if job is not None else None
+
+    def _purge(self) -> None:
+        now = datetime.now()
+        for job_id in [job_id for job_id, job in self.jobs.items() if job.expires_at and job.expires_at <= now]:
+            del self.jobs[job_id]
+            self.requests.pop(job_id, None)
+
+    def _update(self, job_id: str, **changes) -> None:
+        with self.lock:
+            job = self.jobs[job_id]
+            for name, value in changes.items():
+                setattr(job, name, value)
+
+    def _advance(self, job_id: str, done: Optional[int] = None, total: Optional[int] = None) -> None:
+        with self.lock:
+            progress = self.jobs[job_id].progress
+            progress.done = progress.done + 1 if done is None else done
+            if total is not None:
+                progress.total = total
+
+    def _run(self, job_id: str) -> None:
+        job_request = self.requests[job_id]
+        request_id.set(job_id)
+        ticket = controller.reserve(f"JOB {job_request.kind.value}")
+        # Worker sessions opened by the job (see `extra_sessions`) are added to its ticket
+        token = current_tickets.set([ticket])
+        session = NavigationSession()
+        current_session.set(session)
+        self._update(job_id, status=JobStatus.RUNNING, started_at=datetime.now())
+        logging.info(f"Job {job_id} ({job_request.kind.value}) started")
+        started = time.perf_counter()
+        try:
+            result = RUNNERS[job_request.kind](self, job_id, job_request)
+            self._update(job_id, status=JobStatus.SUCCEEDED, result=result)
+            metrics.increment("jobs.succeeded")
+            logging.info(f"Job {job_id} succeeded in {time.perf_counter() - started:.1f} s")
+        except Exception as ex:
+            self._update(job_id, status=JobStatus.FAILED, error=f"{ex.__class__.__name__}: {ex}")
+            metrics.increment("jobs.failed")
+            logging.error(f"Job {job_id} failed: {ex}")
+        finally:
+            session.close()
+            current_tickets.reset(token)
+            controller.release(ticket)
+            finished_at = datetime.now()
+            self._update(job_id, finished_at=finished_at, expires_at=finished_at + timedelta(seconds=self.ttl))
+            metrics.observe("jobs.duration", time.perf_counter() - started)
+
+        if job_request.webhook:
+            self._notify(job_request.webhook, self.get(job_id))
+
+    def _notify(self, url: str, job: Optional[Job]) -> None:
+        # The finished job is posted as GET /jobs/{id} would return it, retried with a growing delay
+        if job is None:
+            return
+        payload = JobResponse(job=job).model_dump_json()
+        for attempt in range(1, self.webhook_retries + 1):
+            try:
+                response = httpx.post(url, content=payload, headers={"Content-Type": "application/json"},
+                                      timeout=TIMEOUT)
+                response.raise_for_status()
+                metrics.increment("jobs.webhooks_sent")
+                return
+            except httpx.HTTPError as ex:
+                logging.warning(f"Webhook of job {job.id} failed (attempt {attempt}/{self.webhook_retries}): {ex}")
+                if attempt < self.webhook_retries:
+                    time.sleep(2 ** (attempt - 1))
+        metrics.increment("jobs.webhooks_failed")
+
+    def _progress(self, job_id: str) -> Callable[[], None]:
+        return lambda: self._advance(job_id)
+
+    def run_results(self, job_id: str, job_request: JobRequest) -> dict:
+        matches, _ = get_results(job_request.archive_id)
+        if job_request.include_stats:
+            self._advance(job_id, done=0, total=len(matches))
+            details = fetch_matches([match.id for match in matches if getattr(match, "id", None)],
+                                    progress=self._progress(job_id))
+            for match in matches:
+                detail = details.get(getattr(match, "id", None))
+                if detail is not None:
+                    match.stats = MatchStats.from_match(detail)
+        else:
+            self._advance(job_id, done=len(matches), total=len(matches))
+        return {"matches": [match.model_dump(mode="json") for match in matches]}
+
+    def run_fixtures(self, job_id: str, job_request: JobRequest) -> dict:
+        matches, _ = get_fixtures(job_request.archive_id)
+        self._advance(job_id, done=len(matches), total=len(matches))
+        return {"matches": [match.model_dump(mode="json") for match in matches]}
+
+    def run_standings(self, job_id: str, job_request: JobRequest) -> dict:
+        self._advance(job_id, done=0, total=1)
+        standings = compute_standings(get_result_columns(job_request.archive_id), None, None)
+        self._advance(job_id, done=1)
+        return {"standings": [rank.model_dump(mode="json") for rank in standings]}
+
+    def run_batch(self, job_id: str, job_request: JobRequest) -> dict:
+        match_ids = list(dict.fromkeys(job_request.match_ids))
+        self._advance(job_id, done=0, total=len(match_ids))
+        details = fetch_matches(match_ids, progress=self._progress(job_id))
+        return {
+            "matches": {match_id: detail.model_dump(mode="json") for match_id, detail in details.items()},
+            "missing": [match_id for match_id in match_ids if match_id not in details],
+        }
+
+    def run_backfill(self, job_id: str, job_request: JobRequest) -> dict:
+        # Same store and checkpoint as `python -m app.backfill`, so a job resumes where an earlier run stopped
+        checkpoint = Checkpoint(os.path.join(DATA_DIR, "backfill", f"{safe_filename(job_request.league_id)}.json"))
+        seasons = [season.replace("/", "_") for season in job_request.seasons] if job_request.seasons else None
+        backfill = Backfill(job_request.league_id, LocalStore(DATA_DIR), checkpoint,
+                            with_stats=job_request.include_stats,
+                            progress=lambda done, total: self._advance(job_id, done=done, total=total))
+        # The backfill scrapes in browsers of its own, one per worker, beside the job's session
+        with extra_sessions(backfill.workers):
+            backfill.run(backfill.enumerate_archives(seasons))
+        return {"tasks_done": len(checkpoint.done), "failed": checkpoint.failed}
+
+
+RUNNERS = {
+    JobKind.RESULTS: JobManager.run_results,
+    JobKind.FIXTURES: JobManager.run_fixtures,
+    JobKind.STANDINGS: JobManager.run_standings,
+    JobKind.BATCH: JobManager.run_batch,
+    JobKind.BACKFILL: JobManager.run_backfill,
+}
+
+jobs = JobManager()
@@ -0,0 +1,81 @@
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+from app.services.metrics import metrics
+from app.services.models.archive_schemas import LiveLeague
+from app.services.scraper.archive_scraper import ArchiveScraper
+from config import LIVE_FEED_TTL
+
+
+class LiveFeed:
+    """
+    The live matches of every league, shared by all requests and refreshed at most once every `ttl` seconds.
+
+    Refreshes are single-flight: when the feed expires, the first request scrapes the homepage while concurrent
+    requests wait for its result instead of opening browsers of their own.
+
+    Attributes:
+        ttl (float): The number of seconds a scraped feed is served for.
+        leagues (list[LiveLeague]): The live matches last scraped, grouped by league.
+        updated_at (datetime): When the feed was last scraped, or None if never.
+    """
+    def __init__(self, ttl: float = LIVE_FEED_TTL, clock=time.monotonic) -> None:
+        self.ttl = ttl
+        self.clock = clock
+        self.leagues: list[LiveLeague] = []
+        self.updated_at: Optional[datetime] = None
+        self.refreshed_at: Optional[float] = None
+        self.refresh_lock = threading.Lock()
+
+    def is_fresh(self) -> bool:
+        refreshed_at = self.refreshed_at
+        return refreshed_at is not None and self.clock() - refreshed_at < self.ttl
+
+    def get(self) -> tuple[list[LiveLeague], datetime]:
+        """
+        Returns the live feed, scraping it first if it expired.
+
+        Returns:
+            tuple[list[LiveLeague], datetime]: The live matches grouped by league, and when they were scraped.
+        """
+        if self.is_fresh():
+            metrics.increment("live_feed.hits")
+            return self.leagues, self.updated_at
+
+        with self.refresh_lock:
+            # Another request may have refreshed the feed while this one was waiting
+            if self.is_fresh():
+                metrics.increment("live_feed.hits")
+                return self.leagues, self.updated_at
+
+            logging.debug("Refreshing the live feed")
+            archive_scraper = ArchiveScraper()
+            try:
+                with metrics.timer("live_feed.refresh"):
+                    leagues = archive_scraper.scrape_live_feed()
+            finally:
+                archive_scraper.close()
+            self.leagues, self.updated_at, self.refreshed_at = leagues, datetime.now(), self.clock()
+            return self.leagues, self.updated_at
+
+
+def filter_leagues(leagues: list[LiveLeague], league_ids: Optional[list[str]]) -> list[LiveLeague]:
+    """
+    Keeps the leagues whose ID is in a list, ignoring case.
+
+    Args:
+        leagues (list[LiveLeague]): The live matches grouped by league.
+        league_ids (list[str], optional): The league IDs to keep. Defaults to all leagues.
+
+    Returns:
+        list[LiveLeague]: The selected leagues.
+    """
+    if not league_ids:
+        return leagues
+    wanted = {league_id.casefold() for league_id in league_ids}
+    return [league for league in leagues if league.league.casefold() in wanted]
+
+
+live_feed = LiveFeed()
@@ -0,0 +1,88 @@
+import threading
+import time
+from typing import Callable
+
+
+class Metrics:
+    """
+    Thread-safe registry of counters, timings and gauges, exposed by the /metrics endpoint.
+
+    Counters only increase, timings accumulate a count and a sum of seconds, and gauges are callables evaluated
+    when a snapshot is taken.
+    """
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.counters = {}
+        self.timings = {}
+        self.gauges = {}
+
+    def increment(self, name: str, value: int = 1) -> None:
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self.lock:
+            count, total = self.timings.get(name, (0, 0.0))
+            self.timings[name] = (count + 1, total + seconds)
+
+    def count(self, name: str) -> int:
+        """
+        Returns the value of a counter, or 0 if it was never incremented.
+        """
+        with self.lock:
+            return self.counters.get(name, 0)
+
+    def average(self, name: str) -> float:
+        """
+        Returns the mean of a timing in seconds, or 0 if it was never observed.
+        """
+        with self.lock:
+            count, total = self.timings.get(name, (0, 0.0))
+        return total / count if count else 0.0
+
+    def register_gauge(self, name: str, gauge: Callable[[], object]) -> None:
+        with self.lock:
+            self.gauges[name] = gauge
+
+    def timer(self, name: str) -> "Timer":
+        return Timer(self, name)
+
+    def snapshot(self) -> dict:
+        """
+        Returns the current value of every metric.
+
+        Returns:
+            dict: Counters, timings (count, total and mean seconds) and gauges, keyed by name.
+        """
+        with self.lock:
+            counters = dict(self.counters)
+            timings = dict(self.timings)
+            gauges = dict(self.gauges)
+        return {
+            "counters": counters,
+            "timings": {
+                name: {"count": count, "total_seconds": round(total, 3), "mean_seconds": round(total / count, 3)}
+                for name, (count, total) in timings.items()
+            },
+            "gauges": {name: gauge() for name, gauge in gauges.items()},
+        }
+
+
+class Timer:
+    """
+    Context manager recording the duration of a block as a timing.
+    """
+    def __init__(self, metrics: Metrics, name: str) -> None:
+        self.metrics = metrics
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> "Timer":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.metrics.observe(self.name, time.perf_counter() - self.start)
+
+
+metrics = Metrics()
@@ -1,6 +1,8 @@
+from enum import Enum
 from typing import List, Optional
 from pydantic import BaseModel, Field
 from datetime import datetime
+from app.services.models.match_schemas import MatchStats
 from app.services.models.utils import Pagination
 
 
@@ -14,6 +16,7 @@ class Match(BaseModel):
     away: str = Field(..., description="The away team of the match")
     home_score: int = Field(0, description="The home team's score in the match")
     away_score: int = Field(0, description="The away team's score in the match")
+    stats: Optional[MatchStats] = Field(None, description="The statistics of the match, when requested")
 
 
 class LiveMatch(BaseModel):
@@ -27,6 +30,12 @@ class LiveMatch(BaseModel):
     away_score: int = Field(0, description="The away team's score in the live match")
 
 
+class LiveLeague(BaseModel):
+    league: str = Field(..., description="The unique identifier of the league (e.g., 'Italy-Serie A')")
+    archive: str = Field(..., description="The unique identifier of the league's current archive")
+    matches: List[LiveMatch] = Field(default_factory=list, description="The live matches of the league")
+
+
 class Archive(BaseModel):
     id: str = Field(..., description="The unique identifier of the archive")
     league: str = Field(..., description="The unique identifier of the league associated with the archive")
@@ -57,6 +66,12 @@ class Rank(BaseModel):
     points: int = Field(0, description="The total points accumulated")
 
 
+class ExportFormat(str, Enum):
+    PARQUET = "parquet"
+    ARROW = "arrow"
+    CSV = "csv"
+
+
 class ArchiveResponse(BaseModel):
     archive: Archive
 
@@ -64,11 +79,35 @@ class ArchiveResponse(BaseModel):
 class MatchListResponse(BaseModel):
     matches: List[Match]
     pagination: Optional[Pagination] = Field(None, description="Pagination metadata")
+    partial: bool = Field(False, description="Whether the request's deadline cut the list short")
 
 
 class ListLiveMatch(BaseModel):
     matches: List[LiveMatch]
 
 
+class LiveFeedResponse(BaseModel):
+    leagues: List[LiveLeague] = Field(..., description="The live matches, grouped by league")
+    total_matches: int = Field(0, description="The number of live matches listed")
+    updated_at: datetime = Field(..., description="When the live matches were scraped")
+
+
+class FixtureCalendarResponse(BaseModel):
+    matches: List[Match] = Field(..., description="The fixtures in the time range, in chronological order")
+    total_matches: int = Field(0, description="The number of fixtures listed")
+    missing: List[str] = Field(default_factory=list, description="The archives whose fixtures could not be retrieved")
+    partial: bool = Field(False, description="Whether the request's deadline cut the list short")
+
+
+class SeasonPackResponse(BaseModel):
+    archive: Archive
+    results: List[Match] = Field(..., description="All the results of the archive")
+    fixtures: List[Match] = Field(..., description="All the fixtures of the archive")
+    standings: List[Rank] = Field(..., description="The standings, as shown on the archive's standings tab")
+    partial: bool = Field(False, description="Whether the request's deadline cut the results or fixtures short")
+
+
 class StandingResponse(BaseModel):
     standings: List[Rank]
+    discrepancies: Optional[List[str]] = Field(None, description="Differences with the scraped standings, when cross-checked")
+    partial: bool = Field(False, description="Whether the request's deadline cut the results short")
@@ -0,0 +1,52 @@
+from datetime import datetime
+from enum import Enum
+from typing import Any, List, Optional
+from pydantic import BaseModel, Field
+
+
+class JobKind(str, Enum):
+    RESULTS = "results"
+    FIXTURES = "fixtures"
+    STANDINGS = "standings"
+    BATCH = "batch"
+    BACKFILL = "backfill"
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class JobRequest(BaseModel):
+    kind: JobKind = Field(..., description="The scrape to run")
+    archive_id: Optional[str] = Field(None, description="The archive of a results, fixtures or standings job")
+    match_ids: Optional[List[str]] = Field(None, description="The matches of a batch job")
+    league_id: Optional[str] = Field(None, description="The league of a backfill job")
+    seasons: Optional[List[str]] = Field(None, description="The seasons of a backfill job (e.g., '2023_2024'), all if omitted")
+    include_stats: bool = Field(False, description="Whether results and backfill jobs also scrape match statistics")
+    webhook: Optional[str] = Field(None, description="URL receiving a POST of the job once it is finished")
+
+
+class JobProgress(BaseModel):
+    done: int = Field(0, description="The number of units done")
+    total: Optional[int] = Field(None, description="The number of units to do, when known")
+    unit: str = Field(..., description="What is counted (e.g., 'matches', 'tasks')")
+
+
+class Job(BaseModel):
+    id: str = Field(..., description="The unique identifier of the job")
+    kind: JobKind = Field(..., description="The scrape the job runs")
+    status: JobStatus = Field(JobStatus.QUEUED, description="The state of the job")
+    progress: JobProgress = Field(..., description="The progress of the job")
+    created_at: datetime = Field(..., description="When the job was submitted")
+    started_at: Optional[datetime] = Field(None, description="When the job started running")
+    finished_at: Optional[datetime] = Field(None, description="When the job finished")
+    expires_at: Optional[datetime] = Field(None, description="When the finished job and its result are discarded")
+    result: Optional[Any] = Field(None, description="The result of the job, as the matching endpoint would return it")
+    error: Optional[str] = Field(None, description="Why the job failed")
+
+
+class JobResponse(BaseModel):
+    job: Job
@@ -1,28 +1,42 @@
 from datetime import datetime
-from typing import Tuple
+from typing import Optional, Tuple
 from pydantic import BaseModel, Field
 
 
-class Match(BaseModel):
+class MatchInfo(BaseModel):
     id: str = Field(default="", description="The id of the match")
     round: int = Field(default=0, description="The round of the match")
-    match_date: datetime = Field(default=None, description="The date of the match")
+    match_date: Optional[datetime] = Field(default=None, description="The date of the match")
     home: str = Field(default="", description="The home team of the match")
     away: str = Field(default="", description="The away team of the match")
     home_score: int = Field(default=0, description="The home score of the match")
     away_score: int = Field(default=0, description="The away score of the match")
-    expected_goals_xg: Tuple[float, float] = Field(default=(None, None), description="The expected goals of the match")
-    ball_possession: Tuple[int, int] = Field(default=(None, None), description="The ball possession of the match")
-    goal_attempts: Tuple[int, int] = Field(default=(None, None), description="The goal attempts of the match")
-    shots_on_goal: Tuple[int, int] = Field(default=(None, None), description="The shots on the goal of the match")
-    shots_off_goal: Tuple[int, int] = Field(default=(None, None), description="The shots off the goal of the match")
-    big_chances: Tuple[int, int] = Field(default=(None, None), description="The big chances of the match")
-    corner_kicks: Tuple[int, int] = Field(default=(None, None), description="The corner kicks of the match")
-    free_kicks: Tuple[int, int] = Field(default=(None, None), description="The free kicks of the match")
-    offsides: Tuple[int, int] = Field(default=(None, None), description="The offsides of the match")
-    fouls: Tuple[int, int] = Field(default=(None, None), description="The fouls of the match")
-    yellow_cards: Tuple[int, int] = Field(default=(None, None), description="The yellow cards of the match")
-    red_cards: Tuple[int, int] = Field(default=(None, None), description="The red cards of the match")
+    status: str = Field(default="", description="The status of the match (e.g., 'Finished')")
+    played: bool = Field(default=False, description="Whether the match has started and its stats are available")
+
+
+class MatchStats(BaseModel):
+    expected_goals_xg: Tuple[Optional[float], Optional[float]] = Field(default=(None, None), description="The expected goals of the match")
+    ball_possession: Tuple[Optional[int], Optional[int]] = Field(default=(None, None), description="The ball possession of the match")
+    goal_attempts: Tuple[Optional[int], Optional[int]] = Field(default=(None, None), description="The goal attempts of the match")
+    shots_on_goal: Tuple[Optional[int], Optional[int]] = Field(default=(None, None), description="The shots on the goal of the match")
+    shots_off_goal: Tuple[Optional[int], Optional[int]] = Field(default=(None, None), description="The shots off the goal of the match")
+    big_chances: Tuple[Optional[int], Optional[int]] = Field(default=(None, None), description="The big chances of the match")
+    corner_kicks: Tuple[Optional[int], Optional[int]] = Field(default=(None, None), description="The corner kicks of the match")
+    free_kicks: Tuple[Optional[int], Optional[int]] = Field(default=(None, None), description="The free kicks of the match")
+    offsides: Tuple[Optional[int], Optional[int]] = Field(default=(None, None), description="The offsides of the match")
+    fouls: Tuple[Optional[int], Optional[int]] = Field(default=(None, None), description="The fouls of the match")
+    yellow_cards: Tuple[Optional[int], Optional[int]] = Field(default=(None, None), description="The yellow cards of the match")
+    red_cards: Tuple[Optional[int], Optional[int]] = Field(default=(None, None), description="The red cards of the match")
+
+    @classmethod
+    def from_match(cls, match: "Match") -> "MatchStats":
+        return cls(**match.model_dump(include=set(cls.model_fields)))
+
+
+# Pydantic orders inherited fields from the last base to the first, so the match info comes before its stats
+class Match(MatchStats, MatchInfo):
+    pass
 
 
 class MatchResponse(BaseModel):
@@ -30,4 +44,5 @@ class MatchResponse(BaseModel):
 
 
 class MatchListResponse(BaseModel):
-    matches: list[Match]
\ No newline at end of file
+    matches: list[Match]
+    partial: bool = Field(False, description="Whether the request's deadline left some matches out")
\ No newline at end of file
@@ -0,0 +1,68 @@
+from enum import Enum
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+class Venue(str, Enum):
+    ALL = "all"
+    HOME = "home"
+    AWAY = "away"
+
+
+class StatLine(BaseModel):
+    name: str = Field(..., description="The name of the statistic (e.g., 'expected_goals_xg')")
+    matches: int = Field(0, description="The number of matches with this statistic available")
+    total_for: Optional[float] = Field(None, description="The team's total over those matches")
+    total_against: Optional[float] = Field(None, description="The opponents' total over those matches")
+    average_for: Optional[float] = Field(None, description="The team's average per match")
+    average_against: Optional[float] = Field(None, description="The opponents' average per match")
+
+
+class TeamSplit(BaseModel):
+    team: str = Field(..., description="The name of the team")
+    venue: Venue = Field(Venue.ALL, description="The venue the figures are restricted to")
+    matches_played: int = Field(0, description="The number of matches played")
+    wins: int = Field(0, description="The number of matches won")
+    draws: int = Field(0, description="The number of matches drawn")
+    losses: int = Field(0, description="The number of matches lost")
+    goals_for: int = Field(0, description="The number of goals scored")
+    goals_against: int = Field(0, description="The number of goals conceded")
+    points: int = Field(0, description="The points accumulated")
+    points_per_match: Optional[float] = Field(None, description="The average points per match")
+    stats: List[StatLine] = Field(default_factory=list, description="Totals and averages of each match statistic")
+
+
+class FormPoint(BaseModel):
+    match_id: str = Field(..., description="The unique identifier of the match closing the window")
+    round: int = Field(..., description="The round of that match")
+    points: float = Field(..., description="The average points per match over the window")
+    goals_for: float = Field(..., description="The average goals scored over the window")
+    goals_against: float = Field(..., description="The average goals conceded over the window")
+    expected_goals_for: Optional[float] = Field(None, description="The average xG over the window, when available")
+
+
+class TeamForm(BaseModel):
+    window: int = Field(..., description="The number of matches in the rolling window")
+    last_results: str = Field("", description="The results of the last matches, oldest first (e.g., 'WDLWW')")
+    rolling: List[FormPoint] = Field(default_factory=list, description="The rolling averages after each match")
+
+
+class TeamStats(BaseModel):
+    team: str = Field(..., description="The name of the team")
+    archive: str = Field(..., description="The unique identifier of the archive")
+    overall: TeamSplit = Field(..., description="The figures over all matches")
+    home: TeamSplit = Field(..., description="The figures over home matches")
+    away: TeamSplit = Field(..., description="The figures over away matches")
+    form: TeamForm = Field(..., description="The rolling-window form")
+
+
+class TeamStatsResponse(BaseModel):
+    team_stats: TeamStats
+    partial: bool = Field(False, description="Whether the request's deadline cut the results short")
+
+
+class TeamStatsTableResponse(BaseModel):
+    teams: List[TeamSplit]
+    matches_with_stats: int = Field(0, description="The number of matches whose statistics are known")
+    total_matches: int = Field(0, description="The number of matches in the archive")
+    partial: bool = Field(False, description="Whether the request's deadline cut the results short")
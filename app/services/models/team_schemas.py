@@ -0,0 +1,26 @@
+from enum import Enum
+from typing import List
+from pydantic import BaseModel, Field
+from app.services.models.archive_schemas import Match
+
+
+class MatchStatus(str, Enum):
+    ALL = "all"
+    PLAYED = "played"
+    UPCOMING = "upcoming"
+
+
+class TeamMatchesResponse(BaseModel):
+    team: str = Field(..., description="The name of the team")
+    aliases: List[str] = Field(default_factory=list, description="The names of the team across competitions")
+    matches: List[Match] = Field(..., description="The matches of the team, in chronological order")
+    total_matches: int = Field(0, description="The number of matches listed")
+
+
+class HeadToHeadResponse(BaseModel):
+    team: str = Field(..., description="The name of the first team")
+    opponent: str = Field(..., description="The name of the second team")
+    matches: List[Match] = Field(..., description="The matches between both teams, most recent first")
+    wins: int = Field(0, description="The number of matches won by the first team")
+    draws: int = Field(0, description="The number of drawn matches")
+    losses: int = Field(0, description="The number of matches won by the second team")
@@ -0,0 +1,64 @@
+import base64
+import logging
+import orjson
+from selenium import webdriver
+
+# Resource types whose bodies are kept: the data feeds pages are rendered from, not assets
+CAPTURED_RESOURCE_TYPES = {"Document", "XHR", "Fetch"}
+
+
+def enable_network_capture(options: webdriver.ChromeOptions) -> None:
+    """
+    Makes Chrome log network events, so that `read_responses` can collect the responses of loaded pages.
+
+    Args:
+        options (webdriver.ChromeOptions): The options of the driver to create.
+    """
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+
+def read_responses(driver: webdriver.Chrome) -> list[dict]:
+    """
+    Collects the document and XHR/fetch responses received since the previous call.
+
+    Reading the performance log drains it. Bodies that Chrome no longer holds are recorded without a body.
+
+    Args:
+        driver (webdriver.Chrome): A driver created with network capture enabled.
+
+    Returns:
+        list[dict]: The responses, each with its url, status, mime_type, type and body (text, or None).
+    """
+    try:
+        entries = driver.get_log("performance")
+    except Exception as ex:
+        logging.debug(f"Network capture unavailable: {ex}")
+        return []
+
+    responses = []
+    for entry in entries:
+        message = orjson.loads(entry["message"])["message"]
+        if message.get("method") != "Network.responseReceived":
+            continue
+        params = message["params"]
+        if params.get("type") not in CAPTURED_RESOURCE_TYPES:
+            continue
+
+        response = params["response"]
+        body = None
+        try:
+            result = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": params["requestId"]})
+            body = result["body"]
+            if result.get("base64Encoded"):
+                body = base64.b64decode(body).decode("utf-8", errors="replace")
+        except Exception as ex:
+            logging.debug(f"Body of {response['url']} unavailable: {ex}")
+
+        responses.append({
+            "url": response["url"],
+            "status": response.get("status"),
+            "mime_type": response.get("mimeType"),
+            "type": params["type"],
+            "body": body,
+        })
+    return responses
@@ -0,0 +1,141 @@
+import hashlib
+import os
+import threading
+from datetime import datetime
+from typing import Iterator, Optional
+import orjson
+import zstandard
+from app.services.metrics import metrics
+from app.services.store import write_atomic
+from config import PAGE_ARCHIVE_DIR, PAGE_ARCHIVE_LEVEL
+
+PAGES_DIR = "pages"
+INDEX_DIR = "index"
+PAGE_SUFFIX = ".html.zst"
+INDEX_SUFFIX = ".jsonl"
+
+
+def content_hash(page_source: str) -> str:
+    return hashlib.sha256(page_source.encode()).hexdigest()
+
+
+class PageArchive:
+    """
+    Every page fetched by the scrapers, zstd-compressed and stored once per distinct content.
+
+    Layout:
+        <root>/pages/<hash[:2]>/<hash>.html.zst    the page sources, named by the SHA-256 of their content
+        <root>/index/<capture day>.jsonl           one line per fetch: url, current_url, captured_at, hash
+
+    A page fetched again unchanged only adds an index line. The archive can be replayed like the recordings, so the
+    current extractors can be run over old pages without the site (see `app.reparse`).
+    """
+    def __init__(self, root: str = PAGE_ARCHIVE_DIR, level: int = PAGE_ARCHIVE_LEVEL) -> None:
+        self.root = root
+        self.level = level
+        self.lock = threading.Lock()
+        self.captures_by_url = None
+
+    def page_path(self, page_hash: str) -> str:
+        return os.path.join(self.root, PAGES_DIR, page_hash[:2], f"{page_hash}{PAGE_SUFFIX}")
+
+    def save(self, url: str, current_url: str, page_source: str, captured_at: Optional[datetime] = None) -> str:
+        """
+        Archives a fetched page, storing its source only if that content was never archived.
+
+        Args:
+            url (str): The URL the scraper navigated to.
+            current_url (str): The URL the browser actually ended on (e.g., after redirects).
+            page_source (str): The HTML of the page.
+            captured_at (datetime, optional): The fetch time. Defaults to now.
+
+        Returns:
+            str: The content hash of the page.
+        """
+        captured_at = captured_at or datetime.now()
+        page_hash = content_hash(page_source)
+        path = self.page_path(page_hash)
+        if os.path.exists(path):
+            metrics.increment("page_archive.duplicates")
+        else:
+            write_atomic(path, zstandard.ZstdCompressor(level=self.level).compress(page_source.encode()))
+            metrics.increment("page_archive.pages_stored")
+
+        entry = {"url": url, "current_url": current_url, "captured_at": captured_at.isoformat(), "hash": page_hash}
+        index_path = os.path.join(self.root, INDEX_DIR, f"{captured_at.date().isoformat()}{INDEX_SUFFIX}")
+        with self.lock:
+            os.makedirs(os.path.dirname(index_path), exist_ok=True)
+            with open(index_path, "ab") as file:
+                file.write(orjson.dumps(entry) + b"\n")
+        return page_hash
+
+    def entries(self, since: Optional[datetime] = None, until: Optional[datetime] = None) -> Iterator[dict]:
+        """
+        Iterates over the index, oldest fetch first.
+
+        Args:
+            since (datetime, optional): Skips pages fetched before this time. Defaults to the first fetch.
+            until (datetime, optional): Skips pages fetched after this time. Defaults to the last fetch.
+
+        Yields:
+            dict: The fetches, each with its url, current_url, captured_at (datetime) and hash.
+        """
+        try:
+            names = sorted(name for name in os.listdir(os.path.join(self.root, INDEX_DIR)) if name.endswith(INDEX_SUFFIX))
+        except FileNotFoundError:
+            return
+        for name in names:
+            day = name[:-len(INDEX_SUFFIX)]
+            if (since and day < since.date().isoformat()) or (until and day > until.date().isoformat()):
+                continue
+            entries = []
+            with open(os.path.join(self.root, INDEX_DIR, name), "rb") as file:
+                for line in file:
+                    if not line.strip():
+                        continue
+                    entry = orjson.loads(line)
+                    entry["captured_at"] = datetime.fromisoformat(entry["captured_at"])
+                    if (since is None or entry["captured_at"] >= since) and (until is None or entry["captured_at"] <= until):
+                        entries.append(entry)
+            yield from sorted(entries, key=lambda entry: entry["captured_at"])
+
+    def read(self, page_hash: str) -> str:
+        """
+        Returns the source of an archived page.
+        """
+        with open(self.page_path(page_hash), "rb") as file:
+            return zstandard.ZstdDecompressor().decompress(file.read()).decode()
+
+    def load(self, url: str, at: Optional[datetime] = None) -> Optional[dict]:
+        """
+        Loads the latest fetch of a URL made no later than `at`, in the format of the recordings, for `ReplayDriver`.
+
+        The index is read once and kept in memory, as the archive is only replayed offline.
+
+        Args:
+            url (str): The URL the scraper navigates to.
+            at (datetime, optional): Replays the page as it was at this time. Defaults to the latest fetch.
+
+        Returns:
+            Optional[dict]: The page, with no network responses, or None if the URL was not fetched by then.
+        """
+        with self.lock:
+            if self.captures_by_url is None:
+                self.captures_by_url = {}
+                for entry in self.entries():
+                    self.captures_by_url.setdefault(entry["url"], []).append(entry)
+            captures = self.captures_by_url.get(url, [])
+        captures = [entry for entry in captures if at is None or entry["captured_at"] <= at]
+        if not captures:
+            return None
+        entry = captures[-1]
+        return {
+            "url": url,
+            "current_url": entry["current_url"],
+            "captured_at": entry["captured_at"].isoformat(),
+            "page_source": self.read(entry["hash"]),
+            "responses": [],
+        }
+
+
+page_archive = PageArchive()
@@ -0,0 +1,99 @@
+import gzip
+import hashlib
+import os
+from datetime import datetime
+from typing import Optional
+import orjson
+from app.services.store import write_atomic
+from config import RECORDINGS_DIR
+
+CAPTURE_OFF = "off"
+CAPTURE_RECORD = "record"
+CAPTURE_REPLAY = "replay"
+
+TIMESTAMP_FORMAT = "%Y%m%dT%H%M%S%f"
+
+
+class RecordingNotFound(Exception):
+    """
+    Raised in replay mode when a page was never recorded.
+    """
+    def __init__(self, url: str) -> None:
+        super().__init__(f"No recording of {url}")
+        self.url = url
+
+
+class RecordingStore:
+    """
+    Compressed snapshots of the pages scraped in capture mode, keyed by URL and capture time.
+
+    Layout:
+        <root>/<sha1 of the URL>/<capture time>.json.gz
+
+    Each snapshot holds the page source as the scraper last saw it (after any expansion) and the network responses
+    received while the page was open.
+    """
+    def __init__(self, root: str = RECORDINGS_DIR) -> None:
+        self.root = root
+
+    def url_dir(self, url: str) -> str:
+        return os.path.join(self.root, hashlib.sha1(url.encode()).hexdigest())
+
+    def save(self, url: str, current_url: str, page_source: str, responses: list[dict],
+             captured_at: Optional[datetime] = None) -> str:
+        """
+        Stores a snapshot of a page.
+
+        Args:
+            url (str): The URL the scraper navigated to, used as key.
+            current_url (str): The URL the browser actually ended on (e.g., after redirects).
+            page_source (str): The HTML of the page.
+            responses (list[dict]): The network responses received while the page was open.
+            captured_at (datetime, optional): The capture time. Defaults to now.
+
+        Returns:
+            str: The path of the snapshot.
+        """
+        captured_at = captured_at or datetime.now()
+        recording = {
+            "url": url,
+            "current_url": current_url,
+            "captured_at": captured_at.isoformat(),
+            "page_source": page_source,
+            "responses": responses,
+        }
+        path = os.path.join(self.url_dir(url), f"{captured_at.strftime(TIMESTAMP_FORMAT)}.json.gz")
+        write_atomic(path, gzip.compress(orjson.dumps(recording), compresslevel=6))
+        return path
+
+    def captures(self, url: str) -> list[datetime]:
+        """
+        Lists the capture times of a URL, oldest first.
+        """
+        try:
+            names = os.listdir(self.url_dir(url))
+        except FileNotFoundError:
+            return []
+        return sorted(datetime.strptime(name[:-len(".json.gz")], TIMESTAMP_FORMAT)
+                      for name in names if name.endswith(".json.gz"))
+
+    def load(self, url: str, at: Optional[datetime] = None) -> Optional[dict]:
+        """
+        Loads the latest snapshot of a URL captured no later than `at`.
+
+        Args:
+            url (str): The URL the scraper navigates to.
+            at (datetime, optional): Replays the page as it was at this time. Defaults to the latest capture.
+
+        Returns:
+            Optional[dict]: The snapshot, or None if the URL was not captured by then.
+        """
+        captures = [captured_at for captured_at in self.captures(url) if at is None or captured_at <= at]
+        if not captures:
+            return None
+        path = os.path.join(self.url_dir(url), f"{captures[-1].strftime(TIMESTAMP_FORMAT)}.json.gz")
+        with open(path, "rb") as file:
+            return orjson.loads(gzip.decompress(file.read()))
+
+
+recordings = RecordingStore()
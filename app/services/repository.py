@@ -0,0 +1,494 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Optional
+from selenium.common.exceptions import WebDriverException
+from app.services import deadline
+from app.services.admission import extra_sessions
+from app.services.circuit_breaker import CircuitOpenError
+from app.services.deadline import DeadlineExceeded, current_deadline
+from app.services.fixture_calendar import calendar
+from app.services.metrics import metrics
+from app.services.models.archive_schemas import Archive, Match
+from app.services.models.match_schemas import Match as MatchDetail
+from app.services.scraper.archive_scraper import ArchiveScraper, SECTION_RESULTS, SECTION_FIXTURES, SECTION_STANDINGS
+from app.services.scraper.match_scraper import MatchScraper, is_final
+from app.services.scraper.session import NavigationSession, current_session
+from app.services.standings import ResultColumns
+from app.services.store import store, RESULTS, FIXTURES
+from app.services.team_stats import StatsColumns
+from config import RESULTS_TTL, FIXTURES_TTL, STATS_FETCH_WORKERS
+from logger.logger_config import request_id
+
+_columns_cache = {}
+_stats_cache = {}
+_columns_lock = threading.Lock()
+
+PACK_SECTIONS = (SECTION_RESULTS, SECTION_FIXTURES, SECTION_STANDINGS)
+
+
+def is_completed_season(season: str, now: Optional[datetime] = None) -> bool:
+    """
+    Checks whether a season is over, assuming European seasons that end by July.
+
+    Args:
+        season (str): The season of an archive (e.g., '2023_2024').
+        now (datetime, optional): The reference time. Defaults to the current time.
+
+    Returns:
+        bool: True if the season cannot receive new results anymore.
+    """
+    now = now or datetime.now()
+    end_year = int(season.split("_")[-1])
+    return end_year < now.year or (end_year == now.year and now.month > 7)
+
+
+def is_fresh(archive_id: str, scraped_at: datetime) -> bool:
+    """
+    Checks whether stored archive data can still be served.
+
+    Data of completed seasons never expires; data of running seasons expires after `RESULTS_TTL` seconds.
+
+    Args:
+        archive_id (str): The unique identifier of the archive.
+        scraped_at (datetime): When the data was scraped.
+
+    Returns:
+        bool: True if the stored data is fresh.
+    """
+    return is_completed_season(archive_id.rsplit("-", 1)[-1]) or \
+        (datetime.now() - scraped_at).total_seconds() < RESULTS_TTL
+
+
+def get_results(archive_id: str) -> tuple[list[Match], datetime]:
+    """
+    Returns all the results of an archive, from the local store when fresh enough, scraping them otherwise.
+
+    If upstream is unavailable (open circuit or browser failure), stale stored results are served instead.
+
+    Args:
+        archive_id (str): The unique identifier of the archive.
+
+    Returns:
+        tuple[list[Match], datetime]: The results and the time they were scraped.
+    """
+    loaded = store.load_archive_section(archive_id, RESULTS)
+    if loaded is not None and is_fresh(archive_id, loaded[1]):
+        logging.debug(f"Results of archive {archive_id} served from the local store")
+        return loaded
+
+    logging.debug(f"Scraping results of archive {archive_id}")
+    archive_scraper = ArchiveScraper()
+    try:
+        matches, _ = archive_scraper.scrape_results_by_archive(archive_id, 0, 0)
+    except (CircuitOpenError, WebDriverException) as ex:
+        if loaded is None:
+            raise
+        logging.warning(f"Serving stale results of archive {archive_id} scraped at {loaded[1]}: {ex}")
+        metrics.increment("results.stale_served")
+        return loaded
+    finally:
+        archive_scraper.close()
+    if deadline.is_partial():
+        logging.debug(f"Results of archive {archive_id} cut short by the request deadline, not stored")
+        return matches, datetime.now()
+    store.save_archive_section(archive_id, RESULTS, matches)
+    # Played fixtures leave the calendar as soon as their results are known
+    calendar.discard(match.id for match in matches)
+    return matches, datetime.now()
+
+
+def has_fresh_results(archive_id: str) -> bool:
+    """
+    Checks, without reading them, whether the stored results of an archive can be served without scraping.
+
+    Args:
+        archive_id (str): The unique identifier of the archive.
+
+    Returns:
+        bool: True if the results are stored and fresh.
+    """
+    version = store.archive_section_version(archive_id, RESULTS)
+    return version is not None and is_fresh(archive_id, datetime.fromtimestamp(version / 1e9))
+
+
+def get_fixtures(archive_id: str) -> tuple[list[Match], datetime]:
+    """
+    Returns all the fixtures of an archive, from the local store when fresh enough, scraping them otherwise.
+
+    The fixtures are also indexed in the fixture calendar. If upstream is unavailable, stale stored fixtures are
+    served instead.
+
+    Args:
+        archive_id (str): The unique identifier of the archive.
+
+    Returns:
+        tuple[list[Match], datetime]: The fixtures and the time they were scraped.
+    """
+    loaded = store.load_archive_section(archive_id, FIXTURES)
+    if loaded is not None and has_fresh_fixtures(archive_id):
+        logging.debug(f"Fixtures of archive {archive_id} served from the local store")
+        calendar.update_archive(archive_id, *loaded)
+        return loaded
+
+    logging.debug(f"Scraping fixtures of archive {archive_id}")
+    archive_scraper = ArchiveScraper()
+    try:
+        matches, _ = archive_scraper.scrape_fixtures_by_archive(archive_id, 0, 0)
+    except (CircuitOpenError, WebDriverException) as ex:
+        if loaded is None:
+            raise
+        logging.warning(f"Serving stale fixtures of archive {archive_id} scraped at {loaded[1]}: {ex}")
+        metrics.increment("fixtures.stale_served")
+        calendar.update_archive(archive_id, *loaded)
+        return loaded
+    finally:
+        archive_scraper.close()
+    scraped_at = datetime.now()
+    if deadline.is_partial():
+        logging.debug(f"Fixtures of archive {archive_id} cut short by the request deadline, not stored")
+        return matches, scraped_at
+    store.save_archive_section(archive_id, FIXTURES, matches)
+    calendar.update_archive(archive_id, matches, scraped_at)
+    return matches, scraped_at
+
+
+def has_fresh_fixtures(archive_id: str) -> bool:
+    """
+    Checks, without reading them, whether the stored fixtures of an archive can be served without scraping.
+
+    Fixtures of completed seasons never expire; those of running seasons expire after `FIXTURES_TTL` seconds.
+
+    Args:
+        archive_id (str): The unique identifier of the archive.
+
+    Returns:
+        bool: True if the fixtures are stored and fresh.
+    """
+    version = store.archive_section_version(archive_id, FIXTURES)
+    if version is None:
+        return False
+    scraped_at = datetime.fromtimestamp(version / 1e9)
+    return is_completed_season(archive_id.rsplit("-", 1)[-1]) or \
+        (datetime.now() - scraped_at).total_seconds() < FIXTURES_TTL
+
+
+def index_fixtures(archive_ids: list[str], workers: int = STATS_FETCH_WORKERS) -> list[str]:
+    """
+    Brings the fixture calendar up to date for several archives, scraping the stale ones concurrently.
+
+    Each worker thread opens one navigation session and reuses it for all the archives it refreshes. Once the
+    request's deadline is reached, the remaining archives are skipped and the request is marked as partial.
+
+    Args:
+        archive_ids (list[str]): The unique identifiers of the archives.
+        workers (int, optional): The maximum number of browsers to open. Defaults to `STATS_FETCH_WORKERS`.
+
+    Returns:
+        list[str]: The archives whose fixtures could not be indexed.
+    """
+    stale = []
+    for archive_id in dict.fromkeys(archive_ids):
+        if has_fresh_fixtures(archive_id):
+            calendar.update_archive(archive_id, *store.load_archive_section(archive_id, FIXTURES))
+        else:
+            stale.append(archive_id)
+
+    if not stale:
+        return []
+
+    local = threading.local()
+    sessions = []
+    sessions_lock = threading.Lock()
+    failed = []
+    request_deadline = current_deadline.get()
+    request_log_id = request_id.get()
+
+    def index(archive_id: str) -> None:
+        current_deadline.set(request_deadline)
+        request_id.set(request_log_id)
+        if deadline.expired():
+            deadline.mark_partial()
+            failed.append(archive_id)
+            return
+
+        # One session, hence one browser, per worker thread
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = NavigationSession()
+            with sessions_lock:
+                sessions.append(session)
+        current_session.set(session)
+        try:
+            get_fixtures(archive_id)
+        except DeadlineExceeded:
+            deadline.mark_partial()
+            failed.append(archive_id)
+        except Exception as ex:
+            logging.warning(f"Unable to index fixtures of archive {archive_id}: {ex}")
+            failed.append(archive_id)
+
+    try:
+        workers = max(1, min(workers, len(stale)))
+        with extra_sessions(workers), ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(index, stale))
+    finally:
+        for session in sessions:
+            try:
+                session.close()
+            except Exception as ex:
+                logging.debug(f"Unable to close browser: {ex}")
+
+    return failed
+
+
+def get_season_pack(archive_id: str, parallel: bool = False) -> Optional[tuple[Archive, dict[str, list]]]:
+    """
+    Scrapes the results, fixtures and standings of an archive, resolving the archive only once.
+
+    Sections are scraped one after the other in the request's browser, or with `parallel`, each in a browser session
+    of its own (a tab of a pooled browser when `TABS_PER_BROWSER` is above 1), the request's browser taking the first.
+
+    Args:
+        archive_id (str): The unique identifier of the archive.
+        parallel (bool, optional): Whether to scrape the sections concurrently. Defaults to False.
+
+    Returns:
+        Optional[tuple[Archive, dict[str, list]]]: The archive and its sections keyed by name, or None if the archive
+            does not exist.
+    """
+    archive_scraper = ArchiveScraper()
+    try:
+        archive = archive_scraper.scrape_archive(archive_id)
+        if archive is None:
+            return None
+
+        if not parallel:
+            return archive, {section: archive_scraper.scrape_section(archive, section) for section in PACK_SECTIONS}
+
+        request_deadline = current_deadline.get()
+        request_log_id = request_id.get()
+
+        def scrape(section: str) -> list:
+            current_deadline.set(request_deadline)
+            request_id.set(request_log_id)
+            session = NavigationSession()
+            current_session.set(session)
+            try:
+                return ArchiveScraper(session=session).scrape_section(archive, section)
+            finally:
+                session.close()
+
+        first, *others = PACK_SECTIONS
+        with extra_sessions(len(others)), ThreadPoolExecutor(max_workers=len(others)) as executor:
+            futures = {section: executor.submit(scrape, section) for section in others}
+            sections = {first: archive_scraper.scrape_section(archive, first)}
+            sections.update((section, future.result()) for section, future in futures.items())
+        return archive, sections
+    finally:
+        archive_scraper.close()
+
+
+def get_result_columns(archive_id: str) -> ResultColumns:
+    """
+    Returns the results of an archive in columnar form.
+
+    The arrays are kept in memory and reused as long as the stored results are unchanged and fresh, so repeated
+    queries neither read the store nor open a browser.
+
+    Args:
+        archive_id (str): The unique identifier of the archive.
+
+    Returns:
+        ResultColumns: The columnar results.
+    """
+    version = store.archive_section_version(archive_id, RESULTS)
+    with _columns_lock:
+        cached = _columns_cache.get(archive_id)
+    if cached is not None and cached[0] == version and is_fresh(archive_id, cached[1]):
+        return cached[2]
+
+    matches, scraped_at = get_results(archive_id)
+    columns = ResultColumns(matches)
+    if deadline.is_partial():
+        # Results cut short by the request deadline are used for this request only
+        return columns
+    with _columns_lock:
+        _columns_cache[archive_id] = (store.archive_section_version(archive_id, RESULTS), scraped_at, columns)
+    return columns
+
+
+def get_stats_columns(archive_id: str) -> StatsColumns:
+    """
+    Returns the results of an archive joined with the statistics of its matches in the local store.
+
+    Matches without stored details count in results-based figures but not in statistics. The arrays are rebuilt
+    only when the results or the stored match details change.
+
+    Args:
+        archive_id (str): The unique identifier of the archive.
+
+    Returns:
+        StatsColumns: The columnar statistics.
+    """
+    results = get_result_columns(archive_id)
+    version = store.matches_version()
+    with _columns_lock:
+        cached = _stats_cache.get(archive_id)
+    if cached is not None and cached[0] is results and cached[1] == version:
+        return cached[2]
+
+    details = {}
+    for match_id in results.ids:
+        detail = store.load_match(match_id) if match_id else None
+        if detail is not None:
+            details[match_id] = detail
+
+    columns = StatsColumns(results, details)
+    if deadline.is_partial():
+        return columns
+    with _columns_lock:
+        _stats_cache[archive_id] = (results, version, columns)
+    return columns
+
+
+class MatchFetcher:
+    """
+    Serves match details from the immutable match store, scraping only matches that are not stored yet.
+
+    Finished matches are written to the store once and served from it forever after; upcoming and live matches
+    are scraped on every request. The browser is opened on the first miss and reused for later ones. Matches
+    scraped with a sparse fieldset are incomplete, so they are never written to the store.
+    """
+    def __init__(self) -> None:
+        self.match_scraper = None
+
+    def get(self, match_id: str, fields: Optional[frozenset[str]] = None) -> MatchDetail:
+        """
+        Returns the details of a match.
+
+        Args:
+            match_id (str): The unique identifier of the match.
+            fields (frozenset[str], optional): The attributes to scrape on a miss, None for all. Defaults to None.
+
+        Returns:
+            MatchDetail: The match details.
+        """
+        stored = store.load_match(match_id)
+        if stored is not None:
+            metrics.increment("match_store.hits")
+            return stored
+
+        metrics.increment("match_store.misses")
+        if self.match_scraper is None:
+            self.match_scraper = MatchScraper()
+
+        with metrics.timer("match_store.scrape"):
+            if fields is None:
+                match = self.match_scraper.scrape_match(match_id)
+            else:
+                match = self.match_scraper.scrape_match(match_id, fields)
+
+        if fields is None and is_final(match) and store.save_match(match):
+            metrics.increment("match_store.writes")
+            logging.debug(f"Match {match_id} is final and was written to the match store")
+        return match
+
+    def close(self) -> None:
+        """
+        Closes the browser, if one was opened.
+        """
+        if self.match_scraper is not None:
+            self.match_scraper.close()
+            self.match_scraper = None
+
+
+def fetch_matches(match_ids: list[str], workers: int = STATS_FETCH_WORKERS,
+                  fields: Optional[frozenset[str]] = None,
+                  progress: Optional[Callable[[], None]] = None) -> dict[str, MatchDetail]:
+    """
+    Fetches the details of many matches, scraping the ones missing from the match store concurrently.
+
+    Stored matches are served right away; the others are split across up to `workers` browser sessions.
+    Matches that fail to scrape are logged and left out of the result. Once the request's deadline is reached,
+    the remaining matches are skipped and the request's results are marked as partial.
+
+    Args:
+        match_ids (list[str]): The unique identifiers of the matches.
+        workers (int, optional): The maximum number of browsers to open. Defaults to `STATS_FETCH_WORKERS`.
+        fields (frozenset[str], optional): The attributes to scrape for missing matches, None for all.
+            Defaults to None.
+        progress (Callable[[], None], optional): Called once per match handled, whether served, scraped or failed.
+            Defaults to None.
+
+    Returns:
+        dict[str, MatchDetail]: The match details, keyed by match ID.
+    """
+    details = {}
+    missing = []
+    for match_id in dict.fromkeys(match_ids):
+        stored = store.load_match(match_id)
+        if stored is not None:
+            metrics.increment("match_store.hits")
+            details[match_id] = stored
+            if progress is not None:
+                progress()
+        else:
+            missing.append(match_id)
+
+    if not missing:
+        return details
+
+    local = threading.local()
+    fetchers = []
+    fetchers_lock = threading.Lock()
+    request_deadline = current_deadline.get()
+    request_log_id = request_id.get()
+
+    def fetch(match_id: str) -> None:
+        # Worker threads do not inherit the request's context, only its deadline and log ID are carried over
+        current_deadline.set(request_deadline)
+        request_id.set(request_log_id)
+        if deadline.expired():
+            deadline.mark_partial()
+            return
+
+        # One fetcher, hence one browser, per worker thread
+        fetcher = getattr(local, "fetcher", None)
+        if fetcher is None:
+            fetcher = local.fetcher = MatchFetcher()
+            with fetchers_lock:
+                fetchers.append(fetcher)
+        try:
+            details[match_id] = fetcher.get(match_id, fields)
+        except DeadlineExceeded:
+            deadline.mark_partial()
+        except Exception as ex:
+            logging.warning(f"Unable to fetch match {match_id}: {ex}")
+        finally:
+            if progress is not None:
+                progress()
+
+    workers = max(1, min(workers, len(missing)))
+    try:
+        # The worker sessions count against the request's admission slot, beside the request's own session
+        with extra_sessions(workers), ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(fetch, missing))
+    finally:
+        for fetcher in fetchers:
+            try:
+                fetcher.close()
+            except Exception as ex:
+                logging.debug(f"Unable to close browser: {ex}")
+
+    return details
+
+
+def _browser_seconds_saved() -> float:
+    # Every hit avoids one scrape of average duration
+    hits = metrics.count("match_store.hits")
+    return round(hits * metrics.average("match_store.scrape"), 3)
+
+
+metrics.register_gauge("match_store.browser_seconds_saved", _browser_seconds_saved)
@@ -1,10 +1,18 @@
 import logging
 import re
-from app.services.models.archive_schemas import Archive, Match, Rank, LiveMatch
+from typing import Iterator, Optional
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.remote.webelement import WebElement
+from app.services import deadline
+from app.services.deadline import DeadlineExceeded
+from app.services.fields import wanted
+from app.services.models.archive_schemas import Archive, Match, Rank, LiveMatch, LiveLeague
 from app.services.models.utils import Pagination
+from app.services.scraper.feed import FIELD_MATCH_ID, match_rows, to_match, to_live_match, is_live
 from app.services.scraper.leagues_scraper import LeagueScraper
-from app.services.scraper.scraper import Scraper
-from app.services.utils import get_match_datetime
+from app.services.scraper.scraper import Scraper, resilient
+from app.services.scraper.session import NavigationSession
+from app.services.utils import get_match_datetime, get_current_season
 from config import LIMIT
 
 XPATH_TABS_MENU = "//div[@class='container__heading']/div[3]/div[1]/a"
@@ -34,6 +42,11 @@ XPATH_HOME_FROM_LIVE_MATCH = './div[2]/span[1]'
 XPATH_AWAY_FROM_LIVE_MATCH = './div[3]/span[1]'
 XPATH_HOME_SCORE_FROM_LIVE_MATCH = './div[4]'
 XPATH_AWAY_SCORE_FROM_LIVE_MATCH = './div[5]'
+XPATH_LIVE_FEED_TAB = "//div[contains(@class, 'filters__tab')][contains(., 'LIVE')]"
+XPATH_LIVE_FEED_ROWS = ('//*[@id="live-table"]//div[contains(@class, "sportName")]'
+                        '/div[contains(@class, "headerLeague") or contains(@class, "event__match--live")]')
+XPATH_COUNTRY_FROM_HEADER = './/span[contains(@class, "headerLeague__category-text")]'
+XPATH_LEAGUE_FROM_HEADER = './/a[contains(@class, "headerLeague__title")]'
 
 MENU_MAPPING = {
     'SUMMARY': 'live',
@@ -42,6 +55,66 @@ MENU_MAPPING = {
     'STANDINGS': 'standings'
 }
 CONFIG_SCORE = 'score'
+CONFIG_FIELDS = 'fields'
+SECTION_RESULTS = 'results'
+SECTION_FIXTURES = 'fixtures'
+SECTION_STANDINGS = 'standings'
+
+
+def paginate(total_items: int, page: int, size: int) -> tuple[int, int, Pagination]:
+    """
+    Computes the slice of a list of matches to return for a page.
+
+    Args:
+        total_items (int): The number of matches.
+        page (int): The page number, starting from 1, or 0 for all matches.
+        size (int): The number of matches per page.
+
+    Returns:
+        tuple[int, int, Pagination]: The start and end indices of the page, and the pagination details.
+    """
+    try:
+        if page == 0:  # Return all items if page is 0
+            start, end = 0, total_items
+            current_page, total_pages = 0, 1
+        else:
+            start = (page - 1) * size
+            end = start + size
+            if start >= total_items:
+                raise ValueError("Invalid pagination: page exceeds total items.")
+            current_page = page
+            total_pages = (total_items + size - 1) // size
+
+        # Build the pagination object
+        pagination = Pagination(
+            current_page=current_page,
+            page_size=size if page != 0 else total_items,
+            total_items=total_items,
+            total_pages=total_pages
+        )
+    except ValueError as ex:
+        logging.error(f"Pagination error: {ex}")
+        raise
+    except Exception as ex:
+        logging.error("Unexpected error during pagination")
+        raise ValueError("Invalid pagination")
+    return start, end, pagination
+
+
+def header_text(element: WebElement) -> str:
+    """
+    Reads the country or league name of a league header as written in the page source.
+
+    The homepage upper-cases country names with CSS, so the raw `textContent` is used instead of the rendered text,
+    to match the names used in country and league IDs.
+
+    Args:
+        element (WebElement): The header element.
+
+    Returns:
+        str: The name, without the trailing colon of country labels.
+    """
+    return (element.get_attribute("textContent") or element.text).strip().rstrip(":").strip()
 
 class ArchiveScraper(Scraper):
     """
@@ -50,13 +123,28 @@ class ArchiveScraper(Scraper):
     Inherits from:
         Scraper: Provides base functionality for web scraping using Selenium.
     """
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, session: NavigationSession = None) -> None:
+        super().__init__(session=session)
 
     def scrape_archive(self, archive_id: str) -> Archive:
         """
         Scrapes archive data for a given archive ID.
 
+        The result is memoized for the rest of the navigation session.
+
+        Args:
+            archive_id (str): The unique identifier for the archive.
+
+        Returns:
+            Archive: The scraped archive data, or None if not found.
+        """
+        return self.session.memo(("archive", archive_id), lambda: self.resolve_archive(archive_id))
+
+
+    def resolve_archive(self, archive_id: str) -> Archive:
+        """
+        Scrapes archive data for a given archive ID, bypassing the navigation memo.
+
         Args:
             archive_id (str): The unique identifier for the archive.
 
@@ -70,7 +158,7 @@ class ArchiveScraper(Scraper):
             country, league, season = match.groups()
             logging.debug(f"Extracted details - Country: {country}, League: {league}, Season: {season}")
 
-            league_scraper = LeagueScraper()
+            league_scraper = LeagueScraper(session=self.session)
             league_id = f"{country}-{league}"
             archives = league_scraper.scrape_league_archives(league_id)
 
@@ -80,26 +168,43 @@ class ArchiveScraper(Scraper):
                 logging.warning(f"Archive '{season}' not found in league '{league}'")
                 return None
 
-            self.get_page(url)
-
-            archive = Archive()
-            archive.league = league_id
-            archive.season = season
-            archive.url = url
-
-            menu_elements = self.find_elements(XPATH_TABS_MENU)
-            for menu_element in menu_elements:
-                menu_text = menu_element.text.strip()
-                if menu_text in MENU_MAPPING:
-                    setattr(archive, MENU_MAPPING[menu_text], self.get_attribute(menu_element))
-
-            return archive
+            return self.read_archive(league_id, season, url)
         else:
             logging.debug(f"Invalid Archive ID: {archive_id}")
             return None
 
 
-    def scrape_results_by_archive(self, archive_id: str, page: int, size: int) -> tuple[list[Match], Pagination]:
+    @resilient("archive")
+    def read_archive(self, league_id: str, season: str, url: str) -> Archive:
+        """
+        Reads the tab URLs of an archive whose page URL is already known, skipping the league resolution.
+
+        Args:
+            league_id (str): The unique identifier of the archive's league.
+            season (str): The season of the archive (e.g., '2023_2024').
+            url (str): The URL of the archive page, as listed by `LeagueScraper.scrape_league_archives`.
+
+        Returns:
+            Archive: The archive data.
+        """
+        self.get_page(url)
+
+        archive = Archive.model_construct()
+        archive.league = league_id
+        archive.season = season
+        archive.url = url
+
+        menu_elements = self.find_elements(XPATH_TABS_MENU)
+        for menu_element in menu_elements:
+            menu_text = menu_element.text.strip()
+            if menu_text in MENU_MAPPING:
+                setattr(archive, MENU_MAPPING[menu_text], self.get_attribute(menu_element))
+
+        return archive
+
+
+    def scrape_results_by_archive(self, archive_id: str, page: int, size: int,
+                                  fields: Optional[frozenset[str]] = None) -> tuple[list[Match], Pagination]:
         """
         Scrapes match results for a given archive, with pagination support.
 
@@ -107,6 +212,7 @@ class ArchiveScraper(Scraper):
             archive_id (str): The unique identifier for the archive.
             page (int): The page number to retrieve.
             size (int): The number of items per page.
+            fields (frozenset[str], optional): The attributes to extract, None for all. Defaults to None.
 
         Returns:
             tuple[list[Match], Pagination]: A list of matches and the pagination details.
@@ -118,14 +224,89 @@ class ArchiveScraper(Scraper):
             raise ValueError(f"The archive {archive_id} does not exist")
 
         config = {
-            CONFIG_SCORE: True
+            CONFIG_SCORE: True,
+            CONFIG_FIELDS: fields
         }
         matches, pagination = self.scrape_matches(archive.results, archive, page, size, config)
 
         return matches, pagination
 
 
-    def scrape_fixtures_by_archive(self, archive_id: str, page: int, size: int) -> tuple[list[Match], Pagination]:
+    def scrape_section(self, archive: Archive, section: str) -> list:
+        """
+        Scrapes one tab of an already resolved archive, in full.
+
+        Args:
+            archive (Archive): The archive metadata, with the URLs of its tabs.
+            section (str): The tab to scrape: 'results', 'fixtures' or 'standings'.
+
+        Returns:
+            list: The matches of the results or fixtures tab, or the rankings of the standings tab.
+        """
+        if section == SECTION_STANDINGS:
+            return self.scrape_standings(archive)
+
+        config = {
+            CONFIG_SCORE: section == SECTION_RESULTS
+        }
+        matches, _ = self.scrape_matches(getattr(archive, section), archive, 0, 0, config)
+        return matches
+
+
+    def iter_results_by_archive(self, archive_id: str) -> Iterator[Match]:
+        """
+        Resolves an archive and expands its results page, returning an iterator that extracts matches lazily.
+
+        The archive is resolved eagerly so that a missing archive is reported before any row is consumed.
+
+        Args:
+            archive_id (str): The unique identifier for the archive.
+
+        Returns:
+            Iterator[Match]: The results of the archive, extracted on demand.
+        """
+        archive = self.scrape_archive(archive_id)
+
+        if archive is None:
+            logging.debug(f"The archive {archive_id} does not exist.")
+            raise ValueError(f"The archive {archive_id} does not exist")
+
+        if not self.load_matches(archive.results):
+            return iter(())
+
+        config = {
+            CONFIG_SCORE: True
+        }
+        if self.reads_feeds:
+            matches = self.read_feed_matches(archive, config)
+            if matches is not None:
+                return iter(matches)
+        return self.iter_matches(archive, config)
+
+
+    def iter_results_by_archives(self, archive_ids: list[str]) -> Iterator[Match]:
+        """
+        Lazily extracts the results of several archives, one after the other, in the same browser.
+
+        Archives that cannot be resolved are logged and skipped.
+
+        Args:
+            archive_ids (list[str]): The unique identifiers of the archives.
+
+        Yields:
+            Match: The results of every archive, in the order given.
+        """
+        for archive_id in archive_ids:
+            try:
+                matches = self.iter_results_by_archive(archive_id)
+            except Exception as ex:
+                logging.warning(f"Skipping archive {archive_id}: {ex}")
+                continue
+            yield from matches
+
+
+    def scrape_fixtures_by_archive(self, archive_id: str, page: int, size: int,
+                                   fields: Optional[frozenset[str]] = None) -> tuple[list[Match], Pagination]:
         """
         Scrapes fixtures for a given archive, with pagination support.
 
@@ -133,6 +314,7 @@ class ArchiveScraper(Scraper):
             archive_id (str): The unique identifier for the archive.
             page (int): The page number to retrieve.
             size (int): The number of items per page.
+            fields (frozenset[str], optional): The attributes to extract, None for all. Defaults to None.
 
         Returns:
             tuple[list[Match], Pagination]: A list of fixtures and the pagination details.
@@ -144,19 +326,22 @@ class ArchiveScraper(Scraper):
             raise ValueError(f"The archive {archive_id} does not exist")
 
         config = {
-            CONFIG_SCORE: False
+            CONFIG_SCORE: False,
+            CONFIG_FIELDS: fields
         }
         matches, pagination = self.scrape_matches(archive.fixtures, archive, page, size, config)
 
         return matches, pagination
 
 
-    def scrape_live_by_archive(self, archive_id: str) -> list[LiveMatch]:
+    @resilient("live")
+    def scrape_live_by_archive(self, archive_id: str, fields: Optional[frozenset[str]] = None) -> list[LiveMatch]:
         """
         Scrapes live match data for a given archive.
 
         Args:
             archive_id (str): The unique identifier for the archive.
+            fields (frozenset[str], optional): The attributes to extract, None for all. Defaults to None.
 
         Returns:
             list[LiveMatch]: A list of live matches.
@@ -170,31 +355,94 @@ class ArchiveScraper(Scraper):
         self.get_page(archive.live)
         logging.debug(f"Reached URL: {archive.live}")
 
+        if self.reads_feeds:
+            records = self.read_feed(lambda records: any(FIELD_MATCH_ID in record for record in records), temporary=True)
+            if records is not None:
+                return [to_live_match(row, archive.id) for row in match_rows(records) if is_live(row)]
+            logging.debug("No match feed captured, reading the page instead")
+
         live_match_elements = self.find_elements(XPATH_LIVE_MATCHES)
         matches = []
 
         for live_match_element in live_match_elements:
-            match = LiveMatch()
-            match.archive = archive.id
-            id_element = self.find_element(XPATH_ID_FROM_LIVE_MATCH, live_match_element)
-            match.url = id_element.get_attribute("href")
-            match.id = re.search(r'/match/([^/]+)/', match.url).group(1)
+            matches.append(self.extract_live_match(live_match_element, archive.id, fields))
+
+        return matches
+
+
+    @resilient("live_feed")
+    def scrape_live_feed(self) -> list[LiveLeague]:
+        """
+        Scrapes every live match of every league from the LIVE tab of the football homepage, in one page load.
+
+        League headers on the page give the country and league of the matches listed below them. The archive of each
+        league is assumed to be the current season, as seasons are not shown on the homepage.
+
+        Returns:
+            list[LiveLeague]: The live matches, grouped by league, in page order.
+        """
+        self.open_home()
+        if not self.session.page_state.get("live_tab"):
+            live_tab = self.find_element(XPATH_LIVE_FEED_TAB)
+            live_tab.click()
+            self.session.page_state["live_tab"] = True
+
+        try:
+            rows = self.find_elements(XPATH_LIVE_FEED_ROWS, temporary=True)
+        except TimeoutException:
+            logging.debug("No live match at the moment")
+            return []
+
+        season = get_current_season()
+        leagues = []
+        for row in rows:
+            if "headerLeague" in (row.get_attribute("class") or ""):
+                country = header_text(self.find_element(XPATH_COUNTRY_FROM_HEADER, element=row))
+                league_name = header_text(self.find_element(XPATH_LEAGUE_FROM_HEADER, element=row))
+                league_id = f"{country}-{league_name}"
+                leagues.append(LiveLeague(league=league_id, archive=f"{league_id}-{season}", matches=[]))
+            elif leagues:
+                leagues[-1].matches.append(self.extract_live_match(row, leagues[-1].archive))
+
+        return [league for league in leagues if league.matches]
+
+
+    def extract_live_match(self, live_match_element: WebElement, archive_id: str,
+                           fields: Optional[frozenset[str]] = None) -> LiveMatch:
+        """
+        Extracts a single live match row, looking up only the requested attributes.
+
+        Args:
+            live_match_element (WebElement): The live match row element.
+            archive_id (str): The unique identifier of the archive the match belongs to.
+            fields (frozenset[str], optional): The attributes to extract, None for all. Defaults to None.
+
+        Returns:
+            LiveMatch: The extracted live match.
+        """
+        match = LiveMatch.model_construct(archive=archive_id)
+        id_element = self.find_element(XPATH_ID_FROM_LIVE_MATCH, live_match_element)
+        match.url = id_element.get_attribute("href")
+        match.id = re.search(r'/match/([^/]+)/', match.url).group(1)
+        if wanted(fields, "time"):
             time_element = self.find_element(XPATH_TIME_FROM_LIVE_MATCH, live_match_element)
             match.time = time_element.text
+        if wanted(fields, "home"):
             home_element = self.find_element(XPATH_HOME_FROM_LIVE_MATCH, live_match_element)
             match.home = home_element.text
+        if wanted(fields, "away"):
             away_element = self.find_element(XPATH_AWAY_FROM_LIVE_MATCH, live_match_element)
             match.away = away_element.text
+        if wanted(fields, "home_score"):
             home_score_element = self.find_element(XPATH_HOME_SCORE_FROM_LIVE_MATCH, live_match_element)
             match.home_score = int(home_score_element.text)
+        if wanted(fields, "away_score"):
             away_score_element = self.find_element(XPATH_AWAY_SCORE_FROM_LIVE_MATCH, live_match_element)
             match.away_score = int(away_score_element.text)
-
-            matches.append(match)
-
-        return matches
+        return match
 
 
+    @resilient("matches")
     def scrape_matches(self, url: str, archive: Archive, page: int, size: int, config: dict) -> tuple[list[Match], Pagination]:
         """
         Scrapes match data from a given URL with pagination.
@@ -209,13 +457,67 @@ class ArchiveScraper(Scraper):
         Returns:
             tuple[list[Match], Pagination]: A list of matches and the pagination details.
         """
+        if not self.load_matches(url):
+            return [[], None]
+
+        if self.reads_feeds:
+            matches = self.read_feed_matches(archive, config)
+            if matches is not None:
+                start, end, pagination = paginate(len(matches), page, size)
+                return matches[start:end], pagination
+
+        match_elements = self.find_elements(XPATH_MATCH_RESULTS)
+        logging.debug(f"Found {len(match_elements)} matches")
+
+        start, end, pagination = paginate(len(match_elements), page, size)
+        matches = list(self.iter_matches(archive, config, start, end))
+
+        return matches, pagination
+
+
+    def read_feed_matches(self, archive: Archive, config: dict) -> Optional[list[Match]]:
+        """
+        Reads the matches of a page previously loaded with `load_matches` from the data feeds it fetched.
+
+        Args:
+            archive (Archive): The archive metadata associated with the matches.
+            config (dict): Configuration options for scraping.
+
+        Returns:
+            Optional[list[Match]]: The matches in feed order, or None if no match feed was captured.
+        """
+        records = self.read_feed(lambda records: any(FIELD_MATCH_ID in record for record in records), temporary=True)
+        if records is None:
+            logging.debug("No match feed captured, reading the page instead")
+            return None
+        matches = (to_match(row, archive.id, config[CONFIG_SCORE]) for row in match_rows(records))
+        return [match for match in matches if match is not None]
+
+
+    def load_matches(self, url: str) -> bool:
+        """
+        Navigates to a results or fixtures page and expands it with the 'show more' button.
+
+        Expansion stops early, marking the request's results as partial, when the request's deadline is reached.
+
+        Args:
+            url (str): The URL to scrape match data from.
+
+        Returns:
+            bool: False if the page reports that no match exists, True otherwise.
+        """
         self.get_page(url)
         logging.debug(f"Scraping matches: reached URL {url}")
 
+        if "matches_found" in self.session.page_state:
+            logging.debug(f"Matches of URL {url} already expanded")
+            return self.session.page_state["matches_found"]
+
         try:
             self.find_element(XPATH_NO_FOUND_MATCH, temporary=True)
             logging.debug(f"No match found for URL {url}")
-            return [[], None]
+            self.session.page_state["matches_found"] = False
+            return False
         except Exception as e:
             logging.debug(f"Some match exist for URL {url}")
 
@@ -226,45 +528,37 @@ class ArchiveScraper(Scraper):
                 show_more_button = self.find_element(XPATH_SHOW_MORE_RESULTS, temporary=True)
                 self.execute_script(show_more_button)
                 counter += 1
+            except DeadlineExceeded:
+                logging.debug("Request deadline reached, results only partially expanded.")
+                deadline.mark_partial()
+                break
             except Exception as ex:
                 end = False
                 logging.debug("Finished expanding results.")
 
-        match_elements = self.find_elements(XPATH_MATCH_RESULTS)
-        logging.debug(f"Found {len(match_elements)} matches")
+        self.session.page_state["matches_found"] = True
+        return True
 
-        try:
-            total_items = len(match_elements)
-            if page == 0:  # Return all items if page is 0
-                start, end = 0, total_items
-                current_page, total_pages = 0, 1
-            else:
-                start = (page - 1) * size
-                end = start + size
-                if start >= total_items:
-                    raise ValueError("Invalid pagination: page exceeds total items.")
-                current_page = page
-                total_pages = (total_items + size - 1) // size
-
-            # Build the pagination object
-            pagination = Pagination(
-                current_page=current_page,
-                page_size=size if page != 0 else total_items,
-                total_items=total_items,
-                total_pages=total_pages
-            )
-        except ValueError as ex:
-            logging.error(f"Pagination error: {ex}")
-            raise
-        except Exception as ex:
-            logging.error("Unexpected error during pagination")
-            raise ValueError("Invalid pagination")
 
+    def iter_matches(self, archive: Archive, config: dict, start: int = 0, end: int = None) -> Iterator[Match]:
+        """
+        Lazily extracts the matches of a page previously loaded with `load_matches`, round by round.
+
+        Extraction stops early, marking the request's results as partial, when the request's deadline is reached.
+
+        Args:
+            archive (Archive): The archive metadata associated with the matches.
+            config (dict): Configuration options for scraping.
+            start (int, optional): Index of the first match to extract. Defaults to 0.
+            end (int, optional): Index after the last match to extract. Defaults to all matches.
+
+        Yields:
+            Match: The extracted matches, in page order.
+        """
         round_elements = self.find_elements(XPATH_ROUNDS_RESULTS)
         counter = 0
-        matches = []
         for round_element in round_elements:
-            if counter > end:
+            if end is not None and counter > end:
                 break
             round = int(re.search(r'\d+', round_element.text.strip()).group())
 
@@ -276,34 +570,57 @@ class ArchiveScraper(Scraper):
                 if 'event__round' in match_element.get_attribute('class'):
                     break
 
-                if counter >= start and counter < end:
-                    # Extract match data
-                    match = Match()
-                    match.archive = archive.id
-                    match.round = round
-                    try:
-                        id_element = self.find_element(XPATH_ID_MATCH, element=match_element)
-                        match.url = self.get_attribute(id_element)
-                        match.id = re.search(r'/match/([^/]+)/', match.url).group(1)
-                        date_element = self.find_element(XPATH_DATE_MATCH, element=match_element)
-                        match.match_date = get_match_datetime(date_element.text.strip(), archive.season)
-                        home_element = self.find_element(XPATH_HOME_MATCH, element=match_element)
-                        match.home = home_element.text.strip()
-                        away_element = self.find_element(XPATH_AWAY_MATCH, element=match_element)
-                        match.away = away_element.text.strip()
-                        if config[CONFIG_SCORE]:
-                            home_score_element = self.find_element(XPATH_HOME_SCORE_MATCH, element=match_element)
-                            match.home_score = int(home_score_element.text.strip())
-                            away_score_element = self.find_element(XPATH_AWAY_SCORE_MATCH, element=match_element)
-                            match.away_score = int(away_score_element.text.strip())
-                    except Exception as ex:
-                        logging.warning(f"Unable to extract full information for match at index {counter}: {ex}")
-
-                    matches.append(match)
+                if counter >= start and (end is None or counter < end):
+                    if deadline.expired():
+                        logging.debug(f"Request deadline reached after {counter - start} matches")
+                        deadline.mark_partial()
+                        return
+                    yield self.extract_match(match_element, round, archive, config, counter)
 
                 counter += 1
 
-        return matches, pagination
+
+    def extract_match(self, match_element: WebElement, round: int, archive: Archive, config: dict, index: int) -> Match:
+        """
+        Extracts a single match row from the results or fixtures list.
+
+        The ID and URL are always read; the other attributes only if listed in the `CONFIG_FIELDS` option, when set.
+
+        Args:
+            match_element (WebElement): The match row element.
+            round (int): The round the match belongs to.
+            archive (Archive): The archive metadata associated with the match.
+            config (dict): Configuration options for scraping.
+            index (int): Position of the match in the page, used for logging.
+
+        Returns:
+            Match: The extracted match, possibly incomplete if some element could not be read.
+        """
+        match = Match.model_construct(archive=archive.id, round=round)
+        fields = config.get(CONFIG_FIELDS)
+        try:
+            id_element = self.find_element(XPATH_ID_MATCH, element=match_element)
+            match.url = self.get_attribute(id_element)
+            match.id = re.search(r'/match/([^/]+)/', match.url).group(1)
+            if wanted(fields, "match_date"):
+                date_element = self.find_element(XPATH_DATE_MATCH, element=match_element)
+                match.match_date = get_match_datetime(date_element.text.strip(), archive.season)
+            if wanted(fields, "home"):
+                home_element = self.find_element(XPATH_HOME_MATCH, element=match_element)
+                match.home = home_element.text.strip()
+            if wanted(fields, "away"):
+                away_element = self.find_element(XPATH_AWAY_MATCH, element=match_element)
+                match.away = away_element.text.strip()
+            if config[CONFIG_SCORE] and wanted(fields, "home_score"):
+                home_score_element = self.find_element(XPATH_HOME_SCORE_MATCH, element=match_element)
+                match.home_score = int(home_score_element.text.strip())
+            if config[CONFIG_SCORE] and wanted(fields, "away_score"):
+                away_score_element = self.find_element(XPATH_AWAY_SCORE_MATCH, element=match_element)
+                match.away_score = int(away_score_element.text.strip())
+        except Exception as ex:
+            logging.warning(f"Unable to extract full information for match at index {index}: {ex}")
+
+        return match
 
 
     def scrape_standings_by_archive(self, archive_id: str) -> list[Rank]:
@@ -322,12 +639,26 @@ class ArchiveScraper(Scraper):
             logging.debug(f"The archive {archive_id} does not exist.")
             raise ValueError(f"The archive {archive_id} does not exist")
 
+        return self.scrape_standings(archive)
+
+
+    @resilient("standings")
+    def scrape_standings(self, archive: Archive) -> list[Rank]:
+        """
+        Scrapes the standings table of an already resolved archive.
+
+        Args:
+            archive (Archive): The archive metadata, including its standings URL.
+
+        Returns:
+            list[Rank]: A list of rankings with team and performance details.
+        """
         self.get_page(archive.standings)
 
         ranking_elements = self.find_elements(XPATH_TABLE_STANDING)
         standings = []
         for index, ranking_element in enumerate(ranking_elements):
-            rank = Rank(position=index+1)
+            rank = Rank.model_construct(position=index+1)
             team_element = self.find_element(XPATH_TEAM_ELEMENT_FROM_STANDING, ranking_element)
             rank.team = team_element.text.strip()
             mp_element = self.find_element(XPATH_MP_ELEMENT_FROM_STANDING, ranking_element)
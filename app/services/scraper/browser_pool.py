@@ -0,0 +1,243 @@
+import atexit
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webelement import WebElement
+from app.services.metrics import metrics
+from app.services.utils import get_driver
+from config import BROWSER_PROCESSES, TABS_PER_BROWSER, TIMEOUT
+
+# Navigations return at DOMContentLoaded, so a tab waiting for its page content does not block the other tabs
+POOLED_PAGE_LOAD_STRATEGY = "eager"
+
+
+class Browser:
+    """
+    One Chrome process, whose windows are leased as independent tabs.
+
+    WebDriver commands always apply to the focused window, so every command of a tab runs under the process lock,
+    after switching to the tab's window if another tab was focused.
+
+    Attributes:
+        driver (webdriver.Chrome): The WebDriver of the process.
+        lock (threading.RLock): Serializes the commands of the tabs.
+        focused (str): The handle of the focused window.
+        idle (list[str]): Handles of open windows not leased to any session.
+        leased (int): The number of windows leased.
+    """
+    def __init__(self, driver: webdriver.Chrome) -> None:
+        self.driver = driver
+        self.lock = threading.RLock()
+        self.focused = driver.current_window_handle
+        self.idle = [self.focused]
+        self.leased = 0
+
+    @contextmanager
+    def focus(self, handle: str):
+        with self.lock:
+            if self.focused != handle:
+                self.driver.switch_to.window(handle)
+                self.focused = handle
+            yield
+
+    def open_tab(self) -> str:
+        with self.lock:
+            if self.idle:
+                return self.idle.pop()
+            self.driver.switch_to.new_window("tab")
+            self.focused = self.driver.current_window_handle
+            return self.focused
+
+    def quit(self) -> None:
+        try:
+            self.driver.quit()
+        except Exception as ex:
+            logging.debug(f"Unable to quit WebDriver: {ex}")
+
+
+class TabProxy:
+    """
+    Forwards attribute accesses to a WebDriver or a WebElement, with the owning tab focused.
+
+    Elements returned by commands are wrapped as well, so that reading them later also focuses their tab.
+    """
+    def __init__(self, tab: "TabDriver", target) -> None:
+        object.__setattr__(self, "_tab", tab)
+        object.__setattr__(self, "_target", target)
+
+    def __getattr__(self, name: str):
+        tab = self._tab
+        with tab.focus():
+            value = getattr(self._target, name)
+        if not callable(value):
+            return tab.wrap(value)
+
+        def command(*args, **kwargs):
+            args = tuple(arg._target if isinstance(arg, TabProxy) else arg for arg in args)
+            with tab.focus():
+                return tab.wrap(value(*args, **kwargs))
+        return command
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, TabProxy) and self._target == other._target
+
+    def __hash__(self) -> int:
+        return hash(self._target)
+
+
+class TabDriver(TabProxy):
+    """
+    A WebDriver stand-in bound to one window of a pooled Chrome process.
+
+    Quitting returns the window to the pool instead of stopping the process.
+    """
+    def __init__(self, pool: "BrowserPool", browser: Browser, handle: str) -> None:
+        super().__init__(self, browser.driver)
+        object.__setattr__(self, "pool", pool)
+        object.__setattr__(self, "browser", browser)
+        object.__setattr__(self, "handle", handle)
+        object.__setattr__(self, "released", False)
+
+    def focus(self):
+        return self.browser.focus(self.handle)
+
+    def wrap(self, value):
+        if isinstance(value, WebElement):
+            return TabProxy(self, value)
+        if isinstance(value, list) and value and isinstance(value[0], WebElement):
+            return [TabProxy(self, element) for element in value]
+        return value
+
+    def quit(self) -> None:
+        if not self.released:
+            object.__setattr__(self, "released", True)
+            self.pool.release(self)
+
+
+class BrowserPool:
+    """
+    Shares a few Chrome processes among many navigation sessions, each session using a tab of its own.
+
+    Up to `processes` processes are started on demand, each serving up to `tabs` sessions at once. A new session
+    gets a tab of the least busy process, so page loads spread across processes before piling up in one. When all
+    tabs are leased, sessions wait for one to be released.
+
+    Attributes:
+        processes (int): The maximum number of Chrome processes.
+        tabs (int): The maximum number of tabs per process.
+    """
+    def __init__(self, processes: int = BROWSER_PROCESSES, tabs: int = TABS_PER_BROWSER, factory=None) -> None:
+        self.processes = processes
+        self.tabs = tabs
+        self.factory = factory or (lambda: get_driver(page_load_strategy=POOLED_PAGE_LOAD_STRATEGY))
+        self.browsers: list[Browser] = []
+        self.starting = 0
+        self.condition = threading.Condition()
+
+    def _pick(self) -> Optional[Browser]:
+        # The least busy process with a free tab, or None to start a new process or wait
+        available = [browser for browser in self.browsers if browser.leased < self.tabs]
+        if len(self.browsers) + self.starting < self.processes and \
+                all(browser.leased > 0 for browser in available):
+            return None
+        return min(available, key=lambda browser: browser.leased, default=None)
+
+    def acquire(self, timeout: float = TIMEOUT) -> TabDriver:
+        """
+        Leases a tab, starting a Chrome process if all the running ones are busy and the limit allows it.
+
+        Args:
+            timeout (float, optional): Seconds to wait for a tab when all are leased. Defaults to `TIMEOUT`.
+
+        Returns:
+            TabDriver: The tab, to use as a WebDriver.
+
+        Raises:
+            WebDriverException: If no tab is released in time, or the process cannot open one.
+        """
+        give_up = time.monotonic() + timeout
+        with self.condition:
+            while True:
+                browser = self._pick()
+                if browser is not None:
+                    browser.leased += 1
+                    break
+                if len(self.browsers) + self.starting < self.processes:
+                    self.starting += 1
+                    browser = None
+                    break
+                if not self.condition.wait(give_up - time.monotonic()):
+                    raise WebDriverException(f"No browser tab released within {timeout} seconds")
+
+        if browser is None:
+            # Started outside the pool lock, as it takes seconds
+            try:
+                browser = Browser(self.factory())
+            except BaseException:
+                with self.condition:
+                    self.starting -= 1
+                    self.condition.notify_all()
+                raise
+            metrics.increment("browser_pool.processes_started")
+            with self.condition:
+                self.starting -= 1
+                browser.leased += 1
+                self.browsers.append(browser)
+
+        try:
+            handle = browser.open_tab()
+        except WebDriverException:
+            self._discard(browser)
+            raise
+        return TabDriver(self, browser, handle)
+
+    def release(self, tab: TabDriver) -> None:
+        """
+        Returns a tab to the pool, and stops its process if it stopped answering.
+
+        Args:
+            tab (TabDriver): The tab to release.
+        """
+        browser = tab.browser
+        try:
+            with browser.focus(tab.handle):
+                browser.driver.get("about:blank")
+        except WebDriverException as ex:
+            logging.debug(f"Unable to reset tab, discarding its browser: {ex}")
+            self._discard(browser)
+            return
+        with self.condition:
+            browser.leased -= 1
+            browser.idle.append(tab.handle)
+            self.condition.notify_all()
+
+    def _discard(self, browser: Browser) -> None:
+        with self.condition:
+            if browser in self.browsers:
+                self.browsers.remove(browser)
+            self.condition.notify_all()
+        browser.quit()
+
+    def close(self) -> None:
+        """
+        Stops every Chrome process of the pool.
+        """
+        with self.condition:
+            browsers, self.browsers = self.browsers, []
+        for browser in browsers:
+            browser.quit()
+
+    def tabs_in_use(self) -> int:
+        with self.condition:
+            return sum(browser.leased for browser in self.browsers)
+
+
+browser_pool = BrowserPool()
+atexit.register(browser_pool.close)
+
+metrics.register_gauge("browser_pool.processes", lambda: len(browser_pool.browsers))
+metrics.register_gauge("browser_pool.tabs_in_use", browser_pool.tabs_in_use)
@@ -1,6 +1,7 @@
 import logging
 from app.services.models.country_schemas import Country, League
-from app.services.scraper.scraper import Scraper
+from app.services.scraper.scraper import Scraper, resilient
+from app.services.scraper.session import NavigationSession
 from app.services.utils import calculate_similarity
 
 XPATH_SHOW_MORE_COUNTRIES = "//span[@class='lmc__itemMore']"
@@ -18,9 +19,10 @@ class CountryScraper(Scraper):
     Inherits from:
         Scraper: Provides base functionality for web scraping using Selenium.
     """
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, session: NavigationSession = None) -> None:
+        super().__init__(session=session)
 
+    @resilient("countries")
     def scrape_countries(self, country_search: str = None, exact_match: bool = False) -> list[Country]:
         """
         Scrapes all available countries from the LiveScore website.
@@ -33,8 +35,11 @@ class CountryScraper(Scraper):
             list[Country]: A list of Country objects containing the name and URL of each country.
         """
         logging.debug("Scraping countries...")
-        show_more_button = self.find_element(XPATH_SHOW_MORE_COUNTRIES)
-        self.execute_script(show_more_button)
+        self.open_home()
+        if not self.session.page_state.get("countries_expanded"):
+            show_more_button = self.find_element(XPATH_SHOW_MORE_COUNTRIES)
+            self.execute_script(show_more_button)
+            self.session.page_state["countries_expanded"] = True
 
         countries_element = self.find_elements(XPATH_COUNTRIES)
         countries = []
@@ -60,6 +65,21 @@ class CountryScraper(Scraper):
         """
         Scrapes all available leagues for a specific country from the LiveScore website.
 
+        The result is memoized for the rest of the navigation session.
+
+        Args:
+            country_id (str): The unique identifier of the country to search for leagues.
+
+        Returns:
+            list[League]: A list of League objects containing league details for the specified country.
+        """
+        return self.session.memo(("country_leagues", country_id), lambda: self.read_leagues_by_country(country_id))
+
+    @resilient("country")
+    def read_leagues_by_country(self, country_id: str) -> list[League]:
+        """
+        Scrapes the leagues of a country, bypassing the navigation memo.
+
         Args:
             country_id (str): The unique identifier of the country to search for leagues.
 
@@ -75,9 +95,11 @@ class CountryScraper(Scraper):
         country = response[0]
         self.get_page(country.url)
 
-        logging.debug("Show more elements...")
-        show_more_button = self.find_element(XPATH_SHOW_MORE_LEAGUES)
-        self.execute_script(show_more_button)
+        if not self.session.page_state.get("leagues_expanded"):
+            logging.debug("Show more elements...")
+            show_more_button = self.find_element(XPATH_SHOW_MORE_LEAGUES)
+            self.execute_script(show_more_button)
+            self.session.page_state["leagues_expanded"] = True
 
         logging.debug("Finding leagues element...")
         leagues_element = self.find_elements(XPATH_LEAGUES)
@@ -0,0 +1,196 @@
+import logging
+import re
+from datetime import datetime
+from typing import Iterable, Optional
+from app.services.models.archive_schemas import Match, LiveMatch
+from config import URL_LIVESPORT_MATCH
+
+EXTRACTION_DOM = "dom"
+EXTRACTION_FEED = "feed"
+
+# The site's data feeds are flat records: '~' ends a record, '¬' ends a field, '÷' separates a key from its value
+RECORD_SEPARATOR = "~"
+FIELD_SEPARATOR = "¬"
+VALUE_SEPARATOR = "÷"
+
+# Match rows
+FIELD_MATCH_ID = "AA"
+FIELD_STATUS = "AB"
+FIELD_STAGE = "AC"
+FIELD_START = "AD"
+FIELD_HOME = "AE"
+FIELD_AWAY = "AF"
+FIELD_HOME_SCORE = "AG"
+FIELD_AWAY_SCORE = "AH"
+FIELD_ROUND = "ER"
+STATUS_LIVE = "2"
+# Stage codes of live matches, shown instead of the running minute
+STAGE_LABELS = {
+    "12": "1st Half",
+    "13": "2nd Half",
+    "38": "Half Time",
+    "6": "Extra Time",
+    "46": "Break Time",
+    "7": "Penalties",
+}
+
+# Statistics rows, grouped in sections ('Match', '1st Half', '2nd Half')
+FIELD_STATS_SECTION = "SE"
+FIELD_STAT_NAME = "SG"
+FIELD_STAT_HOME = "SH"
+FIELD_STAT_AWAY = "SI"
+STATS_SECTION_MATCH = "Match"
+
+MATCH_URL = URL_LIVESPORT_MATCH.split("#")[0] + "#/match-summary"
+
+
+def is_feed(body: Optional[str]) -> bool:
+    return bool(body) and FIELD_SEPARATOR in body and VALUE_SEPARATOR in body
+
+
+def parse_feed(body: str) -> list[dict[str, str]]:
+    """
+    Splits a feed payload into records.
+
+    Args:
+        body (str): The payload (e.g., 'AA÷x1¬AE÷Inter¬~AA÷x2¬...').
+
+    Returns:
+        list[dict[str, str]]: The records, each mapping field keys to values, in payload order.
+    """
+    records = []
+    for raw_record in body.split(RECORD_SEPARATOR):
+        record = {}
+        for field in raw_record.split(FIELD_SEPARATOR):
+            key, separator, value = field.partition(VALUE_SEPARATOR)
+            if separator:
+                record[key.strip()] = value
+        if record:
+            records.append(record)
+    return records
+
+
+def feed_records(responses: Iterable[dict]) -> list[dict[str, str]]:
+    """
+    Parses the feed payloads among captured network responses.
+
+    Args:
+        responses (Iterable[dict]): The responses, as returned by `read_responses`.
+
+    Returns:
+        list[dict[str, str]]: The records of every feed, in capture order.
+    """
+    records = []
+    for response in responses:
+        if is_feed(response.get("body")):
+            records.extend(parse_feed(response["body"]))
+    return records
+
+
+def match_rows(records: Iterable[dict[str, str]]) -> list[dict[str, str]]:
+    """
+    Keeps the match rows of feed records, once per match, with the round inherited from earlier rows if missing.
+
+    Args:
+        records (Iterable[dict[str, str]]): The feed records.
+
+    Returns:
+        list[dict[str, str]]: The match rows, in feed order, the latest version of each match winning.
+    """
+    rows = {}
+    round_label = None
+    for record in records:
+        round_label = record.get(FIELD_ROUND, round_label)
+        if FIELD_MATCH_ID not in record:
+            continue
+        row = dict(record)
+        if round_label is not None:
+            row.setdefault(FIELD_ROUND, round_label)
+        rows[record[FIELD_MATCH_ID]] = row
+    return list(rows.values())
+
+
+def _score(value: Optional[str]) -> int:
+    return int(value) if value and value.isdigit() else 0
+
+
+def to_match(row: dict[str, str], archive_id: str, with_score: bool) -> Optional[Match]:
+    """
+    Builds a result or fixture from a feed match row.
+
+    Args:
+        row (dict[str, str]): The match row.
+        archive_id (str): The unique identifier of the archive the match belongs to.
+        with_score (bool): Whether to read the score, for results.
+
+    Returns:
+        Optional[Match]: The match, or None if the row has no valid start time.
+    """
+    match_id = row[FIELD_MATCH_ID]
+    start = row.get(FIELD_START, "")
+    if not start.isdigit():
+        logging.warning(f"Skipping feed match {match_id} without a valid start time ({start!r})")
+        return None
+    round_number = re.search(r"\d+", row.get(FIELD_ROUND, ""))
+    match = Match.model_construct(
+        id=match_id,
+        archive=archive_id,
+        url=MATCH_URL.replace("{MATCH_ID}", match_id),
+        match_date=datetime.fromtimestamp(int(start)),
+        round=int(round_number.group()) if round_number else 0,
+        home=row.get(FIELD_HOME, ""),
+        away=row.get(FIELD_AWAY, ""),
+        home_score=0,
+        away_score=0,
+    )
+    if with_score:
+        match.home_score = _score(row.get(FIELD_HOME_SCORE))
+        match.away_score = _score(row.get(FIELD_AWAY_SCORE))
+    return match
+
+
+def to_live_match(row: dict[str, str], archive_id: str) -> LiveMatch:
+    """
+    Builds a live match from a feed match row.
+
+    Args:
+        row (dict[str, str]): The match row.
+        archive_id (str): The unique identifier of the archive the match belongs to.
+
+    Returns:
+        LiveMatch: The live match.
+    """
+    match_id = row[FIELD_MATCH_ID]
+    return LiveMatch.model_construct(
+        id=match_id,
+        archive=archive_id,
+        url=MATCH_URL.replace("{MATCH_ID}", match_id),
+        time=STAGE_LABELS.get(row.get(FIELD_STAGE), ""),
+        home=row.get(FIELD_HOME, ""),
+        away=row.get(FIELD_AWAY, ""),
+        home_score=_score(row.get(FIELD_HOME_SCORE)),
+        away_score=_score(row.get(FIELD_AWAY_SCORE)),
+    )
+
+
+def is_live(row: dict[str, str]) -> bool:
+    return row.get(FIELD_STATUS) == STATUS_LIVE
+
+
+def match_stats(records: Iterable[dict[str, str]]) -> dict[str, tuple[str, str]]:
+    """
+    Reads the full-match statistics of a match statistics feed.
+
+    Args:
+        records (Iterable[dict[str, str]]): The feed records.
+
+    Returns:
+        dict[str, tuple[str, str]]: The home and away values, keyed by statistic label (e.g., 'Ball Possession').
+    """
+    stats = {}
+    section = STATS_SECTION_MATCH
+    for record in records:
+        section = record.get(FIELD_STATS_SECTION, section)
+        if section == STATS_SECTION_MATCH and FIELD_STAT_NAME in record:
+            stats[record[FIELD_STAT_NAME]] = (record.get(FIELD_STAT_HOME, ""), record.get(FIELD_STAT_AWAY, ""))
+    return stats
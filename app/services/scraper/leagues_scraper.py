@@ -2,7 +2,8 @@ import logging
 import re
 from app.services.models.league_schemas import League, Archive
 from app.services.scraper.country_scraper import CountryScraper
-from app.services.scraper.scraper import Scraper
+from app.services.scraper.scraper import Scraper, resilient
+from app.services.scraper.session import NavigationSession
 
 XPATH_ARCHIVE_ELEMENT = '//a[@class="tabs__tab archive"]'
 XPATH_LEAGUE_ARCHIVE_LIST = '//*[@id="tournament-page-archiv"]/div[contains(@class, "archive__row")]'
@@ -16,8 +17,8 @@ class LeagueScraper(Scraper):
     Inherits from:
         Scraper: Provides base functionality for web scraping using Selenium.
     """
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, session: NavigationSession = None) -> None:
+        super().__init__(session=session)
 
     def scrape_league(self, league_id: str) -> League:
         """
@@ -39,7 +40,7 @@ class LeagueScraper(Scraper):
 
         logging.debug(f"Scraping leagues for country: {country}")
 
-        country_scraper = CountryScraper()
+        country_scraper = CountryScraper(session=self.session)
         leagues = country_scraper.scrape_leagues_by_country(country)
 
         url = next((league.url for league in leagues if league.name == league_name), None)
@@ -59,6 +60,21 @@ class LeagueScraper(Scraper):
         """
         Scrapes archives for a specific league identified by its league ID.
 
+        The result is memoized for the rest of the navigation session.
+
+        Args:
+            league_id (str): The unique identifier of the league.
+
+        Returns:
+            list[Archive]: A list of Archive objects containing archive details for the specified league.
+        """
+        return self.session.memo(("league_archives", league_id), lambda: self.read_league_archives(league_id))
+
+    @resilient("league")
+    def read_league_archives(self, league_id: str) -> list[Archive]:
+        """
+        Scrapes the archives of a league, bypassing the navigation memo.
+
         Args:
             league_id (str): The unique identifier of the league.
 
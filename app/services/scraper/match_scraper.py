@@ -1,7 +1,11 @@
 import logging
 import re
+from typing import Optional
+from app.services.fields import wanted
 from app.services.models.match_schemas import Match
-from app.services.scraper.scraper import Scraper
+from app.services.scraper.feed import match_stats
+from app.services.scraper.scraper import Scraper, resilient
+from app.services.scraper.session import NavigationSession
 from app.services.utils import get_match_datetime
 from config import URL_LIVESPORT_MATCH
 
@@ -12,6 +16,8 @@ XPATH_AWAY_TEAM = '//*[@id="detail"]/div[4]/div[4]/div[3]/div[1]/a'
 XPATH_STATS_BUTTON = '//*[@id="detail"]/div[7]/div/a[2]'
 XPATH_HOME_SCORE = '//*[@id="detail"]/div[4]/div[3]/div[1]/div[1]/span[1]'
 XPATH_AWAY_SCORE = '//*[@id="detail"]/div[4]/div[3]/div[1]/div[1]/span[3]'
+XPATH_DETAIL = '//*[@id="detail"]'
+XPATH_STATUS_FROM_DETAIL = ".//div[contains(@class, 'detailScore__status')]"
 XPATH_STATS = '//*[@id="detail"]/div[9]/div'
 XPATH_NAME_STAT = './div[1]/div[2]/strong[1]'
 XPATH_FIRST_STAT = './div[1]/div[1]/strong[1]'
@@ -32,6 +38,36 @@ stat_mapping = {
 }
 
 
+def stat_attribute(stat_name: str) -> str:
+    """
+    Converts a statistic label as shown on the match page into the `Match` attribute storing it.
+
+    Args:
+        stat_name (str): The statistic label (e.g., 'Expected Goals (xG)').
+
+    Returns:
+        str: The attribute name (e.g., 'expected_goals_xg').
+    """
+    return stat_name.lower().replace(' ', '_').replace('(', '').replace(')', '')
+
+
+STAT_ATTRIBUTES = [stat_attribute(stat_name) for stat_name in stat_mapping]
+FINAL_STATUSES = {'FINISHED', 'AFTER EXTRA TIME', 'AFTER PENALTIES', 'AWARDED'}
+
+
+def is_final(match: Match) -> bool:
+    """
+    Checks whether a scraped match is over and its details can no longer change.
+
+    Args:
+        match (Match): The scraped match data.
+
+    Returns:
+        bool: True if the match has a final status and its statistics were read.
+    """
+    return match.status.upper() in FINAL_STATUSES and match.played
+
+
 class MatchScraper(Scraper):
     """
     Handles the scraping of match data.
@@ -39,15 +75,20 @@ class MatchScraper(Scraper):
     Inherits from:
         Scraper: Provides base functionality for web scraping using Selenium.
     """
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, session: NavigationSession = None) -> None:
+        super().__init__(session=session)
 
-    def scrape_match(self, match_id: str) -> Match:
+    @resilient("match")
+    def scrape_match(self, match_id: str, fields: Optional[frozenset[str]] = None) -> Match:
         """
         Scrapes match data for a specific match identified by its ID.
 
+        Only the requested attributes are looked up: the statistics section is not opened unless a statistic, the
+        score or the played flag is requested, and statistics rows not requested are skipped after reading their label.
+
         Args:
             match_id (str): The unique identifier of the match.
+            fields (frozenset[str], optional): The attributes to extract, None for all. Defaults to None.
 
         Returns:
             Match: The scraped match data.
@@ -58,14 +99,28 @@ class MatchScraper(Scraper):
         logging.debug(f"Reached URL {URL_LIVESPORT_MATCH.replace('{MATCH_ID}', match_id)}")
 
         match = Match(id=match_id)
-        round_element = self.find_element(XPATH_ROUND)
-        match.round = int(re.search(r'ROUND (\d+)', (round_element.text)).group(1))
-        datetime_element = self.find_element(XPATH_DATETIME)
-        match.match_date = get_match_datetime(datetime_element.text)
-        home_element = self.find_element(XPATH_HOME_TEAM)
-        match.home = home_element.text
-        away_element = self.find_element(XPATH_AWAY_TEAM)
-        match.away = away_element.text
+        if wanted(fields, "round"):
+            round_element = self.find_element(XPATH_ROUND)
+            match.round = int(re.search(r'ROUND (\d+)', (round_element.text)).group(1))
+        if wanted(fields, "match_date"):
+            datetime_element = self.find_element(XPATH_DATETIME)
+            match.match_date = get_match_datetime(datetime_element.text)
+        if wanted(fields, "home"):
+            home_element = self.find_element(XPATH_HOME_TEAM)
+            match.home = home_element.text
+        if wanted(fields, "away"):
+            away_element = self.find_element(XPATH_AWAY_TEAM)
+            match.away = away_element.text
+
+        if wanted(fields, "status"):
+            # The header is rendered at this point, so the status is looked up without waiting
+            status_elements = self.find_elements(XPATH_STATUS_FROM_DETAIL, element=self.find_element(XPATH_DETAIL))
+            if status_elements:
+                match.status = status_elements[0].text.strip()
+
+        stats = [name for name in stat_mapping if wanted(fields, stat_attribute(name))]
+        if not stats and not wanted(fields, "played", "home_score", "away_score"):
+            return match
 
         read_stats = True
         try:
@@ -75,23 +130,37 @@ class MatchScraper(Scraper):
             logging.debug("The match hasn't already played, stats are not available")
             read_stats = False
 
+        match.played = read_stats
         if read_stats:
-            home_score_element = self.find_element(XPATH_HOME_SCORE)
-            match.home_score = int(home_score_element.text)
-            away_score_element = self.find_element(XPATH_AWAY_SCORE)
-            match.away_score = int(away_score_element.text)
+            if wanted(fields, "home_score"):
+                home_score_element = self.find_element(XPATH_HOME_SCORE)
+                match.home_score = int(home_score_element.text)
+            if wanted(fields, "away_score"):
+                away_score_element = self.find_element(XPATH_AWAY_SCORE)
+                match.away_score = int(away_score_element.text)
+            if not stats:
+                return match
+
+            if self.reads_feeds:
+                records = self.read_feed(lambda records: bool(match_stats(records)), temporary=True)
+                if records is not None:
+                    for name, (first_stat, second_stat) in match_stats(records).items():
+                        if name in stats:
+                            setattr(match, stat_attribute(name), stat_mapping[name](first_stat, second_stat))
+                    return match
+                logging.debug("No statistics feed captured, reading the page instead")
 
             stats_elements = self.find_elements(XPATH_STATS)
             for stat_element in stats_elements:
                 name_stat_element = self.find_element(XPATH_NAME_STAT, stat_element)
                 name_element = name_stat_element.text
+                if name_element not in stats:
+                    continue
                 first_stat_element = self.find_element(XPATH_FIRST_STAT, stat_element)
                 first_stat = first_stat_element.text
                 second_stat_element = self.find_element(XPATH_SECOND_STAT, stat_element)
                 second_stat = second_stat_element.text
 
-                if name_element in stat_mapping:
-                    setattr(match, name_element.lower().replace(' ', '_').replace('(', '').replace(')', ''),
-                            stat_mapping[name_element](first_stat, second_stat))
+                setattr(match, stat_attribute(name_element), stat_mapping[name_element](first_stat, second_stat))
 
         return match
@@ -0,0 +1,102 @@
+import re
+from datetime import datetime
+from typing import Optional
+from urllib.parse import urljoin
+import lxml.html
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+from app.services.recorder import RecordingStore, RecordingNotFound
+
+# Attributes that Selenium resolves against the page URL
+URL_ATTRIBUTES = {"href", "src"}
+# DOM properties that Selenium's get_attribute falls back to
+TEXT_PROPERTIES = {"textContent", "innerText"}
+
+
+class ReplayElement:
+    """
+    A recorded DOM element, exposing the subset of Selenium's WebElement used by the scrapers.
+    """
+    def __init__(self, driver: "ReplayDriver", node) -> None:
+        self.driver = driver
+        self.node = node
+
+    @property
+    def text(self) -> str:
+        # Approximates the rendered text: collapsed whitespace, one line per text block
+        lines = (re.sub(r"[ \t\xa0]+", " ", line).strip() for line in self.node.text_content().splitlines())
+        return "\n".join(line for line in lines if line)
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        if name in TEXT_PROPERTIES:
+            return self.node.text_content()
+        value = self.node.get(name)
+        if value is not None and name in URL_ATTRIBUTES:
+            return urljoin(self.driver.current_url, value)
+        return value
+
+    def is_displayed(self) -> bool:
+        return True
+
+    def click(self) -> None:
+        pass
+
+    def find_element(self, by: str = By.XPATH, value: str = None) -> "ReplayElement":
+        return self.driver.first(self.node, value)
+
+    def find_elements(self, by: str = By.XPATH, value: str = None) -> list["ReplayElement"]:
+        return self.driver.all(self.node, value)
+
+
+class ReplayDriver:
+    """
+    A WebDriver stand-in that serves recorded page snapshots instead of loading pages.
+
+    Navigation loads the snapshot of the URL, clicks and scripts do nothing, and XPath lookups run on the recorded
+    DOM, so scrapers run without network or browser at parsing speed.
+
+    Attributes:
+        recordings (RecordingStore): The snapshots to replay.
+        at (datetime, optional): Replays pages as they were at this time. Defaults to the latest captures.
+    """
+    def __init__(self, recordings: RecordingStore, at: Optional[datetime] = None) -> None:
+        self.recordings = recordings
+        self.at = at
+        self.current_url = None
+        self.page_source = ""
+        self.responses = []
+        self.document = None
+
+    def get(self, url: str) -> None:
+        recording = self.recordings.load(url, self.at)
+        if recording is None:
+            raise RecordingNotFound(url)
+        self.current_url = recording["current_url"] or url
+        self.page_source = recording["page_source"]
+        self.responses = recording["responses"]
+        self.document = lxml.html.fromstring(self.page_source)
+
+    def first(self, node, xpath: str) -> ReplayElement:
+        nodes = node.xpath(xpath) if node is not None else []
+        if not nodes:
+            raise NoSuchElementException(f"Unable to locate element: {xpath}")
+        return ReplayElement(self, nodes[0])
+
+    def all(self, node, xpath: str) -> list[ReplayElement]:
+        nodes = node.xpath(xpath) if node is not None else []
+        return [ReplayElement(self, found) for found in nodes]
+
+    def find_element(self, by: str = By.XPATH, value: str = None) -> ReplayElement:
+        return self.first(self.document, value)
+
+    def find_elements(self, by: str = By.XPATH, value: str = None) -> list[ReplayElement]:
+        return self.all(self.document, value)
+
+    def execute_script(self, script: str, *args) -> None:
+        pass
+
+    def delete_all_cookies(self) -> None:
+        pass
+
+    def quit(self) -> None:
+        self.document = None
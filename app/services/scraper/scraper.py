@@ -1,68 +1,211 @@
+import functools
 import logging
+import time
+from typing import Callable, Optional
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.wait import WebDriverWait
-from app.services.utils import get_driver
+from app.services.scraper.session import NavigationSession, current_session
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from time import sleep
-from config import TIMEOUT, URL_LIVESPORT, SIMULATE_WAITING_HUMAN_BEING
+from app.services import deadline
+from app.services.circuit_breaker import get_breaker
+from app.services.deadline import DeadlineExceeded
+from app.services.metrics import metrics
+from app.services.scraper.feed import EXTRACTION_FEED, feed_records
+from logger.logger_config import SampledLogger
+from config import TIMEOUT, URL_LIVESPORT, SIMULATE_WAITING_HUMAN_BEING, SCRAPE_RETRIES, EXTRACTION_MODE
 
 XPATH_FOOTBALL_BUTTON = "/html/body/nav/div/div[1]/a[1]"
+HOME_PAGE = "football-home"
+TEMPORARY_TIMEOUT = 10
+FEED_POLL_INTERVAL = 0.25
+
+# Per-element events are the bulk of debug logging on big pages, only a sample of them is kept
+element_log = SampledLogger("app.scraper.elements")
+
+
+def resilient(page_type: str):
+    """
+    Guards a scraper method that loads an upstream page of the given type.
+
+    Timeouts count as failures of the page type's circuit breaker, which makes the following calls fail fast with
+    `CircuitOpenError` while upstream is struggling. Other WebDriver failures (crashed browser, stale elements) restart
+    the session's browser and retry the call up to `SCRAPE_RETRIES` times. Only the outermost guarded call retries, so
+    nested scrapers do not multiply the attempts.
+
+    Args:
+        page_type (str): The upstream page type (e.g., 'matches', 'match').
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            breaker = get_breaker(page_type)
+            session = self.session
+            attempts = SCRAPE_RETRIES + 1 if session.guard_depth == 0 else 1
+            for attempt in range(1, attempts + 1):
+                breaker.before_call()
+                session.guard_depth += 1
+                try:
+                    result = method(self, *args, **kwargs)
+                except TimeoutException as ex:
+                    if getattr(ex, "breaker_recorded", False):
+                        breaker.release()
+                    else:
+                        ex.breaker_recorded = True
+                        breaker.record_failure()
+                    raise
+                except WebDriverException as ex:
+                    breaker.release()
+                    if attempt == attempts:
+                        raise
+                    logging.warning(f"Scraping {page_type} failed ({ex.__class__.__name__}), "
+                                    f"retrying on a fresh browser ({attempt}/{attempts - 1})")
+                    metrics.increment("scraper.retries")
+                    session.restart()
+                except Exception:
+                    breaker.release()
+                    raise
+                else:
+                    breaker.record_success()
+                    return result
+                finally:
+                    session.guard_depth -= 1
+        return wrapper
+    return decorator
 
 class Scraper:
     """
     A web scraper class to interact with web pages using Selenium WebDriver.
 
+    Scrapers created while handling a request share the request's navigation session, hence a single browser;
+    scrapers created elsewhere (e.g., worker threads, command-line tools) open a private session.
+
     Attributes:
+        session: The navigation session holding the browser and the per-request navigation memo.
         driver: The Selenium WebDriver instance used for browsing and interacting with web pages.
     """
-    def __init__(self, url: str = None) -> None:
+    def __init__(self, url: str = None, session: NavigationSession = None) -> None:
         """
-        Initializes the Scraper class with a Selenium WebDriver instance.
+        Initializes the Scraper class with a navigation session.
+
+        The football homepage is no longer loaded eagerly: scrapers navigate to their target page directly and
+        call `open_home` only when they need the homepage.
 
         Args:
-            url (str, optional): The URL of the web page to navigate to. Defaults to `URL_LIVESPORT`.
+            url (str, optional): The URL of the web page to navigate to. Defaults to None.
+            session (NavigationSession, optional): The session to share, e.g. the one of a parent scraper.
+                Defaults to the current request's session, or a new private session outside requests.
         """
-        self.driver = get_driver()
-        self.wait = WebDriverWait(self.driver, timeout=TIMEOUT)
-        self.temporary_wait = WebDriverWait(self.driver, timeout=10)
+        if session is None:
+            session = current_session.get()
+        self.owns_session = session is None
+        self.session = session if session is not None else NavigationSession()
 
         if url:
-            self.driver.get(url)
-        else:
-            self.driver.get(URL_LIVESPORT)
+            self.get_page(url)
 
-            button_football_page = self.find_element(XPATH_FOOTBALL_BUTTON)
-            button_football_page.click()
-            logging.debug(f"Reached football page: {self.driver.current_url}")
+    @property
+    def driver(self):
+        return self.session.driver
+
+    @property
+    def wait(self) -> WebDriverWait:
+        return WebDriverWait(self.driver, timeout=deadline.remaining(TIMEOUT))
+
+    @property
+    def temporary_wait(self) -> WebDriverWait:
+        return WebDriverWait(self.driver, timeout=deadline.remaining(TEMPORARY_TIMEOUT))
+
+
+    def open_home(self) -> None:
+        """
+        Navigates to the football homepage, unless the session is already on it.
+        """
+        if self.session.current_url == HOME_PAGE:
+            self.session.memo_hits += 1
+            return
+
+        self.get_page(URL_LIVESPORT)
+        button_football_page = self.find_element(XPATH_FOOTBALL_BUTTON)
+        button_football_page.click()
+        self.session.moved(HOME_PAGE)
+        logging.debug("Reached football page")
 
 
     def get_page(self, url: str) -> None:
         """
-        Navigates the WebDriver to the specified URL.
+        Navigates the WebDriver to the specified URL, unless the session is already on it.
 
         Args:
             url (str): The URL of the web page to navigate to.
+
+        Raises:
+            DeadlineExceeded: If the request's budget is already exhausted.
         """
-        logging.debug(f"Navigating to {url}")
-        self.driver.get(url)
-        logging.debug(f"Page navigated: {self.driver.current_url}")
+        logging.debug("Navigating to %s", url)
+        deadline.remaining(TIMEOUT)
+        if self.session.navigate(url):
+            logging.debug("Page navigated: %s", url)
 
 
     def wait_an_element(self, xpath: str, temporary: bool = False) -> None:
         """
         Waits for an element to become visible based on the specified XPath.
 
+        The wait is capped by the remaining time budget of the current request, if any. When replaying recordings,
+        the page never changes, so a missing element fails right away.
+
         Args:
             xpath (str): The XPath of the element to wait for.
             temporary (bool, optional): Whether to use a temporary wait time. Defaults to False.
+
+        Raises:
+            DeadlineExceeded: If the request's budget runs out before the element is visible.
         """
-        logging.debug(f"Waiting for {xpath}")
-        if temporary:
-            self.temporary_wait.until(EC.visibility_of_element_located((By.XPATH, xpath)))
-        else:
-            self.wait.until(EC.visibility_of_element_located((By.XPATH, xpath)))
-        logging.debug(f"Element {xpath} is visible")
+        element_log.debug("Waiting for %s", xpath)
+        timeout = 0 if self.session.replaying else TEMPORARY_TIMEOUT if temporary else TIMEOUT
+        budget = deadline.remaining(timeout)
+        try:
+            WebDriverWait(self.driver, timeout=budget).until(EC.visibility_of_element_located((By.XPATH, xpath)))
+        except TimeoutException:
+            if budget < timeout:
+                raise DeadlineExceeded() from None
+            raise
+        element_log.debug("Element %s is visible", xpath)
+
+
+    @property
+    def reads_feeds(self) -> bool:
+        return EXTRACTION_MODE == EXTRACTION_FEED
+
+
+    def read_feed(self, ready: Callable[[list[dict]], bool], temporary: bool = False) -> Optional[list[dict]]:
+        """
+        Waits for the data feeds fetched by the current page to hold the records a scraper needs.
+
+        The wait is capped by the remaining time budget of the current request, if any. When replaying recordings,
+        the recorded feeds are checked once.
+
+        Args:
+            ready (Callable[[list[dict]], bool]): Returns True once the records received so far are enough.
+            temporary (bool, optional): Whether to use a temporary wait time. Defaults to False.
+
+        Returns:
+            Optional[list[dict]]: The records of every feed of the page, or None if they were not ready in time.
+        """
+        timeout = 0 if self.session.replaying else TEMPORARY_TIMEOUT if temporary else TIMEOUT
+        give_up = time.monotonic() + deadline.remaining(timeout)
+        while True:
+            records = feed_records(self.session.responses())
+            if ready(records):
+                metrics.increment("feed.extractions")
+                return records
+            if time.monotonic() >= give_up:
+                metrics.increment("feed.fallbacks")
+                return None
+            sleep(FEED_POLL_INTERVAL)
 
 
     def find_element(self, xpath: str, element: WebElement = None, temporary: bool = False) -> WebElement:
@@ -77,7 +220,7 @@ class Scraper:
         Returns:
             WebElement: The web element located using the specified XPath.
         """
-        logging.debug(f"Finding {xpath}")
+        element_log.debug("Finding %s", xpath)
 
         if element is None:
             self.wait_an_element(xpath, temporary=temporary)
@@ -85,29 +228,30 @@ class Scraper:
         else:
             element = element.find_element(By.XPATH, xpath)
 
-        logging.debug(f"Element {xpath} found")
+        element_log.debug("Element %s found", xpath)
         return element
 
 
-    def find_elements(self, xpath: str, element: WebElement = None) -> list[WebElement]:
+    def find_elements(self, xpath: str, element: WebElement = None, temporary: bool = False) -> list[WebElement]:
         """
         Finds and returns a list of web elements based on the given XPath.
 
         Args:
             xpath (str): The XPath of the elements to locate.
             element (WebElement, optional): A parent web element to search within. Defaults to None.
+            temporary (bool, optional): Whether to use a temporary wait time. Defaults to False.
 
         Returns:
             list[WebElement]: A list of web elements located using the specified XPath.
         """
-        logging.debug(f"Finding elements {xpath}")
+        element_log.debug("Finding elements %s", xpath)
 
         if element is None:
-            self.wait_an_element(f"{xpath}[1]")
+            self.wait_an_element(f"{xpath}[1]", temporary=temporary)
             elements = self.driver.find_elements(By.XPATH, xpath)
         else:
             elements = element.find_elements(By.XPATH, xpath)
-        logging.debug(f"Found {len(elements)} elements")
+        element_log.debug("Found %d elements", len(elements))
         return elements
 
 
@@ -119,14 +263,18 @@ class Scraper:
             element (WebElement): The web element on which to execute the script.
             script (str, optional): The JavaScript action to execute. Defaults to 'click'.
         """
-        logging.debug(f"Executing {script}")
+        element_log.debug("Executing %s", script)
 
-        # Simulate human-like behavior by adding a 5-second sleep
-        sleep(SIMULATE_WAITING_HUMAN_BEING)
+        # Simulate human-like behavior by adding a 5-second sleep, unless the request's budget cannot afford it
+        # or recordings are replayed
+        if not self.session.replaying:
+            if deadline.remaining(SIMULATE_WAITING_HUMAN_BEING) < SIMULATE_WAITING_HUMAN_BEING:
+                raise DeadlineExceeded()
+            sleep(SIMULATE_WAITING_HUMAN_BEING)
 
         if script == 'click':
             self.driver.execute_script("arguments[0].click();", element)
-            logging.debug(f"Element {script} executed")
+            element_log.debug("Element %s executed", script)
 
 
     def get_attribute(self, element: WebElement, attribute: str = 'href') -> str:
@@ -140,8 +288,19 @@ class Scraper:
         Returns:
             str: The value of the specified attribute.
         """
-        logging.debug(f"Get attribute {attribute} from element {element}")
+        element_log.debug("Get attribute %s", attribute)
         value = element.get_attribute(attribute)
-        logging.debug(f"Attribute value {value}")
+        element_log.debug("Attribute value %s", value)
 
         return value
+
+
+    def close(self) -> None:
+        """
+        Quits the WebDriver, closing the browser, if the scraper owns its session.
+
+        Request sessions are closed by the request middleware instead.
+        """
+        if self.owns_session:
+            logging.debug("Closing WebDriver")
+            self.session.close()
@@ -0,0 +1,225 @@
+import logging
+import threading
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Callable, Optional, TypeVar
+from selenium import webdriver
+from app.services.metrics import metrics
+from app.services.scraper.browser_pool import browser_pool
+from app.services.network import read_responses
+from app.services.page_archive import page_archive
+from app.services.recorder import recordings, CAPTURE_RECORD, CAPTURE_REPLAY
+from app.services.scraper.replay_driver import ReplayDriver
+from app.services.utils import get_driver
+from app.services.scraper.feed import EXTRACTION_FEED
+from config import CAPTURE_MODE, EXTRACTION_MODE, TABS_PER_BROWSER, PAGE_ARCHIVE_ENABLE
+
+T = TypeVar("T")
+
+current_session: ContextVar[Optional["NavigationSession"]] = ContextVar("current_session", default=None)
+
+
+class NavigationSession:
+    """
+    Browser and navigation state shared by all the scrapers working on the same request.
+
+    The browser is started on first use. Navigating to the URL the browser is already on is skipped, and entities
+    resolved earlier in the request (country leagues, league archives, archives) are memoized, so nested scrapers
+    never load the same page twice.
+
+    In capture mode ('record'), a snapshot of every page is recorded, with its network responses, when the session
+    leaves it. In replay mode ('replay'), pages are served from those recordings instead of a browser. Otherwise,
+    with `TABS_PER_BROWSER` above 1, the session browses in a tab of a shared Chrome process (see `BrowserPool`).
+    With `PAGE_ARCHIVE_ENABLE`, every page the browser leaves is also added to the page archive (see `PageArchive`).
+
+    When recording, or when `EXTRACTION_MODE` is 'feed', the network responses of the current page are collected, for
+    scrapers to read the site's data feeds (see `responses`). Such sessions always use a Chrome process of their own,
+    as network logs are per process.
+
+    Attributes:
+        mode (str): The capture mode: 'off', 'record' or 'replay'.
+        source: The snapshots replayed in replay mode: the recordings, or the page archive. Defaults to the recordings.
+        current_url (str): The URL last requested, or None if the browser is not on a known page.
+        page_state (dict): Interaction flags of the current page (e.g., expanded lists), reset on navigation.
+        page_responses (list[dict]): The network responses of the current page collected so far, when capturing.
+        page_loads (int): The number of pages actually loaded.
+        memo_hits (int): The number of navigations and resolutions answered from the memo.
+        guard_depth (int): The number of nested resilient scraper calls in progress.
+    """
+    def __init__(self, mode: str = CAPTURE_MODE, replay_at: Optional[datetime] = None, source=None) -> None:
+        self.mode = mode
+        self.replay_at = replay_at
+        self.source = source
+        self._driver = None
+        self.lock = threading.RLock()
+        self.current_url = None
+        self.page_state = {}
+        self.page_responses = []
+        self.memo_entries = {}
+        self.page_loads = 0
+        self.memo_hits = 0
+        self.guard_depth = 0
+
+    @property
+    def driver(self) -> webdriver.Chrome:
+        with self.lock:
+            if self._driver is None:
+                if self.replaying:
+                    self._driver = ReplayDriver(self.source or recordings, self.replay_at)
+                elif self.capturing:
+                    self._driver = get_driver(capture_network=True)
+                elif TABS_PER_BROWSER > 1:
+                    self._driver = browser_pool.acquire()
+                else:
+                    self._driver = get_driver()
+            return self._driver
+
+    @property
+    def started(self) -> bool:
+        return self._driver is not None
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == CAPTURE_REPLAY
+
+    @property
+    def capturing(self) -> bool:
+        return self.mode == CAPTURE_RECORD or (EXTRACTION_MODE == EXTRACTION_FEED and not self.replaying)
+
+    def responses(self) -> list[dict]:
+        """
+        Returns the network responses received since the current page was loaded.
+
+        When replaying, these are the responses recorded with the page.
+
+        Returns:
+            list[dict]: The responses, each with its url, status, mime_type, type and body.
+        """
+        with self.lock:
+            if self.replaying:
+                return list(self._driver.responses) if self._driver is not None else []
+            if self.capturing and self._driver is not None:
+                self.page_responses.extend(read_responses(self._driver))
+            return list(self.page_responses)
+
+    def record_page(self) -> None:
+        """
+        Records the page the browser is on, as the scrapers left it, in capture mode, and adds it to the page archive
+        when enabled.
+
+        Recording failures are logged and never fail the scrape.
+        """
+        archiving = PAGE_ARCHIVE_ENABLE and not self.replaying
+        if (self.mode != CAPTURE_RECORD and not archiving) or self._driver is None or self.current_url is None:
+            return
+        try:
+            page_source = self._driver.page_source
+            if self.mode == CAPTURE_RECORD:
+                recordings.save(self.current_url, self._driver.current_url, page_source, self.responses())
+                metrics.increment("capture.pages_recorded")
+            if archiving:
+                page_archive.save(self.current_url, self._driver.current_url, page_source)
+        except Exception as ex:
+            logging.warning(f"Unable to record {self.current_url}: {ex}")
+
+    def navigate(self, url: str) -> bool:
+        """
+        Loads a URL unless the browser is already on it.
+
+        Args:
+            url (str): The URL to navigate to.
+
+        Returns:
+            bool: True if the page was loaded, False if the memo made the load unnecessary.
+        """
+        with self.lock:
+            if url == self.current_url:
+                self.memo_hits += 1
+                logging.debug(f"Already on {url}, page load skipped")
+                return False
+            self.record_page()
+            if self.capturing and self._driver is not None:
+                # Responses still in the log belong to the page being left
+                read_responses(self._driver)
+            self.page_responses = []
+            self.driver.get(url)
+            self.page_loads += 1
+            self.current_url = url
+            self.page_state = {}
+            return True
+
+    def moved(self, url: Optional[str] = None) -> None:
+        """
+        Records a navigation triggered by an interaction (e.g., a click on a link).
+
+        Args:
+            url (str, optional): The URL reached. Defaults to unknown, which disables the memo for the next load.
+        """
+        with self.lock:
+            self.record_page()
+            self.page_loads += 1
+            self.current_url = url
+            self.page_state = {}
+            self.page_responses = []
+
+    def memo(self, key: tuple, resolve: Callable[[], T]) -> T:
+        """
+        Returns the value resolved for a key earlier in the session, resolving it on first use.
+
+        Args:
+            key (tuple): Identifies the entity (e.g., ('archive', archive_id)).
+            resolve (Callable[[], T]): Scrapes the entity.
+
+        Returns:
+            T: The resolved entity.
+        """
+        with self.lock:
+            if key in self.memo_entries:
+                self.memo_hits += 1
+                return self.memo_entries[key]
+        value = resolve()
+        with self.lock:
+            self.memo_entries[key] = value
+        return value
+
+    def restart(self) -> None:
+        """
+        Replaces a crashed or stuck browser with a fresh one, started on next use.
+
+        The memo of resolved entities is kept, only the navigation state is reset.
+        """
+        with self.lock:
+            driver, self._driver = self._driver, None
+            self.current_url = None
+            self.page_state = {}
+            self.page_responses = []
+        metrics.increment("navigation.restarts")
+        if driver is not None:
+            try:
+                driver.quit()
+            except Exception as ex:
+                logging.debug(f"Unable to quit WebDriver: {ex}")
+
+    def close(self) -> None:
+        """
+        Quits the browser, if it was started, and records the session's navigation metrics.
+        """
+        with self.lock:
+            self.record_page()
+            driver, self._driver = self._driver, None
+        if driver is not None:
+            metrics.increment("navigation.sessions")
+            metrics.increment("navigation.page_loads", self.page_loads)
+            metrics.increment("navigation.memo_hits", self.memo_hits)
+            try:
+                driver.quit()
+            except Exception as ex:
+                logging.debug(f"Unable to quit WebDriver: {ex}")
+
+
+def _page_loads_per_session() -> float:
+    sessions = metrics.count("navigation.sessions")
+    return round(metrics.count("navigation.page_loads") / sessions, 2) if sessions else 0.0
+
+
+metrics.register_gauge("navigation.page_loads_per_session", _page_loads_per_session)
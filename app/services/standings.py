@@ -0,0 +1,142 @@
+from datetime import date, datetime, time
+from typing import Optional
+import numpy as np
+from app.services.models.archive_schemas import Match, Rank
+
+POINTS_WIN = 3
+POINTS_DRAW = 1
+
+
+class ResultColumns:
+    """
+    Columnar view of an archive's results, with teams encoded as indices into a sorted name array.
+
+    Attributes:
+        ids (np.ndarray): The match IDs.
+        teams (np.ndarray): The sorted team names.
+        home (np.ndarray): Index of the home team of each match.
+        away (np.ndarray): Index of the away team of each match.
+        home_goals (np.ndarray): Goals scored by the home team of each match.
+        away_goals (np.ndarray): Goals scored by the away team of each match.
+        rounds (np.ndarray): Round number of each match.
+        dates (np.ndarray): Kick-off time of each match, as datetime64.
+    """
+    def __init__(self, matches: list[Match]) -> None:
+        count = len(matches)
+        self.ids = np.array([getattr(match, "id", "") for match in matches], dtype=object)
+        names = np.array([match.home for match in matches] + [match.away for match in matches], dtype=object)
+        self.teams, codes = np.unique(names.astype(str), return_inverse=True)
+        self.home = codes[:count]
+        self.away = codes[count:]
+        self.home_goals = np.fromiter((match.home_score for match in matches), dtype=np.int64, count=count)
+        self.away_goals = np.fromiter((match.away_score for match in matches), dtype=np.int64, count=count)
+        self.rounds = np.fromiter((match.round for match in matches), dtype=np.int64, count=count)
+        self.dates = np.array([match.match_date for match in matches], dtype="datetime64[s]")
+
+    def __len__(self) -> int:
+        return len(self.home)
+
+    def mask(self, as_of_round: Optional[int] = None, as_of_date: Optional[date] = None) -> np.ndarray:
+        """
+        Selects the matches played up to a round and/or a date (both inclusive).
+
+        Args:
+            as_of_round (int, optional): The last round to include. Defaults to all rounds.
+            as_of_date (date, optional): The last day to include. Defaults to all dates.
+
+        Returns:
+            np.ndarray: A boolean mask over the matches.
+        """
+        selected = np.ones(len(self), dtype=bool)
+        if as_of_round is not None:
+            selected &= self.rounds <= as_of_round
+        if as_of_date is not None:
+            if not isinstance(as_of_date, datetime):
+                as_of_date = datetime.combine(as_of_date, time.max)
+            selected &= self.dates <= np.datetime64(as_of_date, "s")
+        return selected
+
+
+def compute_standings(columns: ResultColumns, as_of_round: Optional[int] = None,
+                      as_of_date: Optional[date] = None) -> list[Rank]:
+    """
+    Computes the league table from results with a group-by over home and away team indices.
+
+    Teams are ordered by points, goal difference, goals scored and name. Competition-specific tie-breakers
+    (head-to-head, fair play) and point deductions are not applied, which is what a cross-check with the scraped
+    standings is for.
+
+    Args:
+        columns (ResultColumns): The results of the archive.
+        as_of_round (int, optional): Only count matches up to this round. Defaults to all rounds.
+        as_of_date (date, optional): Only count matches up to this day. Defaults to all dates.
+
+    Returns:
+        list[Rank]: The standings, one entry per team of the season.
+    """
+    selected = columns.mask(as_of_round, as_of_date)
+    home, away = columns.home[selected], columns.away[selected]
+    home_goals, away_goals = columns.home_goals[selected], columns.away_goals[selected]
+    size = len(columns.teams)
+
+    def per_team(home_values: np.ndarray, away_values: np.ndarray) -> np.ndarray:
+        return (np.bincount(home, weights=home_values, minlength=size)
+                + np.bincount(away, weights=away_values, minlength=size)).astype(np.int64)
+
+    home_win = home_goals > away_goals
+    away_win = home_goals < away_goals
+    draw = ~(home_win | away_win)
+
+    played = np.bincount(home, minlength=size) + np.bincount(away, minlength=size)
+    wins = per_team(home_win, away_win)
+    draws = per_team(draw, draw)
+    losses = per_team(away_win, home_win)
+    goals_scored = per_team(home_goals, away_goals)
+    goals_conceded = per_team(away_goals, home_goals)
+    points = POINTS_WIN * wins + POINTS_DRAW * draws
+
+    # np.lexsort sorts by the last key first; team indices follow alphabetical order
+    order = np.lexsort((np.arange(size), -goals_scored, -(goals_scored - goals_conceded), -points))
+
+    return [
+        Rank(
+            position=position + 1,
+            team=str(columns.teams[team]),
+            matches_played=int(played[team]),
+            wins=int(wins[team]),
+            draws=int(draws[team]),
+            losses=int(losses[team]),
+            goals_scored=int(goals_scored[team]),
+            goals_conceded=int(goals_conceded[team]),
+            points=int(points[team]),
+        )
+        for position, team in enumerate(order)
+    ]
+
+
+def compare_standings(derived: list[Rank], scraped: list[Rank]) -> list[str]:
+    """
+    Lists the differences between derived standings and the standings scraped from the site.
+
+    Args:
+        derived (list[Rank]): The standings computed from results.
+        scraped (list[Rank]): The standings scraped from the standings page.
+
+    Returns:
+        list[str]: One human-readable line per differing value; empty when the tables agree.
+    """
+    differences = []
+    derived_by_team = {rank.team: rank for rank in derived}
+    for scraped_rank in scraped:
+        derived_rank = derived_by_team.pop(scraped_rank.team, None)
+        if derived_rank is None:
+            differences.append(f"{scraped_rank.team}: missing from derived standings")
+            continue
+        for field in ("position", "matches_played", "wins", "draws", "losses", "goals_scored", "goals_conceded",
+                      "points"):
+            derived_value, scraped_value = getattr(derived_rank, field), getattr(scraped_rank, field)
+            if derived_value != scraped_value:
+                differences.append(f"{scraped_rank.team}: {field} {derived_value} (derived) != {scraped_value} (scraped)")
+    for team in derived_by_team:
+        differences.append(f"{team}: missing from scraped standings")
+    return differences
@@ -0,0 +1,226 @@
+import hashlib
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Optional, Type, TypeVar
+import orjson
+from pydantic import BaseModel, ValidationError
+from app.services.metrics import metrics
+from app.services.models.archive_schemas import Match, Rank
+from app.services.models.match_schemas import Match as MatchDetail
+from config import DATA_DIR
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+RESULTS = "results"
+FIXTURES = "fixtures"
+STANDINGS = "standings"
+
+
+def safe_filename(name: str) -> str:
+    """
+    Makes an entity ID usable as a file name.
+
+    Args:
+        name (str): The entity ID (e.g., 'Italy-Serie A-2023_2024').
+
+    Returns:
+        str: The ID with path separators replaced.
+    """
+    return name.replace(os.sep, "_").replace("/", "_")
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    """
+    Writes a file through a temporary sibling and a rename, so readers never see a partial file.
+
+    Args:
+        path (str): The destination path.
+        data (bytes): The file content.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(data)
+    os.replace(tmp_path, path)
+
+
+class LocalStore:
+    """
+    File-based store for scraped archive data and match details.
+
+    Layout:
+        <root>/archives/<archive_id>/results.json
+        <root>/archives/<archive_id>/fixtures.json
+        <root>/archives/<archive_id>/standings.json
+        <root>/matches/index/<match_id>
+        <root>/matches/objects/<hash[:2]>/<hash>.json
+
+    Archive files hold the scraping time and the serialized items, and are replaced on every save. Match details
+    are immutable: each is written once as an object named by the SHA-256 of its content, and the index maps the
+    match ID to that hash.
+    """
+    def __init__(self, root: str = DATA_DIR) -> None:
+        self.root = root
+        # Counts the archive sections saved through this store, so in-memory indexes know when to look for changes
+        self.writes = 0
+
+    def archive_path(self, archive_id: str, section: str) -> str:
+        return os.path.join(self.root, "archives", safe_filename(archive_id), f"{section}.json")
+
+    def match_index_path(self, match_id: str) -> str:
+        return os.path.join(self.root, "matches", "index", safe_filename(match_id))
+
+    def object_path(self, content_hash: str) -> str:
+        return os.path.join(self.root, "matches", "objects", content_hash[:2], f"{content_hash}.json")
+
+    def _save(self, path: str, items: list[BaseModel]) -> None:
+        # Scrapers build items with `model_construct`, so rows missing a field are dropped here rather than stored
+        # and rejected by every later load
+        serialized = []
+        for item in items:
+            data = item.model_dump(mode="json")
+            try:
+                type(item).model_validate(data)
+            except ValidationError as ex:
+                logging.warning(f"Not storing invalid item {data.get('id', data)} in {path}: {ex.error_count()} errors")
+                metrics.increment("store.invalid_items")
+                continue
+            serialized.append(data)
+        payload = {
+            "scraped_at": datetime.now().isoformat(),
+            "items": serialized,
+        }
+        write_atomic(path, orjson.dumps(payload))
+
+    def _load(self, path: str, model: Type[ModelT]) -> Optional[tuple[list[ModelT], datetime]]:
+        try:
+            with open(path, "rb") as file:
+                payload = orjson.loads(file.read())
+        except FileNotFoundError:
+            return None
+        items = []
+        for item in payload["items"]:
+            # Files written before invalid rows were dropped on save may still hold some
+            try:
+                items.append(model.model_validate(item))
+            except ValidationError as ex:
+                logging.warning(f"Skipping invalid item {item.get('id', item)} in {path}: {ex.error_count()} errors")
+                metrics.increment("store.invalid_items")
+        return items, datetime.fromisoformat(payload["scraped_at"])
+
+    def save_archive_section(self, archive_id: str, section: str, items: list[BaseModel]) -> None:
+        """
+        Stores the results, fixtures or standings of an archive, replacing the previous version.
+
+        Args:
+            archive_id (str): The unique identifier of the archive.
+            section (str): One of `RESULTS`, `FIXTURES` or `STANDINGS`.
+            items (list[BaseModel]): The matches or ranks to store.
+        """
+        self._save(self.archive_path(archive_id, section), items)
+        self.writes += 1
+
+    def load_archive_section(self, archive_id: str, section: str) -> Optional[tuple[list, datetime]]:
+        """
+        Loads the results, fixtures or standings of an archive.
+
+        Args:
+            archive_id (str): The unique identifier of the archive.
+            section (str): One of `RESULTS`, `FIXTURES` or `STANDINGS`.
+
+        Returns:
+            Optional[tuple[list, datetime]]: The stored items and their scraping time, or None if not stored.
+        """
+        model = Rank if section == STANDINGS else Match
+        return self._load(self.archive_path(archive_id, section), model)
+
+    def has_archive_section(self, archive_id: str, section: str) -> bool:
+        return os.path.exists(self.archive_path(archive_id, section))
+
+    def archive_section_version(self, archive_id: str, section: str) -> Optional[int]:
+        """
+        Returns a value that changes whenever a section is rewritten, to validate in-memory caches cheaply.
+
+        Args:
+            archive_id (str): The unique identifier of the archive.
+            section (str): One of `RESULTS`, `FIXTURES` or `STANDINGS`.
+
+        Returns:
+            Optional[int]: The modification time of the section in nanoseconds, or None if not stored.
+        """
+        try:
+            return os.stat(self.archive_path(archive_id, section)).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def list_archives(self) -> list[str]:
+        """
+        Lists the IDs of the archives with stored data.
+
+        Returns:
+            list[str]: The archive IDs, sorted.
+        """
+        try:
+            return sorted(os.listdir(os.path.join(self.root, "archives")))
+        except FileNotFoundError:
+            return []
+
+    def save_match(self, match: MatchDetail) -> bool:
+        """
+        Stores the details of a finished match. A match already stored is never overwritten.
+
+        Args:
+            match (MatchDetail): The scraped match details.
+
+        Returns:
+            bool: True if the match was written, False if it was already stored.
+        """
+        index_path = self.match_index_path(match.id)
+        if os.path.exists(index_path):
+            return False
+
+        content = orjson.dumps(match.model_dump(mode="json"), option=orjson.OPT_SORT_KEYS)
+        content_hash = hashlib.sha256(content).hexdigest()
+        object_path = self.object_path(content_hash)
+        if not os.path.exists(object_path):
+            write_atomic(object_path, content)
+        write_atomic(index_path, content_hash.encode())
+        return True
+
+    def load_match(self, match_id: str) -> Optional[MatchDetail]:
+        """
+        Loads the details of a match.
+
+        Args:
+            match_id (str): The unique identifier of the match.
+
+        Returns:
+            Optional[MatchDetail]: The stored match details, or None if not stored.
+        """
+        try:
+            with open(self.match_index_path(match_id), "rb") as file:
+                content_hash = file.read().decode()
+            with open(self.object_path(content_hash), "rb") as file:
+                return MatchDetail.model_validate(orjson.loads(file.read()))
+        except FileNotFoundError:
+            return None
+
+    def matches_version(self) -> Optional[int]:
+        """
+        Returns a value that changes whenever a match is stored, to validate in-memory caches cheaply.
+
+        Returns:
+            Optional[int]: The modification time of the match index in nanoseconds, or None if empty.
+        """
+        try:
+            return os.stat(os.path.join(self.root, "matches", "index")).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def has_match(self, match_id: str) -> bool:
+        return os.path.exists(self.match_index_path(match_id))
+
+
+store = LocalStore()
@@ -0,0 +1,250 @@
+import logging
+import re
+import threading
+import time
+import unicodedata
+from datetime import datetime
+from typing import Optional
+from sortedcontainers import SortedList
+from app.services.metrics import metrics
+from app.services.models.archive_schemas import Match
+from app.services.store import LocalStore, store, RESULTS, FIXTURES
+from app.services.utils import calculate_similarity
+from config import TEAM_SIMILARITY_THRESHOLD, TEAM_INDEX_REFRESH_INTERVAL
+
+# Club-type affixes that vary between competitions (e.g., 'AC Milan' in a cup, 'Milan' in the league)
+TEAM_AFFIXES = {"ac", "afc", "as", "cf", "fc", "sc", "ssc", "sk", "fk"}
+# Country qualifiers added to team names in international competitions (e.g., 'Inter (Ita)')
+COUNTRY_QUALIFIER = re.compile(r"\s*\([^)]*\)\s*$")
+
+
+def normalize_team(name: str) -> str:
+    """
+    Reduces a team name to the key under which it is indexed.
+
+    Accents, case, punctuation, country qualifiers and club-type affixes are dropped, so that the same team is
+    spelled the same way across competitions.
+
+    Args:
+        name (str): The team name as displayed (e.g., 'Inter (Ita)').
+
+    Returns:
+        str: The normalized name (e.g., 'inter').
+    """
+    name = COUNTRY_QUALIFIER.sub("", name)
+    name = unicodedata.normalize("NFKD", name)
+    name = "".join(char for char in name if not unicodedata.combining(char)).casefold()
+    words = re.sub(r"[^\w\s]", " ", name).split()
+    kept = [word for word in words if word not in TEAM_AFFIXES]
+    return " ".join(kept or words)
+
+
+class TeamIndex:
+    """
+    An inverted index from team to matches, over the results and fixtures of every archive in the local store.
+
+    Team names are resolved when matches are indexed: a name is normalized, then merged with a known team whose
+    normalized name is similar (see `calculate_similarity`), unless both play in a same archive, where they are
+    necessarily different teams. Queries only normalize the requested name and look it up.
+
+    Each team's matches are kept sorted by date. Archives are reindexed only when their stored sections change,
+    which is checked after every write through the store, and otherwise at most every `refresh_interval` seconds
+    to pick up writes of other processes. The store is read outside the lock, so queries never wait on disk.
+    """
+    def __init__(self, source: LocalStore = None, threshold: float = TEAM_SIMILARITY_THRESHOLD,
+                 refresh_interval: float = TEAM_INDEX_REFRESH_INTERVAL, clock=time.monotonic) -> None:
+        self.source = source
+        self.threshold = threshold
+        self.refresh_interval = refresh_interval
+        self.clock = clock
+        self.aliases: dict[str, str] = {}
+        self.names: dict[str, str] = {}
+        self.team_archives: dict[str, set[str]] = {}
+        self.postings: dict[str, SortedList] = {}
+        self.matches: dict[str, Match] = {}
+        self.played: set[str] = set()
+        self.archive_matches: dict[str, set[str]] = {}
+        self.versions: dict[str, tuple] = {}
+        self.refreshed_at: Optional[float] = None
+        self.refreshed_writes: Optional[int] = None
+        self.lock = threading.Lock()
+        self.refresh_lock = threading.Lock()
+
+    @property
+    def store(self) -> LocalStore:
+        # Resolved on use, so that the index follows the module-level store
+        return self.source or store
+
+    def resolve(self, name: str, archive_id: str) -> str:
+        """
+        Returns the key of the team a name designates, registering the name as a new team if none is similar.
+
+        Args:
+            name (str): The team name as displayed.
+            archive_id (str): The archive in which the name appears.
+
+        Returns:
+            str: The key of the team.
+        """
+        key = self.aliases.get(name)
+        if key is None:
+            normalized = normalize_team(name)
+            key = normalized if normalized in self.names else None
+            if key is None and normalized:
+                # Blocking on the first letter keeps the comparisons to a small fraction of the known teams
+                for known in self.names:
+                    if known[:1] == normalized[:1] and archive_id not in self.team_archives[known] and \
+                            calculate_similarity(known, normalized, self.threshold):
+                        key = known
+                        break
+            if key is None:
+                key = normalized
+                self.names[key] = name
+                self.team_archives[key] = set()
+            elif len(name) < len(self.names[key]):
+                # The shortest name is displayed, being the least decorated one
+                self.names[key] = name
+            self.aliases[name] = key
+        self.team_archives[key].add(archive_id)
+        return key
+
+    def _remove_archive(self, archive_id: str) -> None:
+        for match_id in self.archive_matches.pop(archive_id, set()):
+            match = self.matches.pop(match_id, None)
+            if match is None:
+                continue
+            self.played.discard(match_id)
+            for name in (match.home, match.away):
+                self.postings[self.aliases[name]].discard((match.match_date, match_id))
+
+    def _load_archive(self, archive_id: str) -> list[tuple[str, list[Match]]]:
+        # Results are indexed last, so that a played match replaces its fixture
+        sections = []
+        for section in (FIXTURES, RESULTS):
+            loaded = self.store.load_archive_section(archive_id, section)
+            sections.append((section, loaded[0] if loaded is not None else []))
+        return sections
+
+    def _add_archive(self, archive_id: str, sections: list[tuple[str, list[Match]]]) -> None:
+        match_ids = set()
+        for section, matches in sections:
+            for match in matches:
+                if not match.id:
+                    continue
+                previous = self.matches.get(match.id)
+                for name in (previous.home, previous.away) if previous is not None else ():
+                    self.postings[self.aliases[name]].discard((previous.match_date, match.id))
+                self.matches[match.id] = match
+                for name in (match.home, match.away):
+                    key = self.resolve(name, archive_id)
+                    self.postings.setdefault(key, SortedList()).add((match.match_date, match.id))
+                if section == RESULTS:
+                    self.played.add(match.id)
+                match_ids.add(match.id)
+        self.archive_matches[archive_id] = match_ids
+
+    def refresh(self) -> None:
+        """
+        Reindexes the archives whose results or fixtures changed in the store since the last refresh.
+        """
+        # One refresh at a time; the store is listed and read before taking the lock that queries wait on
+        with self.refresh_lock:
+            writes = self.store.writes
+            archive_ids = self.store.list_archives()
+            removed = set(self.versions) - set(archive_ids)
+            changed = {}
+            for archive_id in archive_ids:
+                version = (self.store.archive_section_version(archive_id, FIXTURES),
+                           self.store.archive_section_version(archive_id, RESULTS))
+                if self.versions.get(archive_id) != version:
+                    changed[archive_id] = (version, self._load_archive(archive_id))
+
+            with self.lock:
+                for archive_id in removed:
+                    self._remove_archive(archive_id)
+                for archive_id, (_, sections) in changed.items():
+                    with metrics.timer("team_index.reindex"):
+                        self._remove_archive(archive_id)
+                        self._add_archive(archive_id, sections)
+                    logging.debug(f"Teams of archive {archive_id} reindexed")
+
+            for archive_id in removed:
+                del self.versions[archive_id]
+            for archive_id, (version, _) in changed.items():
+                self.versions[archive_id] = version
+            self.refreshed_at = self.clock()
+            self.refreshed_writes = writes
+
+    def refresh_if_stale(self) -> None:
+        """
+        Refreshes the index if the store was written to since the last refresh, or if `refresh_interval` elapsed.
+        """
+        if self.refreshed_writes == self.store.writes and self.refreshed_at is not None and \
+                self.clock() - self.refreshed_at < self.refresh_interval:
+            return
+        self.refresh()
+
+    def lookup(self, name: str) -> Optional[str]:
+        """
+        Finds the key of a team by its displayed or normalized name.
+
+        Args:
+            name (str): The team name.
+
+        Returns:
+            Optional[str]: The key of the team, or None if unknown.
+        """
+        with self.lock:
+            key = self.aliases.get(name) or normalize_team(name)
+            return key if key in self.names else None
+
+    def team_name(self, key: str) -> str:
+        with self.lock:
+            return self.names[key]
+
+    def team_aliases(self, key: str) -> list[str]:
+        with self.lock:
+            return sorted(name for name, alias_of in self.aliases.items() if alias_of == key)
+
+    def is_home(self, key: str, match: Match) -> bool:
+        with self.lock:
+            return self.aliases.get(match.home) == key
+
+    def matches_of(self, key: str, played: Optional[bool] = None, since: Optional[datetime] = None,
+                   until: Optional[datetime] = None) -> list[Match]:
+        """
+        Lists the matches of a team across all archives, in chronological order.
+
+        Args:
+            key (str): The key of the team.
+            played (bool, optional): True for results only, False for fixtures only. Defaults to both.
+            since (datetime, optional): Only list matches from this time (inclusive).
+            until (datetime, optional): Only list matches up to this time (inclusive).
+
+        Returns:
+            list[Match]: The matches.
+        """
+        with self.lock:
+            postings = self.postings.get(key, SortedList())
+            entries = postings.irange((since,) if since else None, (until, "\U0010ffff") if until else None)
+            return [self.matches[match_id] for _, match_id in entries
+                    if played is None or (match_id in self.played) == played]
+
+    def head_to_head(self, key: str, opponent: str) -> list[Match]:
+        """
+        Lists the played matches between two teams across all archives, most recent first.
+
+        Args:
+            key (str): The key of the first team.
+            opponent (str): The key of the second team.
+
+        Returns:
+            list[Match]: The matches.
+        """
+        matches = self.matches_of(key, played=True)
+        with self.lock:
+            return [match for match in reversed(matches)
+                    if opponent in (self.aliases.get(match.home), self.aliases.get(match.away))]
+
+
+team_index = TeamIndex()
@@ -0,0 +1,232 @@
+from typing import Optional
+import numpy as np
+from app.services.models.match_schemas import Match as MatchDetail
+from app.services.models.stats_schemas import Venue, StatLine, TeamSplit, FormPoint, TeamForm, TeamStats
+from app.services.scraper.match_scraper import STAT_ATTRIBUTES
+from app.services.standings import ResultColumns, POINTS_WIN, POINTS_DRAW
+
+XG_INDEX = STAT_ATTRIBUTES.index("expected_goals_xg")
+
+
+class StatsColumns:
+    """
+    Columnar store of an archive's match statistics, aligned with its results.
+
+    Attributes:
+        results (ResultColumns): The results of the archive.
+        values (np.ndarray): Statistics of shape (matches, statistics, 2), home then away; NaN where unknown.
+    """
+    def __init__(self, results: ResultColumns, details: dict[str, MatchDetail]) -> None:
+        self.results = results
+        self.values = np.full((len(results), len(STAT_ATTRIBUTES), 2), np.nan)
+        for row, match_id in enumerate(results.ids):
+            detail = details.get(match_id)
+            if detail is None:
+                continue
+            for column, attribute in enumerate(STAT_ATTRIBUTES):
+                home, away = getattr(detail, attribute)
+                if home is not None and away is not None:
+                    self.values[row, column] = (home, away)
+
+    @property
+    def matches_with_stats(self) -> int:
+        return int(np.any(~np.isnan(self.values[:, :, 0]), axis=1).sum())
+
+
+def aggregate_teams(columns: StatsColumns, venue: Venue = Venue.ALL) -> dict[str, np.ndarray]:
+    """
+    Aggregates results and statistics per team with bincount group-bys.
+
+    Args:
+        columns (StatsColumns): The statistics of the archive.
+        venue (Venue, optional): Restricts the figures to home or away matches. Defaults to all matches.
+
+    Returns:
+        dict[str, np.ndarray]: Per-team arrays; the statistics arrays have shape (teams, statistics).
+    """
+    results = columns.results
+    size = len(results.teams)
+    sides = []
+    if venue in (Venue.ALL, Venue.HOME):
+        sides.append((results.home, results.home_goals, results.away_goals, columns.values[:, :, 0], columns.values[:, :, 1]))
+    if venue in (Venue.ALL, Venue.AWAY):
+        sides.append((results.away, results.away_goals, results.home_goals, columns.values[:, :, 1], columns.values[:, :, 0]))
+
+    totals = {
+        "matches_played": np.zeros(size, dtype=np.int64),
+        "wins": np.zeros(size, dtype=np.int64),
+        "draws": np.zeros(size, dtype=np.int64),
+        "losses": np.zeros(size, dtype=np.int64),
+        "goals_for": np.zeros(size, dtype=np.int64),
+        "goals_against": np.zeros(size, dtype=np.int64),
+        "stats_for": np.zeros((size, len(STAT_ATTRIBUTES))),
+        "stats_against": np.zeros((size, len(STAT_ATTRIBUTES))),
+        "stats_matches": np.zeros((size, len(STAT_ATTRIBUTES)), dtype=np.int64),
+    }
+    for team, goals_for, goals_against, stats_for, stats_against in sides:
+        totals["matches_played"] += np.bincount(team, minlength=size)
+        totals["wins"] += np.bincount(team, weights=goals_for > goals_against, minlength=size).astype(np.int64)
+        totals["draws"] += np.bincount(team, weights=goals_for == goals_against, minlength=size).astype(np.int64)
+        totals["losses"] += np.bincount(team, weights=goals_for < goals_against, minlength=size).astype(np.int64)
+        totals["goals_for"] += np.bincount(team, weights=goals_for, minlength=size).astype(np.int64)
+        totals["goals_against"] += np.bincount(team, weights=goals_against, minlength=size).astype(np.int64)
+        known = ~np.isnan(stats_for)
+        for column in range(len(STAT_ATTRIBUTES)):
+            totals["stats_for"][:, column] += np.bincount(team, weights=np.nan_to_num(stats_for[:, column]), minlength=size)
+            totals["stats_against"][:, column] += np.bincount(team, weights=np.nan_to_num(stats_against[:, column]), minlength=size)
+            totals["stats_matches"][:, column] += np.bincount(team, weights=known[:, column], minlength=size).astype(np.int64)
+
+    totals["points"] = POINTS_WIN * totals["wins"] + POINTS_DRAW * totals["draws"]
+    return totals
+
+
+def team_split(totals: dict[str, np.ndarray], team_index: int, team: str, venue: Venue) -> TeamSplit:
+    """
+    Builds the figures of one team from the output of `aggregate_teams`.
+
+    Args:
+        totals (dict[str, np.ndarray]): The per-team arrays.
+        team_index (int): The index of the team in the arrays.
+        team (str): The name of the team.
+        venue (Venue): The venue the arrays were restricted to.
+
+    Returns:
+        TeamSplit: The team's figures.
+    """
+    played = int(totals["matches_played"][team_index])
+    stats = []
+    for column, attribute in enumerate(STAT_ATTRIBUTES):
+        matches = int(totals["stats_matches"][team_index, column])
+        line = StatLine(name=attribute, matches=matches)
+        if matches:
+            line.total_for = round(float(totals["stats_for"][team_index, column]), 2)
+            line.total_against = round(float(totals["stats_against"][team_index, column]), 2)
+            line.average_for = round(line.total_for / matches, 2)
+            line.average_against = round(line.total_against / matches, 2)
+        stats.append(line)
+
+    return TeamSplit(
+        team=team,
+        venue=venue,
+        matches_played=played,
+        wins=int(totals["wins"][team_index]),
+        draws=int(totals["draws"][team_index]),
+        losses=int(totals["losses"][team_index]),
+        goals_for=int(totals["goals_for"][team_index]),
+        goals_against=int(totals["goals_against"][team_index]),
+        points=int(totals["points"][team_index]),
+        points_per_match=round(int(totals["points"][team_index]) / played, 2) if played else None,
+        stats=stats,
+    )
+
+
+def season_table(columns: StatsColumns, venue: Venue = Venue.ALL) -> list[TeamSplit]:
+    """
+    Computes the figures of every team of the archive, sorted by points.
+
+    Args:
+        columns (StatsColumns): The statistics of the archive.
+        venue (Venue, optional): Restricts the figures to home or away matches. Defaults to all matches.
+
+    Returns:
+        list[TeamSplit]: One entry per team.
+    """
+    totals = aggregate_teams(columns, venue)
+    order = np.lexsort((np.arange(len(columns.results.teams)), -totals["goals_for"],
+                        -(totals["goals_for"] - totals["goals_against"]), -totals["points"]))
+    return [team_split(totals, int(index), str(columns.results.teams[index]), venue) for index in order]
+
+
+def team_form(columns: StatsColumns, team_index: int, window: int) -> TeamForm:
+    """
+    Computes rolling averages over a team's matches in chronological order.
+
+    Args:
+        columns (StatsColumns): The statistics of the archive.
+        team_index (int): The index of the team.
+        window (int): The number of matches per window.
+
+    Returns:
+        TeamForm: The last results and the rolling averages after each match.
+    """
+    results = columns.results
+    is_home = results.home == team_index
+    rows = np.flatnonzero(is_home | (results.away == team_index))
+    rows = rows[np.argsort(results.dates[rows], kind="stable")]
+    home_rows = is_home[rows]
+
+    goals_for = np.where(home_rows, results.home_goals[rows], results.away_goals[rows]).astype(float)
+    goals_against = np.where(home_rows, results.away_goals[rows], results.home_goals[rows]).astype(float)
+    points = np.where(goals_for > goals_against, POINTS_WIN, np.where(goals_for == goals_against, POINTS_DRAW, 0)).astype(float)
+    xg = np.where(home_rows, columns.values[rows, XG_INDEX, 0], columns.values[rows, XG_INDEX, 1])
+
+    def rolling_mean(values: np.ndarray) -> np.ndarray:
+        known = ~np.isnan(values)
+        sums = np.cumsum(np.nan_to_num(values))
+        counts = np.cumsum(known)
+        sums[window:] = sums[window:] - sums[:-window]
+        counts[window:] = counts[window:] - counts[:-window]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+
+    rolling_points, rolling_for, rolling_against, rolling_xg = (rolling_mean(values) for values in (points, goals_for, goals_against, xg))
+    letters = np.where(points == POINTS_WIN, "W", np.where(points == POINTS_DRAW, "D", "L"))
+
+    return TeamForm(
+        window=window,
+        last_results="".join(letters[-window:]),
+        rolling=[
+            FormPoint(
+                match_id=str(results.ids[row]),
+                round=int(results.rounds[row]),
+                points=round(float(rolling_points[i]), 2),
+                goals_for=round(float(rolling_for[i]), 2),
+                goals_against=round(float(rolling_against[i]), 2),
+                expected_goals_for=None if np.isnan(rolling_xg[i]) else round(float(rolling_xg[i]), 2),
+            )
+            for i, row in enumerate(rows)
+        ],
+    )
+
+
+def find_team(columns: StatsColumns, team: str) -> Optional[int]:
+    """
+    Finds a team of the archive by name, ignoring case.
+
+    Args:
+        columns (StatsColumns): The statistics of the archive.
+        team (str): The team name to look for.
+
+    Returns:
+        Optional[int]: The index of the team, or None if it does not play in the archive.
+    """
+    wanted = team.strip().lower()
+    for index, name in enumerate(columns.results.teams):
+        if str(name).lower() == wanted:
+            return index
+    return None
+
+
+def team_stats(columns: StatsColumns, archive_id: str, team_index: int, window: int = 5) -> TeamStats:
+    """
+    Computes totals, averages, home/away splits and form of a team.
+
+    Args:
+        columns (StatsColumns): The statistics of the archive.
+        archive_id (str): The unique identifier of the archive.
+        team_index (int): The index of the team.
+        window (int, optional): The number of matches in the rolling window. Defaults to 5.
+
+    Returns:
+        TeamStats: The team's statistics.
+    """
+    team = str(columns.results.teams[team_index])
+    splits = {venue: team_split(aggregate_teams(columns, venue), team_index, team, venue) for venue in Venue}
+    return TeamStats(
+        team=team,
+        archive=archive_id,
+        overall=splits[Venue.ALL],
+        home=splits[Venue.HOME],
+        away=splits[Venue.AWAY],
+        form=team_form(columns, team_index, window),
+    )
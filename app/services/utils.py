@@ -2,12 +2,22 @@ from datetime import datetime
 from selenium import webdriver
 import logging
 import Levenshtein
+from app.services.chromedriver import new_chrome
+from app.services.network import enable_network_capture
+from logger.logger_config import SampledLogger
 
+element_log = SampledLogger("app.scraper.elements")
 
-def get_driver() -> webdriver.Chrome:
+
+def get_driver(capture_network: bool = False, page_load_strategy: str = None) -> webdriver.Chrome:
     """
     Get a configured Chrome WebDriver instance.
 
+    The chromedriver binary is resolved once per process and, with `SHARED_CHROMEDRIVER`, one chromedriver server
+    serves every session, so a new instance only launches Chrome.
+
+    :param capture_network: Whether to log network events, to record the responses of loaded pages.
+    :param page_load_strategy: When navigations return: 'normal', 'eager' or 'none'. Defaults to Chrome's default.
     :return: Configured WebDriver instance for Chrome.
     """
     try:
@@ -16,7 +26,11 @@ def get_driver() -> webdriver.Chrome:
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--headless")
         chrome_options.add_argument("--disable-gpu")
-        chrome_driver = webdriver.Chrome(options=chrome_options)
+        if capture_network:
+            enable_network_capture(chrome_options)
+        if page_load_strategy:
+            chrome_options.page_load_strategy = page_load_strategy
+        chrome_driver = new_chrome(chrome_options)
         chrome_driver.delete_all_cookies()
 
         logging.debug("WebDriver initialized successfully.")
@@ -37,7 +51,7 @@ def calculate_similarity(str1: str, str2: str, threshold: float = 65) -> float:
     :return: True if the similarity exceeds the threshold, otherwise False.
     """
     try:
-        logging.debug(f"Calculating Similarity between strings {str1} and {str2}...")
+        element_log.debug("Calculating similarity between strings %s and %s", str1, str2)
         # Compute Levenshtein distance
         distance = Levenshtein.distance(str1, str2)
 
@@ -45,7 +59,7 @@ def calculate_similarity(str1: str, str2: str, threshold: float = 65) -> float:
         max_len = max(len(str1), len(str2))
         similarity = (1 - distance / max_len) * 100
 
-        logging.debug(f"Similarity between {str1}&{str2} computed: {similarity:.2f}%. Return: {similarity > threshold}")
+        element_log.debug("Similarity between %s&%s computed: %.2f%%", str1, str2, similarity)
 
         return similarity > threshold
     except Exception as ex:
@@ -80,4 +94,15 @@ def get_match_datetime(match_date_str: str, season: str = None) -> datetime:
         year = end_year if month >= 6 else start_year
 
         # Combine into a datetime object
-        return datetime.strptime(f"{day}.{month}.{year} {time}", "%d.%m.%Y %H:%M")
\ No newline at end of file
+        return datetime.strptime(f"{day}.{month}.{year} {time}", "%d.%m.%Y %H:%M")
+
+def get_current_season(now: datetime = None) -> str:
+    """
+    Returns the season running at a given time, assuming European seasons that start in July.
+
+    :param now: The reference time. Defaults to the current time.
+    :return: The season in archive ID format (e.g., '2024_2025').
+    """
+    now = now or datetime.now()
+    start_year = now.year if now.month >= 7 else now.year - 1
+    return f"{start_year}_{start_year + 1}"
@@ -0,0 +1,50 @@
+from datetime import datetime, timedelta
+from typing import Optional
+from selenium.common.exceptions import NoSuchElementException
+from app.services.models.archive_schemas import Match
+
+ARCHIVE_ID = "Italy-Serie A-2023_2024"
+
+
+def make_match(round, home, away, home_score=0, away_score=0, match_id: Optional[str] = None,
+               archive: str = ARCHIVE_ID, match_date: Optional[datetime] = None):
+    # Matches default to one round a week from the start of the 2023/24 season
+    match_id = match_id or f"{round}{home}{away}"
+    return Match(id=match_id, archive=archive, url=f"https://www.livescore.in/match/{match_id}/",
+                 match_date=match_date or datetime(2023, 8, 20) + timedelta(days=7 * (round - 1)), round=round,
+                 home=home, away=away, home_score=home_score, away_score=away_score)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeDriver:
+    def __init__(self, **options):
+        self.loaded = []
+        self.quit_called = False
+
+    def get(self, url):
+        self.loaded.append(url)
+
+    @property
+    def current_url(self):
+        return self.loaded[-1] if self.loaded else None
+
+    def find_element(self, by, value):
+        raise NoSuchElementException(value)
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakeSession:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
@@ -0,0 +1,90 @@
+import pytest
+from unittest.mock import patch
+from fastapi import Depends, FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from app.middleware.admission import AdmissionMiddleware
+from app.services.admission import AdmissionController, Overloaded, admission, extra_sessions
+from app.tests.factories import FakeClock
+
+
+def test_wait_is_estimated_from_occupancy_and_latencies():
+    """
+    Test that requests are admitted while browsers are free and rejected once the estimated wait is too long.
+    """
+    clock = FakeClock()
+    controller = AdmissionController(max_browsers=2, max_wait=10, default_latency=8, clock=clock)
+
+    first = controller.admit("GET /slow")
+    assert controller.estimate_wait() == 0
+    controller.admit("GET /slow")
+    assert controller.estimate_wait() == 8
+
+    clock.now = 20
+    controller.release(first)
+    assert controller.latency("GET /slow") == 20
+    controller.admit("GET /slow")
+    # 20 s expected for the new request, 0 s left for the one started at t=0
+    assert controller.estimate_wait() == 10
+    controller.admit("GET /fast")
+
+    with pytest.raises(Overloaded) as error:
+        controller.admit("GET /slow")
+    assert error.value.retry_after == 4
+
+    clock.now = 40
+    controller.release(3)
+    assert controller.latency("GET /fast") == 20
+    controller.release(2)
+    assert controller.latency("GET /slow") == 20
+
+
+def test_rejected_requests_get_retry_after_and_cached_requests_pass():
+    """
+    Test that an overloaded route answers 503 with Retry-After, except for requests servable from the store.
+    """
+    controller = AdmissionController(max_browsers=1, max_wait=0, default_latency=30)
+    controller.admit("GET /busy")
+
+    app = FastAPI()
+
+    @app.get("/items/{itemId}", dependencies=[Depends(admission(cached=lambda params: params["itemId"] == "stored"))])
+    def get_item(itemId: str):
+        return {"id": itemId}
+
+    client = TestClient(app)
+    with patch("app.services.admission.controller", controller):
+        response = client.get("/items/missing")
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "30"
+
+        assert client.get("/items/stored").json() == {"id": "stored"}
+        assert client.get("/items/stored", params={"itemId": "missing"}).json() == {"id": "stored"}
+    assert len(controller.in_flight) == 1
+
+
+def test_slots_are_held_until_the_body_is_sent_and_weighted_by_sessions():
+    """
+    Test that a streamed response keeps its slot while streaming, and that worker sessions count against admission.
+    """
+    controller = AdmissionController(max_browsers=4, max_wait=0, default_latency=30)
+    observed = []
+
+    app = FastAPI()
+    app.add_middleware(AdmissionMiddleware)
+
+    @app.get("/export", dependencies=[Depends(admission())])
+    def export():
+        def rows():
+            observed.append(controller.occupancy())
+            with extra_sessions(2):
+                observed.append(controller.occupancy())
+            yield b"row"
+        return StreamingResponse(rows())
+
+    with patch("app.services.admission.controller", controller):
+        assert TestClient(app).get("/export").content == b"row"
+
+    assert observed == [1, 3]
+    assert controller.occupancy() == 0
+    assert not controller.in_flight
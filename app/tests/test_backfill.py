@@ -0,0 +1,86 @@
+import os
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+from app.backfill import Backfill, Checkpoint
+from app.services.models.archive_schemas import Archive, Match, Rank
+from app.services.models.league_schemas import Archive as LeagueArchive
+from app.services.models.match_schemas import Match as MatchDetail
+from app.services.store import LocalStore, RESULTS, STANDINGS
+
+LEAGUE_ID = "Italy-Serie A"
+SEASONS = ["2022_2023", "2023_2024"]
+scraped_matches = []
+read_archives = []
+failing_matches = set()
+
+
+class MockArchiveScraper:
+    def read_archive(self, league_id, season, url):
+        read_archives.append(season)
+        archive = Archive.model_construct()
+        archive.league = league_id
+        archive.season = season
+        archive.results = f"{url}results/"
+        archive.standings = f"{url}standings/"
+        return archive
+
+    def scrape_matches(self, url, archive, page, size, config):
+        matches = [Match(id=f"{archive.season}-{i}", archive=archive.id, url=url, match_date=datetime(2023, 1, 1),
+                         round=1, home="Inter", away="Milan", home_score=1, away_score=0) for i in range(3)]
+        return matches, None
+
+    def scrape_standings(self, archive):
+        return [Rank(position=1, team="Inter", matches_played=1, wins=1, points=3)]
+
+    def close(self):
+        pass
+
+
+class MockMatchScraper:
+    def scrape_match(self, match_id):
+        scraped_matches.append(match_id)
+        if match_id in failing_matches:
+            failing_matches.remove(match_id)
+            raise TimeoutError("Simulated timeout")
+        return MatchDetail(id=match_id, status="Finished", played=True, expected_goals_xg=(1.0, 0.5))
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def mock_scrapers():
+    with patch("app.backfill.ArchiveScraper", MockArchiveScraper), patch("app.backfill.MatchScraper", MockMatchScraper):
+        scraped_matches.clear()
+        read_archives.clear()
+        failing_matches.clear()
+        failing_matches.add("2023_2024-2")
+        yield
+
+
+def test_backfill_resumes_from_checkpoint(mock_scrapers, tmp_path):
+    """
+    Test that a failed task is retried on the next run while completed tasks are skipped, without loading the pages
+    of completed archives.
+    """
+    store = LocalStore(str(tmp_path))
+    checkpoint_path = os.path.join(tmp_path, "backfill", "league.json")
+    archives = [LeagueArchive(league=LEAGUE_ID, season=season, url=f"https://example.com/{season}/") for season in SEASONS]
+
+    Backfill(LEAGUE_ID, store, Checkpoint(checkpoint_path), workers=2).run(archives)
+    assert store.load_archive_section(f"{LEAGUE_ID}-2023_2024", RESULTS)[0][0].home == "Inter"
+    assert store.load_archive_section(f"{LEAGUE_ID}-2022_2023", STANDINGS)[0][0].points == 3
+    assert not store.has_match("2023_2024-2")
+    assert store.load_match("2022_2023-0").expected_goals_xg == (1.0, 0.5)
+
+    checkpoint = Checkpoint(checkpoint_path)
+    assert "match:2023_2024-2" in checkpoint.failed
+
+    scraped_matches.clear()
+    read_archives.clear()
+    Backfill(LEAGUE_ID, store, checkpoint, workers=2).run(archives)
+    assert scraped_matches == ["2023_2024-2"]
+    assert read_archives == []
+    assert store.has_match("2023_2024-2")
+    assert not Checkpoint(checkpoint_path).failed
@@ -0,0 +1,123 @@
+import threading
+from unittest.mock import patch
+import pytest
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webelement import WebElement
+from app.services.scraper.browser_pool import BrowserPool, TabProxy
+from app.services.scraper.session import NavigationSession
+from app.services.recorder import CAPTURE_OFF
+
+
+class FakeElement(WebElement):
+    def __init__(self, driver, window):
+        super().__init__(driver, f"element-{window}")
+        self.window = window
+
+    @property
+    def text(self):
+        # Reading an element of an unfocused window fails, as with a real browser
+        if self._parent.focused != self.window:
+            raise WebDriverException("stale element")
+        return self._parent.urls[self.window]
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.focused = handle
+
+    def new_window(self, kind):
+        handle = f"window-{len(self.driver.urls)}"
+        self.driver.urls[handle] = "about:blank"
+        self.driver.focused = handle
+
+
+class FakeChrome:
+    def __init__(self):
+        self.urls = {"window-0": "about:blank"}
+        self.focused = "window-0"
+        self.switch_to = FakeSwitchTo(self)
+        self.quit_called = False
+
+    @property
+    def current_window_handle(self):
+        return self.focused
+
+    @property
+    def current_url(self):
+        return self.urls[self.focused]
+
+    def get(self, url):
+        self.urls[self.focused] = url
+
+    def find_element(self, by, value):
+        return FakeElement(self, self.focused)
+
+    def execute_script(self, script, *args):
+        return args
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_tab_commands_run_in_their_window():
+    """
+    Test that tabs of one process navigate independently and read their elements with their window focused.
+    """
+    pool = BrowserPool(processes=1, tabs=2, factory=FakeChrome)
+    first, second = pool.acquire(), pool.acquire()
+    assert len(pool.browsers) == 1
+
+    first.get("https://a")
+    second.get("https://b")
+    element = first.find_element("xpath", "//div")
+    second.find_element("xpath", "//div")
+    assert first.current_url == "https://a"
+    assert element.text == "https://a"
+    # Elements are passed to the browser unwrapped
+    assert first.execute_script("arguments[0].click();", element)[0] is element._target
+
+
+def test_tabs_spread_across_processes_and_are_reused():
+    """
+    Test that sessions are spread across processes, wait when all tabs are leased, and reuse released windows.
+    """
+    pool = BrowserPool(processes=2, tabs=1, factory=FakeChrome)
+    first, second = pool.acquire(), pool.acquire()
+    assert first.browser is not second.browser
+    with pytest.raises(WebDriverException):
+        pool.acquire(timeout=0.05)
+
+    acquired = []
+    waiting = threading.Thread(target=lambda: acquired.append(pool.acquire(timeout=5)))
+    waiting.start()
+    first.get("https://a")
+    first.quit()
+    waiting.join()
+    assert acquired[0].browser is first.browser
+    assert acquired[0].handle == first.handle
+    assert acquired[0].current_url == "about:blank"
+    assert pool.tabs_in_use() == 2
+
+    pool.close()
+    assert first.browser.driver.quit_called and second.browser.driver.quit_called
+
+
+def test_session_uses_a_pooled_tab():
+    """
+    Test that, with several tabs per browser, sessions share a process and closing a session releases its tab.
+    """
+    pool = BrowserPool(processes=1, tabs=4, factory=FakeChrome)
+    with patch("app.services.scraper.session.browser_pool", pool), \
+            patch("app.services.scraper.session.TABS_PER_BROWSER", 4):
+        sessions = [NavigationSession(mode=CAPTURE_OFF) for _ in range(3)]
+        for index, session in enumerate(sessions):
+            session.navigate(f"https://{index}")
+        assert isinstance(sessions[0].driver, TabProxy)
+        assert len(pool.browsers) == 1 and pool.tabs_in_use() == 3
+
+        sessions[0].close()
+        assert pool.tabs_in_use() == 2
+        assert not pool.browsers[0].driver.quit_called
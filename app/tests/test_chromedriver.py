@@ -0,0 +1,60 @@
+from unittest.mock import patch
+from selenium import webdriver
+from app.services import chromedriver
+from app.services.chromedriver import ChromeDriverServer, DriverBinaries
+
+
+class FakeProcess:
+    def __init__(self):
+        self.returncode = None
+
+    def poll(self):
+        return self.returncode
+
+
+class FakeService:
+    started = 0
+
+    def __init__(self, executable_path=None):
+        self.path = executable_path
+        self.process = None
+
+    def start(self):
+        FakeService.started += 1
+        self.process = FakeProcess()
+
+
+def test_driver_is_resolved_once():
+    """
+    Test that Selenium Manager runs for the first driver only, later drivers reusing the driver and browser paths.
+    """
+    def driver_location(manager, options):
+        options.binary_location = "/opt/chrome"
+        return "/opt/chromedriver"
+
+    binaries = DriverBinaries(driver_path=None)
+    with patch.object(chromedriver.SeleniumManager, "driver_location", autospec=True,
+                      side_effect=driver_location) as locate:
+        paths = [binaries.resolve(webdriver.ChromeOptions()) for _ in range(3)]
+        options = webdriver.ChromeOptions()
+        binaries.resolve(options)
+
+    assert paths == ["/opt/chromedriver"] * 3
+    assert locate.call_count == 1
+    assert options.binary_location == "/opt/chrome"
+
+
+def test_sessions_share_one_server():
+    """
+    Test that sessions reuse the running chromedriver server, which is started again only if it exited.
+    """
+    FakeService.started = 0
+    server = ChromeDriverServer(DriverBinaries(driver_path="/opt/chromedriver"))
+    with patch.object(chromedriver, "Service", FakeService):
+        first = server.running()
+        assert server.running() is first and FakeService.started == 1
+
+        first.process.returncode = 1
+        second = server.running()
+        assert second is not first and FakeService.started == 2
+        assert second.path == "/opt/chromedriver"
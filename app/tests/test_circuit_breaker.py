@@ -0,0 +1,99 @@
+import pytest
+from unittest.mock import patch
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from app.services.circuit_breaker import CircuitBreaker, CircuitOpenError, get_breaker, CLOSED, OPEN, HALF_OPEN
+from app.services.metrics import metrics
+from app.services.scraper.scraper import Scraper, resilient
+from app.services.scraper.session import NavigationSession
+from app.tests.factories import FakeClock, FakeDriver
+
+
+class FlakyScraper(Scraper):
+    def __init__(self, failures):
+        super().__init__(session=NavigationSession())
+        self.failures = list(failures)
+        self.drivers = []
+
+    @resilient("flaky")
+    def scrape(self):
+        self.drivers.append(self.driver)
+        if self.failures:
+            raise self.failures.pop(0)
+        return "scraped"
+
+    @resilient("flaky_outer")
+    def scrape_nested(self):
+        return self.scrape()
+
+
+@pytest.fixture(autouse=True)
+def fake_driver():
+    with patch("app.services.scraper.session.get_driver", FakeDriver):
+        breaker = get_breaker("flaky")
+        breaker.record_success()
+        yield
+
+
+def test_breaker_opens_and_recovers_through_half_open_probe():
+    """
+    Test that the circuit opens after consecutive failures, fails fast, and closes after a successful probe.
+    """
+    clock = FakeClock()
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=30, clock=clock)
+
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+    clock.now = 10
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.before_call()
+    assert error.value.retry_after == 20
+
+    clock.now = 31
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+    clock.now = 62
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    breaker.before_call()
+
+
+def test_crash_is_retried_on_a_fresh_browser():
+    """
+    Test that a WebDriver failure restarts the browser and retries, without counting as an upstream failure.
+    """
+    retries = metrics.count("scraper.retries")
+    scraper = FlakyScraper([StaleElementReferenceException("stale")])
+
+    assert scraper.scrape() == "scraped"
+    assert len(scraper.drivers) == 2 and scraper.drivers[0] is not scraper.drivers[1]
+    assert metrics.count("scraper.retries") == retries + 1
+    assert get_breaker("flaky").failures == 0
+
+
+def test_nested_calls_retry_once_and_timeouts_are_not_retried():
+    """
+    Test that only the outermost guarded call retries and that a timeout is recorded once, on the failing page type.
+    """
+    scraper = FlakyScraper([StaleElementReferenceException("stale"), StaleElementReferenceException("stale")])
+    with pytest.raises(StaleElementReferenceException):
+        scraper.scrape_nested()
+    assert len(scraper.drivers) == 2
+
+    scraper = FlakyScraper([TimeoutException("slow")])
+    with pytest.raises(TimeoutException):
+        scraper.scrape_nested()
+    assert len(scraper.drivers) == 1
+    assert get_breaker("flaky").failures == 1
+    assert get_breaker("flaky_outer").failures == 0
+    assert metrics.snapshot()["gauges"]["circuit.flaky.state"] == 0
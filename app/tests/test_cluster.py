@@ -0,0 +1,111 @@
+import httpx
+import orjson
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.middleware.cluster import ClusterMiddleware, entity_key, MODE_REDIRECT, FORWARDED_HEADER, OWNER_HEADER
+from app.services.cluster import HashRing
+
+NODES = ["http://node1:8000", "http://node2:8000", "http://node3:8000"]
+SELF = NODES[0]
+
+
+def test_ring_moves_few_keys_when_nodes_change():
+    """
+    Test that keys spread over every node, and that a joining node only takes keys from the others.
+    """
+    keys = [f"Italy-Serie A-{year}_{year + 1}" for year in range(1000, 3000)]
+    ring = HashRing(NODES)
+    before = {key: ring.owner(key) for key in keys}
+    assert all(400 < list(before.values()).count(node) < 950 for node in NODES)
+
+    ring.add("http://node4:8000")
+    after = {key: ring.owner(key) for key in keys}
+    moved = [key for key in keys if before[key] != after[key]]
+    assert all(after[key] == "http://node4:8000" for key in moved)
+    assert len(moved) < len(keys) / 3
+
+    ring.remove("http://node4:8000")
+    assert {key: ring.owner(key) for key in keys} == before
+    assert sorted(ring.owners(keys[0])) == sorted(NODES)
+
+
+def test_entity_keys():
+    """
+    Test that archive, league and match routes are keyed by their ID and other routes are not sharded.
+    """
+    assert entity_key("/archives/Italy-Serie A-2023_2024/results.csv") == "Italy-Serie A-2023_2024"
+    assert entity_key("/leagues/Italy-Serie A/archives") == "Italy-Serie A"
+    assert entity_key("/matches/abc123") == "abc123"
+    assert entity_key("/matches/batch") is None
+    assert entity_key("/archives/bundle.csv") is None
+    assert entity_key("/archives/bundle.parquet/") is None
+    assert entity_key("/countries/Italy") is None
+
+
+def key_owned_by(ring, node):
+    return next(f"m{index}" for index in range(1000) if ring.owner(f"m{index}") == node)
+
+
+@pytest.fixture
+def cluster():
+    app = FastAPI()
+
+    @app.get("/matches/{matchId}")
+    def get_match(matchId: str):
+        return {"id": matchId, "served_by": SELF}
+
+    ring = HashRing(NODES)
+    middleware = ClusterMiddleware(app, ring, SELF)
+    middleware.forwarded = []
+
+    def owner(request):
+        middleware.forwarded.append(request)
+        if str(request.url).startswith(NODES[1]):
+            raise httpx.ConnectError("refused")
+        served_by = f"{request.url.scheme}://{request.url.netloc.decode()}"
+        return httpx.Response(200, headers={"Content-Type": "application/json"},
+                              stream=httpx.ByteStream(orjson.dumps({"served_by": served_by})))
+
+    middleware.client = httpx.AsyncClient(transport=httpx.MockTransport(owner))
+    middleware.test_client = TestClient(middleware)
+    return middleware
+
+
+def test_requests_are_forwarded_to_their_owner(cluster):
+    """
+    Test that owned keys are served locally and that others are forwarded, skipping an unreachable owner.
+    """
+    client = cluster.test_client
+    local = client.get(f"/matches/{key_owned_by(cluster.ring, SELF)}")
+    assert local.json()["served_by"] == SELF
+    assert local.headers[OWNER_HEADER] == SELF
+    assert not cluster.forwarded
+
+    remote = client.get(f"/matches/{key_owned_by(cluster.ring, NODES[2])}?fields=id")
+    assert remote.json()["served_by"] == NODES[2]
+    assert remote.headers[OWNER_HEADER] == NODES[2]
+    assert cluster.forwarded[-1].url.query == b"fields=id"
+    assert cluster.forwarded[-1].headers[FORWARDED_HEADER] == SELF
+
+    key = key_owned_by(cluster.ring, NODES[1])
+    fallback = client.get(f"/matches/{key}")
+    assert fallback.status_code == 200
+    assert fallback.json()["served_by"] in (NODES[2], SELF)
+
+    assert client.get(f"/matches/{key}", headers={FORWARDED_HEADER: NODES[2]}).json()["served_by"] == SELF
+
+
+def test_redirect_mode(cluster):
+    """
+    Test that, in redirect mode, clients are sent to the owner with a hint header.
+    """
+    cluster.mode = MODE_REDIRECT
+    key = key_owned_by(cluster.ring, NODES[2])
+
+    response = cluster.test_client.get(f"/matches/{key}", follow_redirects=False)
+
+    assert response.status_code == 307
+    assert response.headers["Location"] == f"{NODES[2]}/matches/{key}"
+    assert response.headers[OWNER_HEADER] == NODES[2]
+    assert not cluster.forwarded
@@ -0,0 +1,116 @@
+import time
+from datetime import datetime
+import pytest
+from unittest.mock import patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.middleware.deadline import DeadlineMiddleware, parse_budget
+from app.services import deadline
+from app.services.deadline import Deadline, DeadlineExceeded, current_deadline
+from app.services.models.archive_schemas import Match
+from app.services.models.match_schemas import Match as MatchDetail, MatchListResponse
+from app.services.repository import fetch_matches, get_result_columns
+from app.services.scraper.scraper import Scraper
+from app.services.scraper.session import NavigationSession
+from app.services.store import LocalStore
+from app.tests.factories import FakeDriver
+
+
+class SlowMatchScraper:
+    def scrape_match(self, match_id):
+        time.sleep(0.1)
+        return MatchDetail(id=match_id, status="Finished", played=True)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def request_deadline():
+    def start(seconds):
+        token = current_deadline.set(Deadline(seconds))
+        tokens.append(token)
+        return current_deadline.get()
+
+    tokens = []
+    yield start
+    for token in reversed(tokens):
+        current_deadline.reset(token)
+
+
+def test_budget_is_read_from_header_or_query():
+    """
+    Test that the budget comes from the X-Request-Timeout header first, then from the timeout query parameter.
+    """
+    assert parse_budget({"type": "http", "headers": [(b"x-request-timeout", b"2.5")], "query_string": b"timeout=9"}) == 2.5
+    assert parse_budget({"type": "http", "headers": [], "query_string": b"page=1&timeout=5"}) == 5
+    assert parse_budget({"type": "http", "headers": [], "query_string": b"timeout=soon"}) is None
+    assert parse_budget({"type": "http", "headers": [], "query_string": b""}) is None
+
+
+def test_waits_are_capped_by_the_deadline(request_deadline):
+    """
+    Test that an element wait gives up when the request's budget runs out instead of waiting for TIMEOUT.
+    """
+    request_deadline(0.3)
+    with patch("app.services.scraper.session.get_driver", FakeDriver):
+        scraper = Scraper(session=NavigationSession())
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            scraper.find_element("//div")
+        assert time.monotonic() - started < 2
+        with pytest.raises(DeadlineExceeded):
+            scraper.get_page("https://a")
+
+
+def test_batch_fetch_returns_partial_results(request_deadline, tmp_path):
+    """
+    Test that matches not fetched before the deadline are skipped and the request marked as partial.
+    """
+    request = request_deadline(0.25)
+    with patch("app.services.repository.store", LocalStore(str(tmp_path))), \
+            patch("app.services.repository.MatchScraper", SlowMatchScraper):
+        details = fetch_matches([f"m{i}" for i in range(10)], workers=1)
+    assert 0 < len(details) < 10
+    assert request.partial
+
+
+def test_partial_results_are_not_cached(request_deadline, tmp_path):
+    """
+    Test that columns built from results cut short by the deadline are not reused by later requests.
+    """
+    results = [Match(id=f"m{i}", archive="a", url="u", match_date=datetime(2023, 1, i + 1), round=i + 1, home="Inter",
+                     away="Milan", home_score=1, away_score=0) for i in range(3)]
+
+    def get_results(archive_id):
+        if current_deadline.get() is not None:
+            deadline.mark_partial()
+            return results[:1], datetime.now()
+        return results, datetime.now()
+
+    with patch("app.services.repository.store", LocalStore(str(tmp_path))), \
+            patch("app.services.repository.get_results", get_results):
+        token = current_deadline.set(Deadline(10))
+        try:
+            assert len(get_result_columns("Italy-Serie A-2099_2100")) == 1
+        finally:
+            current_deadline.reset(token)
+        assert len(get_result_columns("Italy-Serie A-2099_2100")) == 3
+
+
+def test_partial_flag_reaches_the_response():
+    """
+    Test that the middleware starts a deadline for the request and that list responses report partial results.
+    """
+    app = FastAPI()
+    app.add_middleware(DeadlineMiddleware)
+
+    @app.get("/matches", response_model=MatchListResponse)
+    def get_matches():
+        if deadline.expired():
+            deadline.mark_partial()
+        return MatchListResponse(matches=[], partial=deadline.is_partial())
+
+    client = TestClient(app)
+    assert client.get("/matches").json()["partial"] is False
+    assert client.get("/matches", params={"timeout": "0.000001"}).json()["partial"] is True
@@ -0,0 +1,76 @@
+import io
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+import pytest
+from datetime import datetime
+from fastapi.testclient import TestClient
+from unittest.mock import patch
+from app.routers.archive import router
+from app.services.exporter import export_matches
+from app.services.models.archive_schemas import ExportFormat
+from app.services.models.match_schemas import Match as MatchDetail
+from app.tests.factories import ARCHIVE_ID, make_match
+
+
+def make_matches(count):
+    return [make_match(i // 10 + 1, f"Home {i}", f"Away {i}", i % 4, i % 3, match_id=f"m{i}",
+                       match_date=datetime(2024, 5, 26, 20, 45)) for i in range(count)]
+
+
+def fake_stats_fetcher(match_ids):
+    return {match_id: MatchDetail(id=match_id, expected_goals_xg=(1.5, 0.5), ball_possession=(60, 40))
+            for match_id in match_ids if match_id != "m0"}
+
+
+class MockArchiveScraper:
+    def iter_results_by_archive(self, archive_id):
+        return iter(make_matches(25))
+
+client = TestClient(router)
+
+@pytest.fixture
+def mock_archive_scraper():
+    with patch("app.routers.archive.ArchiveScraper", MockArchiveScraper):
+        yield
+
+def test_export_parquet_with_stats():
+    """
+    Test that a Parquet export spanning several batches round-trips, with statistics joined per match.
+    """
+    body = b"".join(export_matches(iter(make_matches(250)), ExportFormat.PARQUET, fake_stats_fetcher))
+    table = pq.read_table(io.BytesIO(body))
+    assert table.num_rows == 250
+    assert table.column("home").to_pylist()[3] == "Home 3"
+    assert table.column("expected_goals_xg_home").to_pylist()[:2] == [None, 1.5]
+    assert table.column("ball_possession_away").to_pylist()[1] == 40
+
+def test_export_arrow_and_csv():
+    """
+    Test the Arrow IPC and CSV encodings of the same rows.
+    """
+    body = b"".join(export_matches(iter(make_matches(15)), ExportFormat.ARROW))
+    table = pa.ipc.open_stream(body).read_all()
+    assert table.num_rows == 15
+    assert "expected_goals_xg_home" not in table.column_names
+
+    body = b"".join(export_matches(iter(make_matches(15)), ExportFormat.CSV))
+    table = pa_csv.read_csv(io.BytesIO(body))
+    assert table.num_rows == 15
+    assert table.column("id").to_pylist()[-1] == "m14"
+
+def test_export_empty():
+    """
+    Test that an archive without results still produces a valid file.
+    """
+    body = b"".join(export_matches(iter(()), ExportFormat.PARQUET))
+    assert pq.read_table(io.BytesIO(body)).num_rows == 0
+
+def test_export_results_endpoint(mock_archive_scraper):
+    """
+    Test the /archives/{archiveId}/results.{format} endpoint.
+    """
+    response = client.get(f"/{ARCHIVE_ID}/results.parquet")
+    assert response.status_code == 200, "Expected status code 200"
+    assert response.headers["content-type"] == "application/vnd.apache.parquet"
+    assert pq.read_table(io.BytesIO(response.content)).num_rows == 25
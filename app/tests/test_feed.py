@@ -0,0 +1,101 @@
+from datetime import datetime
+from unittest.mock import patch
+import pytest
+from app.services.models.archive_schemas import Archive
+from app.services.recorder import recordings, CAPTURE_OFF, CAPTURE_REPLAY
+from app.services.scraper.archive_scraper import ArchiveScraper, CONFIG_SCORE
+from app.services.scraper.feed import parse_feed, match_rows, match_stats, to_match
+from app.services.scraper.session import NavigationSession
+
+RESULTS_URL = "https://www.livescore.in/football/italy/serie-a-2023-2024/results/"
+LIVE_URL = "https://www.livescore.in/football/italy/serie-a/"
+KICKOFF = int(datetime(2024, 5, 26, 20, 45).timestamp())
+
+RESULTS_FEED = (
+    f"SA÷1¬~ZA÷ITALY: Serie A¬ZEE÷x¬~"
+    f"AA÷abc123¬AD÷{KICKOFF}¬AB÷3¬ER÷Round 38¬AE÷Inter¬AF÷Verona¬AG÷2¬AH÷2¬~"
+    f"AA÷def456¬AD÷{KICKOFF - 3600}¬AB÷3¬AE÷Milan¬AF÷Salernitana¬AG÷3¬AH÷3¬~"
+    f"AA÷ghi789¬AD÷{KICKOFF - 86400 * 7}¬AB÷3¬ER÷Round 37¬AE÷Lazio¬AF÷Inter¬AG÷1¬AH÷0¬~"
+)
+LIVE_FEED = (
+    f"AA÷live01¬AD÷{KICKOFF}¬AB÷2¬AC÷13¬AE÷Roma¬AF÷Genoa¬AG÷1¬AH÷0¬~"
+    f"AA÷sched1¬AD÷{KICKOFF + 3600}¬AB÷1¬AE÷Lecce¬AF÷Monza¬~"
+)
+STATS_FEED = (
+    "SE÷Match¬~SG÷Ball Possession¬SH÷61%¬SI÷39%¬~SG÷Corner Kicks¬SH÷7¬SI÷2¬~"
+    "SE÷1st Half¬~SG÷Ball Possession¬SH÷55%¬SI÷45%¬~"
+)
+
+
+def feed_response(url: str, body: str) -> dict:
+    return {"url": url, "status": 200, "mime_type": "text/plain", "type": "XHR", "body": body}
+
+
+@pytest.fixture
+def feed_mode(tmp_path):
+    with patch.object(recordings, "root", str(tmp_path)), \
+            patch("app.services.scraper.scraper.EXTRACTION_MODE", "feed"):
+        yield
+
+
+def test_feed_records_are_parsed():
+    """
+    Test that feed payloads are split into records, with match rows inheriting the round of the previous row.
+    """
+    records = parse_feed(RESULTS_FEED)
+    assert records[1] == {"ZA": "ITALY: Serie A", "ZEE": "x"}
+
+    rows = match_rows(records)
+    assert [row["AA"] for row in rows] == ["abc123", "def456", "ghi789"]
+    match = to_match(rows[1], "Italy-Serie A-2023_2024", with_score=True)
+    assert (match.round, match.home, match.away, match.home_score, match.away_score) == (38, "Milan", "Salernitana", 3, 3)
+    assert match.match_date == datetime(2024, 5, 26, 19, 45)
+    assert match.url == "https://www.livescore.in/match/def456/#/match-summary"
+    assert to_match({"AA": "nostart", "AE": "Roma", "AF": "Genoa"}, "Italy-Serie A-2023_2024", with_score=True) is None
+    assert to_match({"AA": "badstart", "AD": "soon"}, "Italy-Serie A-2023_2024", with_score=False) is None
+
+    assert match_stats(parse_feed(STATS_FEED)) == {"Ball Possession": ("61%", "39%"), "Corner Kicks": ("7", "2")}
+
+
+def test_matches_are_read_from_captured_feeds(feed_mode):
+    """
+    Test that results and live matches are built from the recorded feed responses, without any match row in the DOM.
+    """
+    recordings.save(RESULTS_URL, RESULTS_URL, "<html><body></body></html>", [feed_response(RESULTS_URL, RESULTS_FEED)])
+    recordings.save(LIVE_URL, LIVE_URL, "<html><body></body></html>", [feed_response(LIVE_URL, LIVE_FEED)])
+    archive = Archive.model_construct(id="Italy-Serie A-2023_2024", season="2023_2024", results=RESULTS_URL,
+                                      live=LIVE_URL)
+    scraper = ArchiveScraper(session=NavigationSession(mode=CAPTURE_REPLAY))
+
+    matches, pagination = scraper.scrape_matches(RESULTS_URL, archive, 1, 2, {CONFIG_SCORE: True})
+    assert [match.id for match in matches] == ["abc123", "def456"]
+    assert pagination.total_items == 3 and pagination.total_pages == 2
+
+    with patch.object(scraper, "scrape_archive", return_value=archive):
+        live = scraper.scrape_live_by_archive(archive.id)
+    assert [(match.id, match.time, match.home_score) for match in live] == [("live01", "2nd Half", 1)]
+
+
+def test_session_collects_responses_per_page():
+    """
+    Test that a capturing session accumulates the responses of the current page and drops them on navigation.
+    """
+    logs = [[feed_response("a", "AA÷1¬")], [feed_response("a", "AA÷2¬")], [feed_response("a", "late")],
+            [feed_response("b", "AA÷3¬")]]
+
+    class FakeDriver:
+        def get(self, url):
+            pass
+
+        def quit(self):
+            pass
+
+    with patch("app.services.scraper.session.get_driver", lambda **options: FakeDriver()), \
+            patch("app.services.scraper.session.EXTRACTION_MODE", "feed"), \
+            patch("app.services.scraper.session.read_responses", side_effect=lambda driver: logs.pop(0)):
+        session = NavigationSession(mode=CAPTURE_OFF)
+        session.navigate("a")
+        assert [response["body"] for response in session.responses()] == ["AA÷1¬"]
+        assert [response["body"] for response in session.responses()] == ["AA÷1¬", "AA÷2¬"]
+        session.navigate("b")
+        assert [response["body"] for response in session.responses()] == ["AA÷3¬"]
@@ -0,0 +1,93 @@
+from unittest.mock import patch
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from app.routers.match import router
+from app.services.fields import parse_fields
+from app.services.models.archive_schemas import Archive, Match
+from app.services.models.match_schemas import Match as MatchDetail
+from app.services.recorder import CAPTURE_OFF
+from app.services.scraper import archive_scraper, match_scraper
+from app.services.scraper.archive_scraper import ArchiveScraper, CONFIG_SCORE, CONFIG_FIELDS
+from app.services.scraper.match_scraper import MatchScraper
+from app.services.scraper.session import NavigationSession
+
+
+class FakeElement:
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+
+def test_fields_are_validated():
+    """
+    Test that requested fields are checked against the model, and that the ID is always returned.
+    """
+    assert parse_fields(None, Match) is None
+    assert parse_fields("home_score, away_score", Match) == {"id", "home_score", "away_score"}
+    with pytest.raises(HTTPException) as error:
+        parse_fields("home_score,goals", Match)
+    assert error.value.status_code == 400 and "goals" in error.value.detail
+
+
+def test_unrequested_row_cells_are_not_looked_up():
+    """
+    Test that a results row only reads the cells of the requested fields, besides its link.
+    """
+    scraper = ArchiveScraper(session=NavigationSession(mode=CAPTURE_OFF))
+    archive = Archive.model_construct(id="Italy-Serie A-2023_2024", season="2023_2024")
+    looked_up = []
+
+    def find_element(xpath, element=None, **options):
+        looked_up.append(xpath)
+        return FakeElement("2")
+
+    config = {CONFIG_SCORE: True, CONFIG_FIELDS: frozenset({"id", "home_score"})}
+    with patch.object(scraper, "find_element", side_effect=find_element), \
+            patch.object(scraper, "get_attribute", return_value="https://www.livescore.in/match/abc123/"):
+        match = scraper.extract_match(object(), 38, archive, config, 0)
+
+    assert looked_up == [archive_scraper.XPATH_ID_MATCH, archive_scraper.XPATH_HOME_SCORE_MATCH]
+    assert (match.id, match.home_score) == ("abc123", 2)
+
+
+def test_match_statistics_are_skipped_when_not_requested():
+    """
+    Test that a match scraped for its score reads neither its header details nor its statistics rows.
+    """
+    scraper = MatchScraper(session=NavigationSession(mode=CAPTURE_OFF))
+    looked_up = []
+
+    def find_element(xpath, element=None, **options):
+        looked_up.append(xpath)
+        return FakeElement("1")
+
+    with patch.object(scraper, "get_page"), \
+            patch.object(scraper, "find_element", side_effect=find_element), \
+            patch.object(scraper, "find_elements", side_effect=AssertionError("no list lookup expected")):
+        match = scraper.scrape_match("abc123", frozenset({"id", "home_score", "away_score"}))
+
+    assert looked_up == [match_scraper.XPATH_STATS_BUTTON, match_scraper.XPATH_HOME_SCORE,
+                         match_scraper.XPATH_AWAY_SCORE]
+    assert (match.home_score, match.away_score, match.played) == (1, 1, True)
+
+
+def test_sparse_match_is_not_stored():
+    """
+    Test that the match endpoint returns only the requested fields, and that a sparse match is never stored.
+    """
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+    scraped = MatchDetail(id="abc123", home_score=3, status="Finished", played=True)
+
+    with patch("app.services.repository.store.load_match", return_value=None), \
+            patch("app.services.repository.store.save_match") as save_match, \
+            patch("app.services.repository.MatchScraper") as scraper:
+        scraper.return_value.scrape_match.return_value = scraped
+        response = client.get("/abc123", params={"fields": "home_score,status,played"})
+        assert client.get("/abc123", params={"fields": "xg"}).status_code == 400
+
+    assert response.status_code == 200
+    assert response.json() == {"match": {"id": "abc123", "home_score": 3, "status": "Finished", "played": True}}
+    scraper.return_value.scrape_match.assert_called_once_with("abc123", {"id", "home_score", "status", "played"})
+    save_match.assert_not_called()
@@ -0,0 +1,144 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.routers.fixture import router, parse_leagues
+from app.services import repository
+from app.services.fixture_calendar import FixtureCalendar, to_archive_id
+from app.services.models.archive_schemas import Match
+from app.services.store import LocalStore, FIXTURES, RESULTS
+
+START = datetime(2025, 3, 1, 12, 0)
+
+
+def fixture(match_id: str, archive: str, hours: float) -> Match:
+    return Match(id=match_id, archive=archive, url=f"/match/{match_id}", match_date=START + timedelta(hours=hours),
+                 round=1, home="Home", away="Away")
+
+
+def test_range_queries_are_chronological_and_inclusive():
+    """
+    Test that a range query returns the fixtures of every archive between both bounds, sorted by date.
+    """
+    calendar = FixtureCalendar()
+    calendar.update_archive("A-2024_2025", [fixture("a2", "A-2024_2025", 48), fixture("a1", "A-2024_2025", 0)], START)
+    calendar.update_archive("B-2024_2025", [fixture("b1", "B-2024_2025", 24), fixture("b2", "B-2024_2025", 100)], START)
+
+    matches = calendar.between(START, START + timedelta(hours=48))
+    assert [match.id for match in matches] == ["a1", "b1", "a2"]
+    assert [match.id for match in calendar.between(START, START + timedelta(hours=48), ["B-2024_2025"])] == ["b1"]
+    assert calendar.between(START + timedelta(hours=1), START + timedelta(hours=2)) == []
+
+
+def test_archive_updates_are_incremental():
+    """
+    Test that refreshing an archive drops vanished fixtures, reindexes rescheduled ones and ignores older lists.
+    """
+    calendar = FixtureCalendar()
+    calendar.update_archive("A-2024_2025", [fixture("a1", "A-2024_2025", 0), fixture("a2", "A-2024_2025", 10)], START)
+    # a1 was played, a2 was postponed by a week
+    later = START + timedelta(hours=1)
+    calendar.update_archive("A-2024_2025", [fixture("a2", "A-2024_2025", 178)], later)
+    assert len(calendar) == 1
+    assert calendar.between(START, START + timedelta(hours=24)) == []
+    assert [match.id for match in calendar.between(START, START + timedelta(days=8))] == ["a2"]
+
+    calendar.update_archive("A-2024_2025", [fixture("a9", "A-2024_2025", 0)], START)
+    assert [match.id for match in calendar.between(START, START + timedelta(days=8))] == ["a2"]
+
+
+def test_fixtures_without_date_are_not_indexed():
+    """
+    Test that fixtures scraped without a date are left out of the calendar instead of breaking the index.
+    """
+    calendar = FixtureCalendar()
+    undated = Match.model_construct(id="a0", archive="A-2024_2025", url="/match/a0", round=1, home="Home", away="Away")
+    nulled = Match.model_construct(id="a3", archive="A-2024_2025", url="/match/a3", match_date=None, round=1)
+    calendar.update_archive("A-2024_2025", [fixture("a1", "A-2024_2025", 0), undated, nulled], START)
+
+    assert len(calendar) == 1
+    assert [match.id for match in calendar.between(START, START + timedelta(hours=1))] == ["a1"]
+
+
+def test_stored_results_leave_the_calendar(tmp_path):
+    """
+    Test that fixtures are dropped from the calendar once they are stored as results.
+    """
+    archive_id = "A-2024_2025"
+    calendar = FixtureCalendar()
+    calendar.update_archive(archive_id, [fixture("a1", archive_id, 0), fixture("a2", archive_id, 10)], START)
+
+    class ResultsScraper:
+        def scrape_results_by_archive(self, archive_id, page, size):
+            return [fixture("a1", archive_id, 0)], None
+
+        def close(self):
+            pass
+
+    with patch.object(repository, "store", LocalStore(str(tmp_path))), \
+            patch.object(repository, "calendar", calendar), \
+            patch.object(repository, "ArchiveScraper", ResultsScraper):
+        repository.get_results(archive_id)
+    assert [match.id for match in calendar.between(START, START + timedelta(days=1))] == ["a2"]
+
+
+def test_fresh_fixtures_are_indexed_without_scraping(tmp_path):
+    """
+    Test that stored fixtures are indexed from the store, and only stale archives are scraped.
+    """
+    store = LocalStore(str(tmp_path))
+    store.save_archive_section("A-2024_2025", FIXTURES, [fixture("a1", "A-2024_2025", 0)])
+    scraped = []
+
+    class FixturesScraper:
+        def scrape_fixtures_by_archive(self, archive_id, page, size):
+            scraped.append(archive_id)
+            return [fixture("b1", archive_id, 1)], None
+
+        def close(self):
+            pass
+
+    calendar = FixtureCalendar()
+    with patch.object(repository, "store", store), \
+            patch.object(repository, "calendar", calendar), \
+            patch.object(repository, "ArchiveScraper", FixturesScraper):
+        assert repository.index_fixtures(["A-2024_2025", "B-2024_2025"]) == []
+    assert scraped == ["B-2024_2025"]
+    assert store.has_archive_section("B-2024_2025", FIXTURES)
+    assert not store.has_archive_section("B-2024_2025", RESULTS)
+    assert [match.id for match in calendar.between(START, START + timedelta(hours=2))] == ["a1", "b1"]
+
+
+def test_leagues_resolve_to_running_season():
+    """
+    Test that league IDs resolve to the archive of the running season, and archive IDs are kept.
+    """
+    assert to_archive_id("Italy-Serie A", datetime(2025, 3, 1)) == "Italy-Serie A-2024_2025"
+    assert to_archive_id("Italy-Serie A-2022_2023") == "Italy-Serie A-2022_2023"
+    with patch("app.services.fixture_calendar.get_current_season", return_value="2024_2025"):
+        assert parse_leagues("Italy-Serie A, Spain-LaLiga-2023_2024,,Italy-Serie A") == [
+            "Italy-Serie A-2024_2025", "Spain-LaLiga-2023_2024"]
+
+
+def test_fixtures_endpoint():
+    """
+    Test the /fixtures endpoint range defaults and validation.
+    """
+    calendar = FixtureCalendar()
+    calendar.update_archive("A-2024_2025", [fixture("a1", "A-2024_2025", 0), fixture("a2", "A-2024_2025", 80)], START)
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+    with patch("app.routers.fixture.calendar", calendar), \
+            patch("app.routers.fixture.index_fixtures", return_value=["B-2024_2025"]) as index_fixtures, \
+            patch("app.routers.fixture.has_fresh_fixtures", return_value=True):
+        body = client.get("/", params={"from": "2025-03-01T00:00:00", "leagues": "A-2024_2025,B-2024_2025"}).json()
+        assert [match["id"] for match in body["matches"]] == ["a1"]
+        assert body["missing"] == ["B-2024_2025"]
+        index_fixtures.assert_called_once_with(["A-2024_2025", "B-2024_2025"])
+
+        body = client.get("/", params={"from": "2025-03-01T00:00:00", "to": "2025-03-05T00:00:00"}).json()
+        assert body["total_matches"] == 2
+
+        response = client.get("/", params={"from": "2025-03-02T00:00:00", "to": "2025-03-01T00:00:00"})
+        assert response.status_code == 400
@@ -0,0 +1,125 @@
+import threading
+import time
+from unittest.mock import patch
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.routers.job import router
+from app.services.admission import AdmissionController
+from app.services.jobs import JobManager
+from app.services.models.match_schemas import Match
+from app.tests.factories import FakeSession
+
+
+def fake_fetch_matches(match_ids, progress=None):
+    details = {}
+    for match_id in match_ids:
+        if match_id != "missing":
+            details[match_id] = Match(id=match_id)
+        progress()
+    return details
+
+
+@pytest.fixture
+def manager():
+    manager = JobManager(workers=1, ttl=60, webhook_retries=2)
+    app = FastAPI()
+    app.include_router(router)
+    with patch("app.routers.job.jobs", manager), \
+            patch("app.services.jobs.NavigationSession", FakeSession), \
+            patch("app.services.jobs.fetch_matches", fake_fetch_matches):
+        manager.client = TestClient(app)
+        yield manager
+    manager.executor.shutdown(wait=True)
+
+
+def wait_finished(client, job_id):
+    for _ in range(200):
+        job = client.get(f"/{job_id}").json()["job"]
+        if job["status"] in ("succeeded", "failed"):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+def test_batch_job_reports_progress_and_result(manager):
+    """
+    Test that a submitted job is accepted at once, then polled until its result is available.
+    """
+    response = manager.client.post("/", json={"kind": "batch", "match_ids": ["a", "b", "missing", "a"]})
+
+    assert response.status_code == 202
+    assert response.json()["job"]["status"] == "queued"
+    job = wait_finished(manager.client, response.json()["job"]["id"])
+    assert job["status"] == "succeeded"
+    assert job["progress"] == {"done": 3, "total": 3, "unit": "matches"}
+    assert sorted(job["result"]["matches"]) == ["a", "b"]
+    assert job["result"]["missing"] == ["missing"]
+    assert job["expires_at"] is not None
+
+
+def test_invalid_and_unknown_jobs(manager):
+    """
+    Test that a job missing its parameters is rejected and that an unknown job is not found.
+    """
+    assert manager.client.post("/", json={"kind": "results"}).status_code == 400
+    assert manager.client.post("/", json={"kind": "unknown"}).status_code == 422
+    assert manager.client.get("/nope").status_code == 404
+
+
+def test_failed_job_is_reported_then_expires(manager):
+    """
+    Test that a failing scrape marks its job as failed, and that finished jobs are discarded after the TTL.
+    """
+    with patch("app.services.jobs.get_fixtures", side_effect=RuntimeError("site down")):
+        job_id = manager.client.post("/", json={"kind": "fixtures", "archive_id": "x"}).json()["job"]["id"]
+        job = wait_finished(manager.client, job_id)
+
+    assert job["status"] == "failed"
+    assert job["error"] == "RuntimeError: site down"
+
+    manager.ttl = 0
+    job_id = manager.client.post("/", json={"kind": "batch", "match_ids": ["a"]}).json()["job"]["id"]
+    manager.executor.submit(lambda: None).result()
+    assert manager.client.get(f"/{job_id}").status_code == 404
+
+
+def test_webhook_is_retried(manager):
+    """
+    Test that the finished job is posted to its webhook, retrying failed deliveries.
+    """
+    calls = []
+    delivered = threading.Event()
+
+    def post(url, content, headers, timeout):
+        calls.append(url)
+        if len(calls) == 1:
+            raise httpx.ConnectError("refused")
+        delivered.set()
+        return httpx.Response(200, request=httpx.Request("POST", url))
+
+    with patch("app.services.jobs.httpx.post", post), patch("app.services.jobs.time.sleep"):
+        manager.client.post("/", json={"kind": "batch", "match_ids": ["a"], "webhook": "http://hook"})
+        assert delivered.wait(2)
+
+    assert calls == ["http://hook", "http://hook"]
+
+
+def test_jobs_wait_for_a_free_browser(manager):
+    """
+    Test that a job stays queued while admission has no free browser, and holds one while it runs.
+    """
+    controller = AdmissionController(max_browsers=1)
+    busy = controller.admit("GET /busy")
+    with patch("app.services.jobs.controller", controller):
+        job_id = manager.client.post("/", json={"kind": "batch", "match_ids": ["a"]}).json()["job"]["id"]
+        time.sleep(0.05)
+        assert manager.client.get(f"/{job_id}").json()["job"]["status"] == "queued"
+
+        controller.release(busy)
+        assert wait_finished(manager.client, job_id)["status"] == "succeeded"
+        manager.executor.submit(lambda: None).result()
+
+    assert not controller.in_flight
+    assert "JOB batch" in controller.latencies
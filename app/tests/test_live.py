@@ -0,0 +1,107 @@
+import threading
+import time
+from datetime import datetime
+from unittest.mock import patch
+import pytest
+from fastapi.testclient import TestClient
+from app.routers.live import router
+from app.services.live_feed import LiveFeed
+from app.services.models.archive_schemas import LiveLeague, LiveMatch
+from app.services.recorder import recordings, CAPTURE_REPLAY
+from app.services.scraper.archive_scraper import ArchiveScraper
+from app.services.scraper.session import NavigationSession
+from config import URL_LIVESPORT
+
+LIVE_ROW = """
+<div class="event__match event__match--live">
+  <a href="/match/{id}/#/match-summary"></a>
+  <div><div>{time}</div></div>
+  <div><span>{home}</span></div>
+  <div><span>{away}</span></div>
+  <div>{home_score}</div>
+  <div>{away_score}</div>
+</div>
+"""
+
+HOME_HTML = f"""
+<html><body>
+  <nav><div><div><a href="/football/">Football</a></div></div></nav>
+  <div class="filters__tab">ALL</div><div class="filters__tab">LIVE</div>
+  <div id="live-table"><section><div class="sportName soccer">
+    <div class="headerLeague__wrapper"><span class="headerLeague__category-text">Italy:</span>
+      <a class="headerLeague__title" href="/football/italy/serie-a/"><span>Serie A</span></a></div>
+    {LIVE_ROW.format(id="aaa", time="23'", home="Inter", away="Milan", home_score=1, away_score=0)}
+    {LIVE_ROW.format(id="bbb", time="HT", home="Roma", away="Lazio", home_score=2, away_score=2)}
+    <div class="headerLeague__wrapper"><span class="headerLeague__category-text">England:</span>
+      <a class="headerLeague__title" href="/football/england/premier-league/"><span>Premier League</span></a></div>
+    {LIVE_ROW.format(id="ccc", time="81'", home="Arsenal", away="Chelsea", home_score=0, away_score=3)}
+  </div></section></div>
+</body></html>
+"""
+
+
+class CountingScraper:
+    calls = 0
+
+    def scrape_live_feed(self):
+        CountingScraper.calls += 1
+        time.sleep(0.1)
+        return [LiveLeague(league="Italy-Serie A", archive="Italy-Serie A-2024_2025", matches=[])]
+
+    def close(self):
+        pass
+
+
+def test_live_feed_is_scraped_from_the_homepage(tmp_path):
+    """
+    Test that every live match of the homepage is extracted and grouped under its league header.
+    """
+    with patch.object(recordings, "root", str(tmp_path)), \
+            patch("app.services.scraper.archive_scraper.get_current_season", return_value="2024_2025"):
+        recordings.save(URL_LIVESPORT, URL_LIVESPORT, HOME_HTML, [])
+        leagues = ArchiveScraper(session=NavigationSession(mode=CAPTURE_REPLAY)).scrape_live_feed()
+
+    assert [(league.league, league.archive) for league in leagues] == [
+        ("Italy-Serie A", "Italy-Serie A-2024_2025"),
+        ("England-Premier League", "England-Premier League-2024_2025"),
+    ]
+    assert [(match.id, match.home, match.home_score, match.away_score, match.time) for match in leagues[0].matches] == [
+        ("aaa", "Inter", 1, 0, "23'"),
+        ("bbb", "Roma", 2, 2, "HT"),
+    ]
+    assert leagues[1].matches[0].archive == "England-Premier League-2024_2025"
+
+
+def test_concurrent_requests_share_one_refresh():
+    """
+    Test that concurrent requests on an expired feed trigger a single scrape, and that it is reused until the TTL.
+    """
+    CountingScraper.calls = 0
+    feed = LiveFeed(ttl=60)
+    with patch("app.services.live_feed.ArchiveScraper", CountingScraper):
+        threads = [threading.Thread(target=feed.get) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        feed.get()
+    assert CountingScraper.calls == 1
+    assert feed.is_fresh()
+
+
+def test_live_endpoint_filters_leagues():
+    """
+    Test the /live endpoint with a league filter, case-insensitive.
+    """
+    match = LiveMatch(id="aaa", archive="Italy-Serie A-2024_2025", url="u", time="23'", home="Inter", away="Milan")
+    leagues = [
+        LiveLeague(league="Italy-Serie A", archive="Italy-Serie A-2024_2025", matches=[match]),
+        LiveLeague(league="Spain-LaLiga", archive="Spain-LaLiga-2024_2025", matches=[match, match]),
+    ]
+    client = TestClient(router)
+    with patch("app.routers.live.live_feed.get", return_value=(leagues, datetime(2024, 5, 1, 20, 0))):
+        body = client.get("/", params={"league": ["italy-serie a"]}).json()
+        assert [league["league"] for league in body["leagues"]] == ["Italy-Serie A"]
+        assert body["total_matches"] == 1
+
+        assert client.get("/").json()["total_matches"] == 3
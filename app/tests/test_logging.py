@@ -0,0 +1,99 @@
+import logging
+import orjson
+from unittest.mock import patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.middleware.correlation import CorrelationIdMiddleware
+from logger import logger_config
+from logger.logger_config import JsonFormatter, SampledLogger, configure_logging, request_id
+
+
+def make_record(message, *args, **extra):
+    record = logging.LogRecord("app.test", logging.INFO, __file__, 1, message, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_lines_carry_request_id_and_extra_fields():
+    """
+    Test that records are formatted lazily into one JSON object with the request ID and extra fields.
+    """
+    entry = orjson.loads(JsonFormatter().format(make_record("Found %d elements", 3, request_id="abc", page="results")))
+    assert entry["message"] == "Found 3 elements"
+    assert entry["request_id"] == "abc"
+    assert entry["page"] == "results"
+    assert entry["level"] == "INFO" and entry["logger"] == "app.test"
+
+
+def test_element_events_are_sampled_before_formatting():
+    """
+    Test that dropped or disabled element events never reach the logger.
+    """
+    class Unformattable:
+        def __str__(self):
+            raise AssertionError("formatted")
+
+    sampled = SampledLogger("app.test.elements", rate=0)
+    sampled.logger.setLevel(logging.DEBUG)
+    with patch.object(sampled.logger, "handle") as handle:
+        sampled.debug("Finding %s", Unformattable())
+        handle.assert_not_called()
+
+        sampled.rate = 1
+        sampled.debug("Finding %s", "//div")
+        assert handle.call_count == 1
+
+        sampled.logger.setLevel(logging.INFO)
+        sampled.debug("Finding %s", Unformattable())
+        assert handle.call_count == 1
+
+
+def test_records_go_through_the_queue_with_request_id(capsys):
+    """
+    Test that configured logging writes JSON lines from a background listener, tagged with the current request ID.
+    """
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    try:
+        with patch("config.LOG_FORMAT", "json"):
+            configure_logging()
+        assert isinstance(root.handlers[0], logging.handlers.QueueHandler)
+        # Debug level by default, sampled element events being cheap enough for production
+        assert root.isEnabledFor(logging.DEBUG)
+
+        token = request_id.set("req-1")
+        logging.info("Scraped %s countries", 12)
+        try:
+            raise ValueError("no table")
+        except ValueError:
+            logging.exception("Unable to scrape %s", "standings")
+        request_id.reset(token)
+        logger_config._stop_listener()
+    finally:
+        root.handlers, root.level = handlers, level
+
+    entries = [orjson.loads(line) for line in capsys.readouterr().err.strip().splitlines()[-2:]]
+    assert entries[0]["message"] == "Scraped 12 countries"
+    assert entries[0]["request_id"] == "req-1"
+    assert entries[1]["message"] == "Unable to scrape standings"
+    assert "ValueError: no table" in entries[1]["exception"]
+
+
+def test_request_id_header_is_propagated_or_generated():
+    """
+    Test that a valid client request ID is reused and returned, and that invalid ones are replaced.
+    """
+    app = FastAPI()
+    app.add_middleware(CorrelationIdMiddleware)
+
+    @app.get("/id")
+    def get_id():
+        return {"request_id": request_id.get()}
+
+    client = TestClient(app)
+    response = client.get("/id", headers={"X-Request-ID": "client-42"})
+    assert response.json()["request_id"] == response.headers["X-Request-ID"] == "client-42"
+
+    response = client.get("/id", headers={"X-Request-ID": "bad id\nINFO forged"})
+    assert response.headers["X-Request-ID"] != "bad id\nINFO forged"
+    assert response.json()["request_id"] == response.headers["X-Request-ID"]
@@ -0,0 +1,115 @@
+import os
+from datetime import datetime
+import threading
+import time
+import orjson
+import pytest
+from unittest.mock import patch
+from app.services.metrics import metrics
+from app.services.models.archive_schemas import Match
+from app.services.models.match_schemas import Match as MatchDetail
+from app.services.repository import MatchFetcher, fetch_matches
+from app.services.store import LocalStore, RESULTS
+
+scraped = []
+browsers = set()
+
+
+class MockMatchScraper:
+    def scrape_match(self, match_id):
+        browsers.add((id(self), threading.get_ident()))
+        time.sleep(0.05)
+        scraped.append(match_id)
+        if match_id == "live":
+            return MatchDetail(id=match_id, status="2nd Half", played=True, home_score=1)
+        return MatchDetail(id=match_id, status="Finished", played=True, home_score=2, expected_goals_xg=(1.8, 0.4))
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def local_store(tmp_path):
+    local_store = LocalStore(str(tmp_path))
+    with patch("app.services.repository.store", local_store), \
+            patch("app.services.repository.MatchScraper", MockMatchScraper):
+        scraped.clear()
+        browsers.clear()
+        yield local_store
+
+
+def test_store_is_immutable_and_content_addressed(tmp_path):
+    """
+    Test that a stored match is never overwritten and that objects are named by their content hash.
+    """
+    local_store = LocalStore(str(tmp_path))
+    assert local_store.save_match(MatchDetail(id="a", status="Finished", home_score=1))
+    assert not local_store.save_match(MatchDetail(id="a", status="Finished", home_score=5))
+    assert local_store.load_match("a").home_score == 1
+
+    local_store.save_match(MatchDetail(id="c"))
+    local_store.save_match(MatchDetail(id="d"))
+    objects = [name for _, _, names in os.walk(os.path.join(tmp_path, "matches", "objects")) for name in names]
+    assert len(objects) == 3
+    with open(local_store.match_index_path("a")) as file:
+        assert f"{file.read()}.json" in objects
+    assert local_store.load_match("missing") is None
+
+
+def test_fetcher_serves_finished_matches_from_store(local_store):
+    """
+    Test that finished matches are scraped once and live matches every time, with hit/miss accounting.
+    """
+    hits, misses = metrics.count("match_store.hits"), metrics.count("match_store.misses")
+    fetcher = MatchFetcher()
+    assert fetcher.get("done").expected_goals_xg == (1.8, 0.4)
+    assert MatchFetcher().get("done").home_score == 2
+    fetcher.get("live")
+    fetcher.get("live")
+
+    assert scraped == ["done", "live", "live"]
+    assert local_store.has_match("done") and not local_store.has_match("live")
+    assert metrics.count("match_store.hits") - hits == 1
+    assert metrics.count("match_store.misses") - misses == 3
+    assert "match_store.browser_seconds_saved" in metrics.snapshot()["gauges"]
+
+
+def test_fetch_matches_concurrently(local_store):
+    """
+    Test that stored matches are reused and missing ones are scraped in parallel, one browser per worker.
+    """
+    local_store.save_match(MatchDetail(id="known", status="Finished", played=True, home_score=3))
+    match_ids = ["known"] + [f"m{i}" for i in range(8)]
+
+    start = time.perf_counter()
+    details = fetch_matches(match_ids, workers=4)
+    elapsed = time.perf_counter() - start
+
+    assert set(details) == set(match_ids)
+    assert details["known"].home_score == 3
+    assert sorted(scraped) == sorted(match_ids[1:])
+    assert len(browsers) == 4
+    assert elapsed < 8 * 0.05
+
+
+def test_invalid_rows_do_not_break_the_archive(tmp_path):
+    """
+    Test that a scraped row missing a field is not stored, and that one already stored is skipped on load.
+    """
+    local_store = LocalStore(str(tmp_path))
+    complete = Match(id="m1", archive="a", url="u", match_date=datetime(2024, 1, 1), round=1, home="Inter",
+                     away="Milan", home_score=1, away_score=0)
+    incomplete = Match.model_construct(id="m2", archive="a", url="u", round=1)
+
+    local_store.save_archive_section("a", RESULTS, [complete, incomplete])
+    matches, _ = local_store.load_archive_section("a", RESULTS)
+    assert [match.id for match in matches] == ["m1"]
+
+    path = local_store.archive_path("a", RESULTS)
+    with open(path, "rb") as file:
+        payload = orjson.loads(file.read())
+    payload["items"].append(incomplete.model_dump(mode="json"))
+    with open(path, "wb") as file:
+        file.write(orjson.dumps(payload))
+    matches, _ = local_store.load_archive_section("a", RESULTS)
+    assert [match.id for match in matches] == ["m1"]
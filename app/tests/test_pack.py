@@ -0,0 +1,67 @@
+from unittest.mock import patch
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.routers.archive import router
+from app.services.models.archive_schemas import Archive
+from app.tests.factories import ARCHIVE_ID, FakeSession
+
+ARCHIVE = Archive(id=ARCHIVE_ID, league="Italy-Serie A", season="2023_2024", url="a", live="l", results="r",
+                  fixtures="f", standings="s")
+
+
+class CountingScraper:
+    resolved = []
+    sections = []
+
+    def __init__(self, session=None):
+        self.session = session
+
+    def scrape_archive(self, archive_id):
+        self.resolved.append(archive_id)
+        return ARCHIVE if archive_id == ARCHIVE_ID else None
+
+    def scrape_section(self, archive, section):
+        self.sections.append((section, self.session))
+        if section == "standings":
+            return [{"position": 1, "team": "Inter", "matches_played": 38, "points": 94}]
+        return []
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def client():
+    CountingScraper.resolved, CountingScraper.sections = [], []
+    app = FastAPI()
+    app.include_router(router)
+    with patch("app.services.repository.ArchiveScraper", CountingScraper), \
+            patch("app.services.repository.NavigationSession", FakeSession):
+        yield TestClient(app)
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_pack_resolves_the_archive_once(client, parallel):
+    """
+    Test that a pack resolves its archive once and scrapes every section, in worker sessions when parallel.
+    """
+    response = client.get(f"/{ARCHIVE_ID}/pack", params={"parallel": parallel})
+
+    assert response.status_code == 200
+    assert response.json()["archive"]["id"] == ARCHIVE_ID
+    assert response.json()["standings"][0]["team"] == "Inter"
+    assert CountingScraper.resolved == [ARCHIVE_ID]
+    assert sorted(section for section, _ in CountingScraper.sections) == ["fixtures", "results", "standings"]
+
+    worker_sessions = [session for _, session in CountingScraper.sections if session is not None]
+    assert len(worker_sessions) == (2 if parallel else 0)
+    assert all(session.closed for session in worker_sessions)
+
+
+def test_pack_of_unknown_archive(client):
+    """
+    Test that a pack of an archive that does not exist is a 404, without scraping any section.
+    """
+    assert client.get("/Italy-Serie Z-2023_2024/pack").status_code == 404
+    assert CountingScraper.sections == []
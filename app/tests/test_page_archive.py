@@ -0,0 +1,87 @@
+import os
+from datetime import datetime
+from unittest.mock import patch
+import pytest
+from app import reparse
+from app.services.page_archive import PageArchive, PAGES_DIR
+from app.services.recorder import CAPTURE_OFF
+from app.services.scraper.session import NavigationSession
+
+STANDINGS_URL = "https://www.livescore.in/football/italy/serie-a-2023-2024/standings/"
+MATCH_URL = "https://www.livescore.in/match/abc123/#/match-summary/match-statistics/0"
+STANDINGS_HTML = """
+<html><body><div class="ui-table__body">
+  <div>
+    <div>#</div>
+    <div><div><div><a>logo</a><a>Inter</a></div></div></div>
+    <span>38</span><span>29</span><span>7</span><span>2</span><span>89:22</span><span>+67</span><span>94</span>
+  </div>
+</div></body></html>
+"""
+
+
+@pytest.fixture
+def archive(tmp_path):
+    return PageArchive(str(tmp_path), level=3)
+
+
+def test_pages_are_deduplicated_by_content(archive, tmp_path):
+    """
+    Test that a page fetched again unchanged is indexed without storing its content twice.
+    """
+    first = archive.save(STANDINGS_URL, STANDINGS_URL, STANDINGS_HTML, captured_at=datetime(2024, 5, 1, 10))
+    second = archive.save(STANDINGS_URL, STANDINGS_URL, STANDINGS_HTML, captured_at=datetime(2024, 5, 2, 10))
+    archive.save(MATCH_URL, MATCH_URL, "<html>match</html>", captured_at=datetime(2024, 5, 2, 11))
+
+    assert first == second
+    stored = [name for _, _, names in os.walk(tmp_path / PAGES_DIR) for name in names]
+    assert len(stored) == 2
+    assert [entry["url"] for entry in archive.entries()] == [STANDINGS_URL, STANDINGS_URL, MATCH_URL]
+    assert archive.read(first) == STANDINGS_HTML
+    assert archive.load(MATCH_URL, at=datetime(2024, 5, 2, 10)) is None
+    assert archive.load(STANDINGS_URL)["captured_at"] == "2024-05-02T10:00:00"
+
+
+def test_session_archives_pages_it_leaves(archive):
+    """
+    Test that, when enabled, a session adds every page it leaves to the page archive.
+    """
+    class FakeDriver:
+        current_url = None
+        page_source = STANDINGS_HTML
+
+        def get(self, url):
+            self.current_url = url
+
+        def quit(self):
+            pass
+
+    with patch("app.services.scraper.session.get_driver", lambda **options: FakeDriver()), \
+            patch("app.services.scraper.session.PAGE_ARCHIVE_ENABLE", True), \
+            patch("app.services.scraper.session.page_archive", archive):
+        session = NavigationSession(mode=CAPTURE_OFF)
+        session.navigate(STANDINGS_URL)
+        session.navigate(MATCH_URL)
+        session.close()
+
+    assert [entry["url"] for entry in archive.entries()] == [STANDINGS_URL, MATCH_URL]
+
+
+def test_archived_pages_are_reparsed(archive):
+    """
+    Test that the re-parse job selects the last fetch of each page and runs its extractor offline.
+    """
+    archive.save(STANDINGS_URL, STANDINGS_URL, "<html></html>", captured_at=datetime(2024, 5, 1, 10))
+    archive.save(STANDINGS_URL, STANDINGS_URL, STANDINGS_HTML, captured_at=datetime(2024, 5, 2, 10))
+    archive.save("https://www.livescore.in/football/italy/", "https://www.livescore.in/football/italy/", "<html></html>")
+
+    entries = reparse.select_pages(archive, reparse.KINDS)
+    assert [(entry["url"], entry["captured_at"].day) for entry in entries] == [(STANDINGS_URL, 2)]
+    assert len(reparse.select_pages(archive, reparse.KINDS, all_captures=True)) == 2
+
+    with patch.object(reparse, "_archive", archive):
+        result = reparse.reparse_page(entries[0])
+
+    assert result["kind"] == "standings"
+    assert result["data"] == [{"position": 1, "team": "Inter", "matches_played": 38, "wins": 29, "draws": 7,
+                               "losses": 2, "goals_scored": 89, "goals_conceded": 22, "points": 94}]
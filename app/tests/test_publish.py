@@ -0,0 +1,55 @@
+import gzip
+import os
+from datetime import datetime
+import brotli
+import orjson
+from app import publish
+from app.services.models.archive_schemas import Match
+from app.services.models.match_schemas import Match as MatchDetail
+from app.services.store import LocalStore, RESULTS
+
+COMPLETED_ID = "Italy-Serie A-2022_2023"
+CURRENT_ID = "Italy-Serie A-2099_2100"
+
+
+def results(archive_id, home_score=2):
+    return [Match(id=f"{archive_id[-4:]}-{i}", archive=archive_id, url="u", match_date=datetime(2023, 1, i + 1),
+                  round=i + 1, home="Inter", away="Milan", home_score=home_score, away_score=1) for i in range(2)]
+
+
+def read(output, path, suffix):
+    with open(os.path.join(output, path + suffix), "rb") as file:
+        data = file.read()
+    return orjson.loads(gzip.decompress(data) if suffix == ".gz" else brotli.decompress(data))
+
+
+def test_completed_archives_are_published_once(tmp_path):
+    """
+    Test that completed archives are published pre-compressed with a manifest, and only changed files are rewritten.
+    """
+    data_dir, output = str(tmp_path / "data"), str(tmp_path / "static")
+    store = LocalStore(data_dir)
+    store.save_archive_section(COMPLETED_ID, RESULTS, results(COMPLETED_ID))
+    store.save_archive_section(CURRENT_ID, RESULTS, results(CURRENT_ID))
+    store.save_match(MatchDetail(id="2023-0", status="Finished", played=True))
+    argv = ["--data-dir", data_dir, "--output", output, "--workers", "2"]
+
+    publish.main(argv)
+
+    with open(os.path.join(output, publish.MANIFEST), "rb") as file:
+        manifest = orjson.loads(file.read())["files"]
+    results_path = f"archives/{COMPLETED_ID}/results.json"
+    standings_path = f"archives/{COMPLETED_ID}/standings.json"
+    assert sorted(manifest) == [results_path, standings_path, "matches/2023-0.json"]
+    for suffix in (".gz", ".br"):
+        assert len(read(output, results_path, suffix)["matches"]) == 2
+        assert read(output, standings_path, suffix)["standings"][0]["team"] == "Inter"
+        assert read(output, "matches/2023-0.json", suffix)["match"]["id"] == "2023-0"
+    mtimes = {path: os.stat(os.path.join(output, path + ".br")).st_mtime_ns for path in manifest}
+
+    store.save_archive_section(COMPLETED_ID, RESULTS, results(COMPLETED_ID, home_score=0))
+    publish.main(argv)
+
+    changed = [path for path in manifest if os.stat(os.path.join(output, path + ".br")).st_mtime_ns != mtimes[path]]
+    assert sorted(changed) == [results_path, standings_path]
+    assert read(output, standings_path, ".gz")["standings"][0]["team"] == "Milan"
@@ -0,0 +1,94 @@
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+from app.replay import replay
+from app.services.recorder import RecordingStore, RecordingNotFound, recordings, CAPTURE_RECORD, CAPTURE_REPLAY
+from app.services.scraper.country_scraper import CountryScraper
+from app.services.scraper.session import NavigationSession
+from config import URL_LIVESPORT
+
+HOME_HTML = """
+<html><body>
+  <nav><div><div><a href="/football/">Football</a></div></div></nav>
+  <div id="menu">
+    <span class="lmc__itemMore">More</span>
+    <div class="lmc__block "><a href="/football/italy/"><span>Italy</span></a></div>
+    <div class="lmc__block "><a href="/football/spain/"><span>Spain</span></a></div>
+  </div>
+</body></html>
+"""
+
+
+class RecordingDriver:
+    pages = {URL_LIVESPORT: HOME_HTML, "https://www.livescore.in/football/italy/": "<html><body>Italy</body></html>"}
+
+    def __init__(self, **options):
+        self.current_url = None
+
+    def get(self, url):
+        self.current_url = url
+
+    @property
+    def page_source(self):
+        return self.pages[self.current_url]
+
+    def get_log(self, name):
+        return []
+
+    def quit(self):
+        pass
+
+
+@pytest.fixture
+def recordings_dir(tmp_path):
+    with patch.object(recordings, "root", str(tmp_path)):
+        yield tmp_path
+
+
+def test_pages_are_recorded_when_left(recordings_dir):
+    """
+    Test that capture mode records each page, compressed and keyed by URL, when the session leaves it.
+    """
+    with patch("app.services.scraper.session.get_driver", RecordingDriver):
+        session = NavigationSession(mode=CAPTURE_RECORD)
+        session.navigate(URL_LIVESPORT)
+        session.navigate("https://www.livescore.in/football/italy/")
+        session.close()
+
+    assert len(recordings.captures(URL_LIVESPORT)) == 1
+    recording = recordings.load("https://www.livescore.in/football/italy/")
+    assert recording["page_source"] == RecordingDriver.pages["https://www.livescore.in/football/italy/"]
+    assert recording["responses"] == []
+
+
+def test_scrapers_run_from_recordings(recordings_dir):
+    """
+    Test that a scraper runs entirely from recordings in replay mode, without a browser.
+    """
+    recordings.save(URL_LIVESPORT, URL_LIVESPORT, HOME_HTML, [], captured_at=datetime(2024, 5, 1))
+
+    with patch("app.services.scraper.session.get_driver", side_effect=AssertionError("browser started")):
+        countries = CountryScraper(session=NavigationSession(mode=CAPTURE_REPLAY)).scrape_countries()
+        assert [(country.name, country.url) for country in countries] == [
+            ("Italy", "https://www.livescore.in/football/italy/"),
+            ("Spain", "https://www.livescore.in/football/spain/"),
+        ]
+
+        result, durations = replay("countries", "", repeat=3)
+        assert len(result) == 2 and len(durations) == 3
+
+        with pytest.raises(RecordingNotFound):
+            replay("countries", "", at=datetime(2024, 4, 1))
+
+
+def test_latest_capture_before_replay_time_is_used(tmp_path):
+    """
+    Test that replaying at a given time picks the latest capture taken no later than that time.
+    """
+    store = RecordingStore(str(tmp_path))
+    store.save("https://a", "https://a", "old", [], captured_at=datetime(2024, 1, 1))
+    store.save("https://a", "https://a", "new", [], captured_at=datetime(2024, 3, 1))
+
+    assert store.load("https://a")["page_source"] == "new"
+    assert store.load("https://a", at=datetime(2024, 2, 1))["page_source"] == "old"
+    assert store.load("https://a", at=datetime(2023, 12, 1)) is None
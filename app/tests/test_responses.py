@@ -0,0 +1,68 @@
+import gzip
+import brotli
+import msgpack
+from datetime import datetime
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.middleware.compression import CompressionMiddleware, select_encoding
+from app.middleware.negotiation import ContentNegotiationMiddleware, NegotiatedResponse
+from app.services.models.archive_schemas import Match, MatchListResponse
+
+app = FastAPI(default_response_class=NegotiatedResponse)
+app.add_middleware(ContentNegotiationMiddleware)
+app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+MATCHES = [
+    Match(id=f"m{i}", archive="Italy-Serie A-2023_2024", url=f"https://www.livescore.in/match/m{i}/",
+          match_date=datetime(2024, 5, 26, 20, 45), round=38, home="Inter", away="Verona",
+          home_score=2, away_score=1)
+    for i in range(50)
+]
+
+@app.get("/results", response_model=MatchListResponse)
+def results(size: int = 50) -> MatchListResponse:
+    return MatchListResponse(matches=MATCHES[:size])
+
+client = TestClient(app)
+
+def test_json_is_default():
+    """
+    Test that JSON is served when the client does not ask for msgpack.
+    """
+    response = client.get("/results", headers={"Accept-Encoding": "identity"})
+    assert response.headers["content-type"] == "application/json"
+    assert "content-encoding" not in response.headers
+    assert len(response.json()["matches"]) == 50
+
+def test_msgpack_negotiation():
+    """
+    Test that msgpack is served when the client prefers it, with the same shape as the JSON payload.
+    """
+    response = client.get("/results", headers={"Accept": "application/msgpack", "Accept-Encoding": "identity"})
+    assert response.headers["content-type"] == "application/msgpack"
+    assert "Accept" in response.headers["vary"]
+    data = msgpack.unpackb(response.content)
+    assert data == client.get("/results").json()
+
+def test_compression_above_threshold():
+    """
+    Test that large payloads are compressed with the preferred encoding and small ones are left alone.
+    """
+    response = client.get("/results", headers={"Accept-Encoding": "gzip, br"})
+    assert response.headers["content-encoding"] == "br"
+
+    response = client.get("/results", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()["matches"]) == 50
+
+    response = client.get("/results?size=1", headers={"Accept-Encoding": "gzip, br"})
+    assert "content-encoding" not in response.headers
+
+def test_select_encoding():
+    """
+    Test Accept-Encoding parsing, including q-values.
+    """
+    assert select_encoding("gzip, deflate, br") == "br"
+    assert select_encoding("gzip;q=1.0, br;q=0.5") == "gzip"
+    assert select_encoding("identity") is None
+    assert select_encoding("*") == "br"
@@ -0,0 +1,96 @@
+import pytest
+from unittest.mock import patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.middleware.session import NavigationSessionMiddleware
+from app.services.scraper.archive_scraper import ArchiveScraper
+from app.services.scraper.leagues_scraper import LeagueScraper
+from app.services.scraper.session import NavigationSession, current_session
+from app.tests.factories import FakeDriver
+
+drivers = []
+
+
+def start_driver(**options):
+    driver = FakeDriver(**options)
+    drivers.append(driver)
+    return driver
+
+
+@pytest.fixture(autouse=True)
+def fake_driver():
+    drivers.clear()
+    with patch("app.services.scraper.session.get_driver", start_driver):
+        yield
+
+
+def test_navigate_skips_current_page():
+    """
+    Test that the browser starts lazily and that loading the current page again is skipped.
+    """
+    session = NavigationSession()
+    assert not session.started
+
+    assert session.navigate("https://a")
+    assert not session.navigate("https://a")
+    assert session.navigate("https://b")
+    session.moved()
+    assert session.navigate("https://b")
+
+    assert drivers[0].loaded == ["https://a", "https://b", "https://b"]
+    assert (session.page_loads, session.memo_hits) == (4, 1)
+
+    session.close()
+    assert drivers[0].quit_called
+
+
+def test_nested_scrapers_share_session():
+    """
+    Test that a scraper shares its session with nested scrapers and only an owned session is closed.
+    """
+    archive_scraper = ArchiveScraper()
+    calls = []
+
+    def read_league_archives(self, league_id):
+        calls.append(league_id)
+        assert self.session is archive_scraper.session
+        return []
+
+    with patch.object(LeagueScraper, "read_league_archives", read_league_archives):
+        assert archive_scraper.scrape_archive("italy-serie-a-2023_2024") is None
+        assert archive_scraper.scrape_archive("italy-serie-a-2023_2024") is None
+    assert calls == ["italy-serie-a"]
+    assert archive_scraper.session.memo_hits == 1
+
+    token = current_session.set(archive_scraper.session)
+    try:
+        shared_scraper = LeagueScraper()
+        shared_scraper.get_page("https://a")
+        shared_scraper.close()
+    finally:
+        current_session.reset(token)
+    assert not drivers[0].quit_called
+
+    archive_scraper.close()
+    assert drivers[0].quit_called
+
+
+def test_middleware_opens_one_session_per_request():
+    """
+    Test that the scrapers of a request share one browser, closed after the response, with its page loads reported.
+    """
+    app = FastAPI()
+    app.add_middleware(NavigationSessionMiddleware)
+
+    @app.get("/pages")
+    def pages():
+        for url in ["https://a", "https://a", "https://b"]:
+            LeagueScraper().get_page(url)
+        return {}
+
+    client = TestClient(app)
+    response = client.get("/pages")
+    assert response.headers["X-Page-Loads"] == "2"
+    assert len(drivers) == 1
+    assert drivers[0].loaded == ["https://a", "https://b"]
+    assert drivers[0].quit_called
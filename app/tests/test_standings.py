@@ -0,0 +1,81 @@
+import time
+import pytest
+from datetime import date
+from fastapi.testclient import TestClient
+from unittest.mock import patch
+from app.routers.archive import router
+from app.services.models.archive_schemas import Rank
+from app.services.standings import ResultColumns, compute_standings, compare_standings
+from app.tests.factories import ARCHIVE_ID, make_match
+
+
+RESULTS = [
+    make_match(1, "Inter", "Milan", 2, 1),
+    make_match(1, "Juventus", "Roma", 0, 0),
+    make_match(2, "Milan", "Juventus", 3, 0),
+    make_match(2, "Roma", "Inter", 1, 1),
+    make_match(3, "Inter", "Juventus", 0, 1),
+    make_match(3, "Milan", "Roma", 2, 2),
+]
+
+client = TestClient(router)
+
+@pytest.fixture
+def mock_results():
+    with patch("app.routers.archive.get_result_columns", lambda archive_id: ResultColumns(RESULTS)):
+        yield
+
+def test_compute_standings():
+    """
+    Test points, goals and ordering of the derived standings.
+    """
+    standings = compute_standings(ResultColumns(RESULTS))
+    # Milan, Inter and Juventus all have 4 points and are separated by goal difference
+    assert [rank.team for rank in standings] == ["Milan", "Inter", "Juventus", "Roma"]
+    inter = standings[1]
+    assert (inter.matches_played, inter.wins, inter.draws, inter.losses) == (3, 1, 1, 1)
+    assert (inter.goals_scored, inter.goals_conceded, inter.points) == (3, 3, 4)
+    assert standings[0].points == 4 and standings[0].goals_scored == 6
+
+def test_compute_standings_as_of():
+    """
+    Test historical tables by round and by date, including teams that have not played yet.
+    """
+    after_first_round = compute_standings(ResultColumns(RESULTS), as_of_round=1)
+    assert [(rank.team, rank.points) for rank in after_first_round] == \
+        [("Inter", 3), ("Juventus", 1), ("Roma", 1), ("Milan", 0)]
+    assert compute_standings(ResultColumns(RESULTS), as_of_date=date(2023, 8, 27)) == \
+        compute_standings(ResultColumns(RESULTS), as_of_round=2)
+    assert all(rank.matches_played == 0 for rank in compute_standings(ResultColumns(RESULTS), as_of_date=date(2023, 1, 1)))
+
+def test_compare_standings():
+    """
+    Test that differences with the scraped table are reported.
+    """
+    derived = compute_standings(ResultColumns(RESULTS))
+    scraped = [rank.model_copy() for rank in derived]
+    assert compare_standings(derived, scraped) == []
+    scraped[3] = scraped[3].model_copy(update={"points": 1})
+    assert compare_standings(derived, scraped) == ["Roma: points 3 (derived) != 1 (scraped)"]
+
+def test_compute_standings_full_season_speed():
+    """
+    Test that a 380-match season is aggregated in milliseconds.
+    """
+    teams = [f"Team {i}" for i in range(20)]
+    season = [make_match(i // 10 + 1, teams[i % 20], teams[(i * 7 + 3) % 20], i % 4, i % 3) for i in range(380)]
+    columns = ResultColumns(season)
+    start = time.perf_counter()
+    standings = compute_standings(columns, as_of_round=20)
+    assert time.perf_counter() - start < 0.05
+    assert len(standings) == 20
+
+def test_get_standings(mock_results):
+    """
+    Test the /archives/{archiveId}/standings endpoint with a historical round.
+    """
+    response = client.get(f"/{ARCHIVE_ID}/standings?as_of_round=1")
+    assert response.status_code == 200, "Expected status code 200"
+    data = response.json()
+    assert data["standings"][0]["team"] == "Inter"
+    assert data["discrepancies"] is None
@@ -0,0 +1,144 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.routers.team import router
+from app.services.store import LocalStore, FIXTURES, RESULTS
+from app.services.team_index import TeamIndex, normalize_team
+from app.tests.factories import make_match
+
+START = datetime(2024, 9, 1, 20, 45)
+SERIE_A = "Italy-Serie A-2024_2025"
+CHAMPIONS = "Europe-Champions League-2024_2025"
+BUNDESLIGA = "Germany-Bundesliga-2024_2025"
+
+
+def day(days: int) -> datetime:
+    return START + timedelta(days=days)
+
+
+def build_store(root) -> LocalStore:
+    store = LocalStore(str(root))
+    store.save_archive_section(SERIE_A, RESULTS, [
+        make_match(1, "Inter", "AC Milan", 2, 1, match_id="r1", archive=SERIE_A, match_date=day(0)),
+        make_match(1, "Juventus", "Inter", 1, 1, match_id="r2", archive=SERIE_A, match_date=day(7)),
+        make_match(1, "Milan", "Inter", 2, 0, match_id="r3", archive=SERIE_A, match_date=day(14)),
+        make_match(1, "Monza", "Milan", 0, 0, match_id="r4", archive=SERIE_A, match_date=day(21)),
+    ])
+    store.save_archive_section(SERIE_A, FIXTURES, [
+        make_match(1, "Inter", "Napoli", match_id="f1", archive=SERIE_A, match_date=day(30)),
+    ])
+    store.save_archive_section(CHAMPIONS, RESULTS, [
+        make_match(1, "Inter (Ita)", "Bayern München (Ger)", 1, 0, match_id="c1", archive=CHAMPIONS, match_date=day(3)),
+    ])
+    store.save_archive_section(BUNDESLIGA, RESULTS, [
+        make_match(1, "Bayern Munich", "Dortmund", 4, 2, match_id="b1", archive=BUNDESLIGA, match_date=day(5)),
+    ])
+    return store
+
+
+def test_normalize_team():
+    """
+    Test that accents, case, country qualifiers and club affixes are dropped.
+    """
+    assert normalize_team("Inter (Ita)") == "inter"
+    assert normalize_team("AC Milan") == "milan"
+    assert normalize_team("Atlético Madrid") == "atletico madrid"
+    assert normalize_team("FC") == "fc"
+
+
+def test_names_are_merged_across_archives_only(tmp_path):
+    """
+    Test that similar names of different archives are merged at build time, but names sharing an archive are not.
+    """
+    index = TeamIndex(build_store(tmp_path))
+    index.refresh()
+
+    inter = index.lookup("Inter")
+    assert index.lookup("Inter (Ita)") == inter
+    assert index.team_aliases(inter) == ["Inter", "Inter (Ita)"]
+    assert index.lookup("AC Milan") == index.lookup("Milan") != inter
+    bayern = index.lookup("Bayern Munich")
+    assert index.team_aliases(bayern) == ["Bayern Munich", "Bayern München (Ger)"]
+    assert [m.id for m in index.matches_of(bayern)] == ["c1", "b1"]
+    assert index.lookup("Roma") is None
+
+    assert [m.id for m in index.matches_of(inter)] == ["r1", "c1", "r2", "r3", "f1"]
+    assert [m.id for m in index.matches_of(inter, played=False)] == ["f1"]
+    assert [m.id for m in index.head_to_head(inter, index.lookup("Milan"))] == ["r3", "r1"]
+
+    # Even when any two names count as similar, teams of a same archive stay apart
+    index = TeamIndex(build_store(tmp_path), threshold=0)
+    index.refresh()
+    assert index.lookup("Monza") != index.lookup("Milan")
+
+
+def test_changed_archives_are_reindexed(tmp_path):
+    """
+    Test that a fixture turned into a result is reindexed when the stored sections change.
+    """
+    store = build_store(tmp_path)
+    index = TeamIndex(store)
+    index.refresh()
+    inter = index.lookup("Inter")
+
+    store.save_archive_section(SERIE_A, FIXTURES, [])
+    store.save_archive_section(SERIE_A, RESULTS, [
+        make_match(1, "Inter", "Napoli", 3, 0, match_id="f1", archive=SERIE_A, match_date=day(30)),
+    ])
+    with patch.object(index, "_add_archive", wraps=index._add_archive) as add_archive:
+        index.refresh()
+    add_archive.assert_called_once()
+    assert add_archive.call_args.args[0] == SERIE_A
+    assert [m.id for m in index.matches_of(inter, played=True)] == ["c1", "f1"]
+
+
+def test_index_is_refreshed_on_writes_or_after_the_interval(tmp_path):
+    """
+    Test that queries only look at the store after a write through it, or once the refresh interval elapsed.
+    """
+    now = [0.0]
+    store = build_store(tmp_path)
+    index = TeamIndex(store, refresh_interval=60, clock=lambda: now[0])
+    index.refresh_if_stale()
+
+    with patch.object(store, "list_archives", wraps=store.list_archives) as list_archives:
+        index.refresh_if_stale()
+        list_archives.assert_not_called()
+
+        store.save_archive_section(SERIE_A, FIXTURES, [
+            make_match(1, "Roma", "Inter", match_id="f2", archive=SERIE_A, match_date=day(31)),
+        ])
+        index.refresh_if_stale()
+        assert list_archives.call_count == 1
+        assert index.lookup("Roma") is not None
+
+        # Written by another process, so only seen once the interval elapsed
+        LocalStore(str(tmp_path)).save_archive_section(BUNDESLIGA, FIXTURES, [
+            make_match(1, "Mainz", "Dortmund", match_id="b2", archive=BUNDESLIGA, match_date=day(9)),
+        ])
+        index.refresh_if_stale()
+        assert index.lookup("Mainz") is None
+        now[0] = 61
+        index.refresh_if_stale()
+        assert index.lookup("Mainz") is not None
+
+
+def test_team_endpoints(tmp_path):
+    """
+    Test the /teams endpoints, served from the index.
+    """
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+    with patch("app.routers.team.team_index", TeamIndex(build_store(tmp_path))):
+        body = client.get("/Inter (Ita)/matches", params={"status": "played"}).json()
+        assert body["team"] == "Inter"
+        assert body["total_matches"] == 4
+
+        body = client.get("/inter/vs/AC Milan").json()
+        assert [m["id"] for m in body["matches"]] == ["r3", "r1"]
+        assert (body["wins"], body["draws"], body["losses"]) == (1, 0, 1)
+        assert client.get("/Inter/vs/Milan", params={"limit": 1}).json()["losses"] == 1
+
+        assert client.get("/Roma/matches").status_code == 404
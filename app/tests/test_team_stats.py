@@ -0,0 +1,83 @@
+import time
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from unittest.mock import patch
+from app.routers.archive import router
+from app.services.models.match_schemas import Match as MatchDetail
+from app.services.models.stats_schemas import Venue
+from app.services.standings import ResultColumns
+from app.services.team_stats import StatsColumns, season_table, team_stats, find_team
+from app.tests.factories import ARCHIVE_ID, make_match
+
+
+RESULTS = [
+    make_match(1, "Inter", "Milan", 2, 1),
+    make_match(2, "Roma", "Inter", 1, 1),
+    make_match(3, "Inter", "Roma", 0, 1),
+    make_match(3, "Milan", "Roma", 2, 2),
+]
+DETAILS = {
+    "1InterMilan": MatchDetail(id="1InterMilan", expected_goals_xg=(2.1, 0.9), corner_kicks=(6, 3)),
+    "2RomaInter": MatchDetail(id="2RomaInter", expected_goals_xg=(1.2, 1.4), corner_kicks=(4, 5)),
+}
+
+
+def stat(split, name):
+    return next(line for line in split.stats if line.name == name)
+
+client = TestClient(router)
+
+@pytest.fixture
+def mock_stats():
+    with patch("app.routers.archive.get_stats_columns", lambda archive_id: StatsColumns(ResultColumns(RESULTS), DETAILS)):
+        yield
+
+def test_team_stats():
+    """
+    Test totals, averages over matches with known statistics, venue splits and rolling form.
+    """
+    columns = StatsColumns(ResultColumns(RESULTS), DETAILS)
+    inter = team_stats(columns, ARCHIVE_ID, find_team(columns, "inter"), window=2)
+    assert (inter.overall.matches_played, inter.overall.points) == (3, 4)
+    assert (inter.home.matches_played, inter.away.matches_played) == (2, 1)
+    xg = stat(inter.overall, "expected_goals_xg")
+    assert (xg.matches, xg.total_for, xg.total_against, xg.average_for) == (2, 3.5, 2.1, 1.75)
+    assert stat(inter.away, "corner_kicks").total_for == 5
+    assert inter.form.last_results == "DL"
+    assert [point.points for point in inter.form.rolling] == [3.0, 2.0, 0.5]
+    assert inter.form.rolling[-1].expected_goals_for == 1.4
+
+def test_season_table():
+    """
+    Test the season-wide table and its venue restriction.
+    """
+    columns = StatsColumns(ResultColumns(RESULTS), DETAILS)
+    assert columns.matches_with_stats == 2
+    assert [split.team for split in season_table(columns)] == ["Roma", "Inter", "Milan"]
+    assert [split.points for split in season_table(columns, Venue.AWAY)] == [4, 1, 0]
+
+def test_team_stats_full_season_speed():
+    """
+    Test that a 380-match season is aggregated well under 100 ms.
+    """
+    teams = [f"Team {i}" for i in range(20)]
+    season = [make_match(i // 10 + 1, teams[i % 20], teams[(i * 7 + 3) % 20], i % 4, i % 3) for i in range(380)]
+    details = {match.id: MatchDetail(id=match.id, expected_goals_xg=(1.1, 0.7), ball_possession=(55, 45)) for match in season}
+    columns = StatsColumns(ResultColumns(season), details)
+    start = time.perf_counter()
+    season_table(columns)
+    team_stats(columns, ARCHIVE_ID, 0)
+    assert time.perf_counter() - start < 0.1
+
+def test_get_team_stats(mock_stats):
+    """
+    Test the /archives/{archiveId}/teams/{team}/stats endpoint, including an unknown team.
+    """
+    response = client.get(f"/{ARCHIVE_ID}/teams/Milan/stats")
+    assert response.status_code == 200, "Expected status code 200"
+    assert response.json()["team_stats"]["overall"]["matches_played"] == 2
+
+    with pytest.raises(HTTPException) as exc_info:
+        client.get(f"/{ARCHIVE_ID}/teams/Lazio/stats")
+    assert exc_info.value.status_code == 404, "Expected status code 404"
@@ -0,0 +1,60 @@
+"""
+Latency of starting a browser session, with Selenium's default driver discovery versus the cached driver path and
+the shared chromedriver server.
+
+The default layout runs Selenium Manager and starts a chromedriver process for every session; the shared layout
+resolves the driver once and only launches Chrome. Each layout starts and quits `--sessions` sessions one after the
+other, and the first session of the shared layout, which starts the server, is reported separately.
+
+Needs Chrome. Usage:
+    python -m benchmarks.bench_driver_startup [--sessions 10]
+"""
+import argparse
+import statistics
+import time
+from selenium import webdriver
+from app.services import chromedriver
+from app.services.utils import get_driver
+
+
+def default_driver() -> webdriver.Chrome:
+    options = webdriver.ChromeOptions()
+    for argument in ("--no-sandbox", "--headless", "--disable-gpu"):
+        options.add_argument(argument)
+    return webdriver.Chrome(options=options)
+
+
+def time_sessions(factory, sessions: int) -> list[float]:
+    timings = []
+    for _ in range(sessions):
+        started = time.perf_counter()
+        driver = factory()
+        timings.append(time.perf_counter() - started)
+        driver.quit()
+    return timings
+
+
+def report(label: str, timings: list[float]) -> None:
+    print(f"{label:<32}{len(timings):>9}{statistics.mean(timings):>10.3f}{statistics.median(timings):>10.3f}"
+          f"{max(timings):>10.3f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=10, help="Sessions started per layout")
+    args = parser.parse_args()
+
+    header = f"{'layout':<32}{'sessions':>9}{'mean s':>10}{'median s':>10}{'max s':>10}"
+    print(header)
+    print("-" * len(header))
+    report("Selenium Manager + own server", time_sessions(default_driver, args.sessions))
+    try:
+        shared = time_sessions(get_driver, args.sessions + 1)
+        report("first shared session", shared[:1])
+        report("cached path + shared server", shared[1:])
+    finally:
+        chromedriver.server.stop()
+
+
+if __name__ == "__main__":
+    main()
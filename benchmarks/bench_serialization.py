@@ -0,0 +1,65 @@
+"""
+Serialization cost per endpoint.
+
+Compares FastAPI's default path (jsonable_encoder + json.dumps) with the orjson and msgpack renderers used by
+`NegotiatedResponse`, and reports the size of each payload after gzip and brotli compression.
+
+Usage:
+    python -m benchmarks.bench_serialization [--repeat N]
+"""
+import argparse
+import timeit
+import zlib
+import brotli
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from app.middleware.negotiation import NegotiatedResponse, preferred_media_type, MSGPACK_MEDIA_TYPES, \
+    JSON_MEDIA_TYPE
+from benchmarks.fixtures import endpoint_payloads
+from config import COMPRESSION_GZIP_LEVEL, COMPRESSION_BROTLI_QUALITY
+
+
+def default_render(model) -> bytes:
+    return JSONResponse(jsonable_encoder(model)).body
+
+
+def negotiated_render(model, media_type: str) -> bytes:
+    token = preferred_media_type.set(media_type)
+    try:
+        return NegotiatedResponse(model.model_dump(mode="json")).body
+    finally:
+        preferred_media_type.reset(token)
+
+
+def measure(func, repeat: int) -> float:
+    """
+    Returns the best per-call time in microseconds.
+    """
+    return min(timeit.repeat(func, number=repeat, repeat=5)) / repeat * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=200, help="Calls per timing sample")
+    args = parser.parse_args()
+
+    header = f"{'endpoint':<36}{'renderer':<10}{'us/call':>10}{'bytes':>10}{'gzip':>10}{'br':>10}{'gz us':>10}{'br us':>10}"
+    print(header)
+    print("-" * len(header))
+    for endpoint, model in endpoint_payloads().items():
+        renderers = {
+            "default": lambda: default_render(model),
+            "orjson": lambda: negotiated_render(model, JSON_MEDIA_TYPE),
+            "msgpack": lambda: negotiated_render(model, MSGPACK_MEDIA_TYPES[0]),
+        }
+        for name, render in renderers.items():
+            body = render()
+            gzipped = lambda: zlib.compress(body, COMPRESSION_GZIP_LEVEL)
+            brotlied = lambda: brotli.compress(body, quality=COMPRESSION_BROTLI_QUALITY)
+            print(f"{endpoint:<36}{name:<10}{measure(render, args.repeat):>10.1f}{len(body):>10}"
+                  f"{len(gzipped()):>10}{len(brotlied()):>10}"
+                  f"{measure(gzipped, args.repeat):>10.1f}{measure(brotlied, args.repeat):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
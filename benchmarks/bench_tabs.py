@@ -0,0 +1,131 @@
+"""
+Scraping throughput per GB of RAM, one Chrome process per scrape versus tabs multiplexed in shared processes.
+
+Scrapes the same matches with each layout, `--workers` at a time, and samples the memory of every process started
+by the benchmark (Chrome, its helpers and chromedriver). Memory is the proportional set size, so pages shared by
+Chrome's processes are not counted once per process.
+
+Needs Chrome and network access. Usage:
+    python -m benchmarks.bench_tabs MATCH_ID [MATCH_ID ...] [--workers 8] [--processes 2] [--tabs 4]
+"""
+import argparse
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+from app.services.recorder import CAPTURE_OFF
+from app.services.scraper import session as session_module
+from app.services.scraper.browser_pool import BrowserPool
+from app.services.scraper.match_scraper import MatchScraper
+from app.services.scraper.session import NavigationSession
+
+SAMPLE_INTERVAL = 0.5
+
+
+def descendants(pid: int) -> list[int]:
+    children = []
+    try:
+        for task in os.listdir(f"/proc/{pid}/task"):
+            with open(f"/proc/{pid}/task/{task}/children") as file:
+                children.extend(int(child) for child in file.read().split())
+    except OSError:
+        return []
+    return children + [grandchild for child in children for grandchild in descendants(child)]
+
+
+def memory_kb(pid: int) -> int:
+    # Proportional set size where available, resident set size otherwise
+    for path, field in ((f"/proc/{pid}/smaps_rollup", "Pss:"), (f"/proc/{pid}/status", "VmRSS:")):
+        try:
+            with open(path) as file:
+                for line in file:
+                    if line.startswith(field):
+                        return int(line.split()[1])
+        except OSError:
+            continue
+    return 0
+
+
+class MemorySampler(threading.Thread):
+    """
+    Records the peak memory of the benchmark's child processes.
+    """
+    def __init__(self) -> None:
+        super().__init__(daemon=True)
+        self.peak_kb = 0
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self.stopped.wait(SAMPLE_INTERVAL):
+            total = sum(memory_kb(pid) for pid in descendants(os.getpid()))
+            self.peak_kb = max(self.peak_kb, total)
+
+    def stop(self) -> int:
+        self.stopped.set()
+        self.join()
+        return self.peak_kb
+
+
+def scrape_all(match_ids: list[str], workers: int) -> int:
+    local = threading.local()
+    sessions = []
+    scraped = []
+
+    def scrape(match_id: str) -> None:
+        # One session per worker, as in the batch and enrichment endpoints
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = NavigationSession(mode=CAPTURE_OFF)
+            sessions.append(session)
+        try:
+            MatchScraper(session=session).scrape_match(match_id)
+            scraped.append(match_id)
+        except Exception as ex:
+            print(f"  {match_id} failed: {ex}")
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(scrape, match_ids))
+    finally:
+        for session in sessions:
+            session.close()
+    return len(scraped)
+
+
+def run(label: str, match_ids: list[str], workers: int, tabs: int, processes: int) -> None:
+    pool = BrowserPool(processes=processes, tabs=tabs)
+    sampler = MemorySampler()
+    sampler.start()
+    started = time.perf_counter()
+    try:
+        with patch.object(session_module, "TABS_PER_BROWSER", tabs), patch.object(session_module, "browser_pool", pool):
+            scraped = scrape_all(match_ids, workers)
+    finally:
+        pool.close()
+    elapsed = time.perf_counter() - started
+    peak_gb = sampler.stop() / 1024 ** 2
+
+    throughput = scraped / elapsed * 60
+    per_gb = throughput / peak_gb if peak_gb else float("nan")
+    print(f"{label:<28}{scraped:>8}{elapsed:>10.1f}{throughput:>12.1f}{peak_gb:>10.2f}{per_gb:>14.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("match_ids", nargs="+", help="Matches to scrape in each run")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent scrapes")
+    parser.add_argument("--processes", type=int, default=2, help="Chrome processes of the tab layout")
+    parser.add_argument("--tabs", type=int, default=4, help="Tabs per process of the tab layout")
+    args = parser.parse_args()
+
+    header = f"{'layout':<28}{'scraped':>8}{'seconds':>10}{'per min':>12}{'peak GB':>10}{'per min/GB':>14}"
+    print(header)
+    print("-" * len(header))
+    run("process per scrape", args.match_ids, args.workers, tabs=1, processes=args.workers)
+    run(f"{args.processes} processes x {args.tabs} tabs", args.match_ids, args.workers,
+        tabs=args.tabs, processes=args.processes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta
+from app.services.models.archive_schemas import Match, LiveMatch, Rank, MatchListResponse, StandingResponse, \
+    ListLiveMatch
+from app.services.models.match_schemas import Match as MatchDetail, MatchListResponse as MatchDetailListResponse
+
+TEAMS = ["Inter", "Milan", "Juventus", "Atalanta", "Bologna", "Roma", "Lazio", "Fiorentina", "Torino", "Napoli",
+         "Genoa", "Monza", "Verona", "Lecce", "Udinese", "Cagliari", "Empoli", "Frosinone", "Sassuolo", "Salernitana"]
+ARCHIVE_ID = "Italy-Serie A-2023_2024"
+
+
+def season_matches(rounds: int = 38) -> list[Match]:
+    """
+    Builds a synthetic double round-robin season (380 matches for 20 teams and 38 rounds).
+    """
+    matches = []
+    kickoff = datetime(2023, 8, 19, 18, 30)
+    for round_number in range(1, rounds + 1):
+        shift = round_number % len(TEAMS)
+        rotated = TEAMS[shift:] + TEAMS[:shift]
+        for index in range(len(TEAMS) // 2):
+            match_id = f"{round_number:02d}{index:02d}abcd"
+            matches.append(Match(
+                id=match_id,
+                archive=ARCHIVE_ID,
+                url=f"https://www.livescore.in/match/{match_id}/",
+                match_date=kickoff + timedelta(days=7 * (round_number - 1), hours=index),
+                round=round_number,
+                home=rotated[index],
+                away=rotated[-index - 1],
+                home_score=(round_number + index) % 4,
+                away_score=(round_number * index) % 3,
+            ))
+    return matches
+
+
+def match_details(count: int = 50) -> list[MatchDetail]:
+    """
+    Builds synthetic match details with every statistic filled in.
+    """
+    details = []
+    for match in season_matches()[:count]:
+        details.append(MatchDetail(
+            id=match.id, round=match.round, match_date=match.match_date, home=match.home, away=match.away,
+            home_score=match.home_score, away_score=match.away_score,
+            expected_goals_xg=(1.42, 0.87), ball_possession=(58, 42), goal_attempts=(15, 9),
+            shots_on_goal=(6, 3), shots_off_goal=(5, 4), big_chances=(3, 1), corner_kicks=(7, 2),
+            free_kicks=(11, 14), offsides=(2, 1), fouls=(12, 10), yellow_cards=(2, 3), red_cards=(0, 0),
+        ))
+    return details
+
+
+def endpoint_payloads() -> dict[str, object]:
+    """
+    Returns one representative response model per endpoint.
+    """
+    matches = season_matches()
+    return {
+        "GET /archives/{id}/results?page=0": MatchListResponse(matches=matches),
+        "GET /archives/{id}/results?page=1": MatchListResponse(matches=matches[:10]),
+        "GET /archives/{id}/live": ListLiveMatch(matches=[
+            LiveMatch(id=m.id, archive=m.archive, url=m.url, time="67'", home=m.home, away=m.away,
+                      home_score=m.home_score, away_score=m.away_score)
+            for m in matches[:10]
+        ]),
+        "GET /archives/{id}/standings": StandingResponse(standings=[
+            Rank(position=i + 1, team=team, matches_played=38, wins=20 - i, draws=9, losses=9 + i,
+                 goals_scored=70 - i, goals_conceded=30 + i, points=69 - 3 * i)
+            for i, team in enumerate(TEAMS)
+        ]),
+        "POST /matches/batch": MatchDetailListResponse(matches=match_details()),
+    }
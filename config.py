@@ -5,4 +5,44 @@ TIMEOUT=30
 LIMIT=10
 RATE_LIMITING_FREQUENCY="2/1minute"
 RATE_LIMITING_ENABLE=True
-SIMULATE_WAITING_HUMAN_BEING=5
\ No newline at end of file
+SIMULATE_WAITING_HUMAN_BEING=5
+COMPRESSION_MINIMUM_SIZE=1024
+COMPRESSION_GZIP_LEVEL=6
+COMPRESSION_BROTLI_QUALITY=4
+EXPORT_BATCH_SIZE=100
+DATA_DIR="data"
+RESULTS_TTL=600
+STATS_FETCH_WORKERS=4
+CIRCUIT_FAILURE_THRESHOLD=5
+CIRCUIT_RESET_TIMEOUT=60
+SCRAPE_RETRIES=1
+MAX_BROWSERS=4
+ADMISSION_MAX_WAIT=30
+ADMISSION_DEFAULT_LATENCY=15
+CAPTURE_MODE="off"
+RECORDINGS_DIR="data/recordings"
+LOG_FORMAT="json"
+LOG_SAMPLE_RATE=0.01
+LIVE_FEED_TTL=15
+FIXTURES_TTL=3600
+CALENDAR_DEFAULT_HOURS=72
+TEAM_SIMILARITY_THRESHOLD=75
+TEAM_INDEX_REFRESH_INTERVAL=60
+BROWSER_PROCESSES=2
+TABS_PER_BROWSER=1
+EXTRACTION_MODE="dom"
+CHROMEDRIVER_PATH=None
+SHARED_CHROMEDRIVER=True
+PAGE_ARCHIVE_ENABLE=False
+PAGE_ARCHIVE_DIR="data/pages"
+PAGE_ARCHIVE_LEVEL=9
+JOB_WORKERS=2
+JOB_RESULT_TTL=3600
+JOB_WEBHOOK_RETRIES=3
+CLUSTER_NODES=None
+CLUSTER_SELF=None
+CLUSTER_MODE="forward"
+CLUSTER_VIRTUAL_NODES=100
+PUBLISH_DIR="data/static"
+PUBLISH_GZIP_LEVEL=9
+PUBLISH_BROTLI_QUALITY=11
\ No newline at end of file
@@ -1,13 +1,127 @@
+import atexit
+import copy
 import logging
+import random
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from typing import Optional
+import orjson
 import config
 
+TEXT_FORMAT = "%(asctime)s - %(levelname)s - %(request_id)s - %(message)s"
+
+request_id: ContextVar[str] = ContextVar("request_id", default="-")
+
+# Attributes every LogRecord has; anything else was passed through `extra` and is logged as a field
+RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "request_id"}
+
+_listener: Optional[QueueListener] = None
+
+
+class CorrelationFilter(logging.Filter):
+    """
+    Tags records with the ID of the request being served, read on the thread that logs.
+    """
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats records as one JSON object per line, with the fields passed through `extra` as top-level keys.
+    """
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "request_id": getattr(record, "request_id", "-"),
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return orjson.dumps(entry, default=str).decode()
+
+
+class ExceptionQueueHandler(QueueHandler):
+    """
+    Queues records with their message merged and their traceback rendered into `exc_text`, on the calling thread.
+
+    The standard handler folds the traceback into the message and drops `exc_info`, so formatters on the listener
+    side could not report the exception separately.
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = record.exc_text or logging.Formatter().formatException(record.exc_info)
+            # Traceback objects keep whole frames alive and cannot cross process queues
+            record.exc_info = None
+        return record
+
+
+class SampledLogger:
+    """
+    A logger for per-element debug events, which keeps only a fraction of them.
+
+    The level check and the sampling happen before any record is created, so disabled or dropped events cost a
+    comparison and a random draw. Messages use lazy %-style arguments.
+    """
+    def __init__(self, name: str, rate: float = config.LOG_SAMPLE_RATE) -> None:
+        self.logger = logging.getLogger(name)
+        self.rate = rate
+
+    def debug(self, msg: str, *args) -> None:
+        if self.logger.isEnabledFor(logging.DEBUG) and (self.rate >= 1 or random.random() < self.rate):
+            self.logger.debug(msg, *args, stacklevel=2)
+
+
+def _stop_listener() -> None:
+    # Flushes the records still queued
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
 def configure_logging():
     """
     Set up logging configuration defining log format, level, and output.
+
+    Records are handed to a queue and written by a background thread, so logging never blocks on the stream.
+    Each record carries the ID of the request it was emitted for. `LOG_FORMAT` selects JSON lines or plain text.
     """
+    global _listener
+    _stop_listener()
+
+    stream_handler = logging.StreamHandler()
+    if config.LOG_FORMAT == "json":
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(logging.Formatter(TEXT_FORMAT, datefmt="%Y-%m-%d %H:%M:%S"))
+
+    queue = SimpleQueue()
+    # Only the message and traceback are rendered on the calling thread, the listener's formatter does the rest
+    queue_handler = ExceptionQueueHandler(queue)
+    queue_handler.addFilter(CorrelationFilter())
+    _listener = QueueListener(queue, stream_handler)
+    _listener.start()
+
     logging.basicConfig(
         level=logging.DEBUG if config.DEBUG else logging.INFO,
-        format="%(asctime)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-        handlers=[logging.StreamHandler()],
-    )
\ No newline at end of file
+        handlers=[queue_handler],
+        force=True,
+    )